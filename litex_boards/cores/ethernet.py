@@ -0,0 +1,913 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Ethernet helpers shared by the Ethernet targets.
+#
+# 10GBASE-R: LiteEth only provides the raw 64-bit/66-bit UltraScale+ GTY transceiver wrapper
+# (USP_GTY_10G_BASER) for 10G, without PCS. The PCS (IEEE 802.3 Clause 49: 64b/66b encoding,
+# x^58 + x^39 + 1 self-synchronizing scrambler and block lock) is implemented here between the
+# transceiver and LiteEth's 64-bit XGMII TX/RX, allowing add_ethernet/add_etherbone to be used over
+# SFP+/QSFP28 cages.
+#
+# The PCS only sees a 66-bit block (2-bit header/64-bit data) interface:
+# - UltraScale+ GTY (Alveo U250/U280): LiteEth's USP_GTY_10G_BASER, using the GTY's 64b/66b gearbox.
+# - UltraScale GTH (KCU105) / 7-Series GTX (KC705, VC707, STLV7325, XC7K420T): LiteICLink's GTH3/GTX
+#   in raw 40-bit mode (their 8b10b encoding is done in the fabric and bypassed), with 66/40-bit
+#   gearboxes in the fabric (20 blocks every 33 transceiver words at 257.8125MHz) and the PCS in
+#   156.25MHz clock domains generated from the transceiver clocks (same rate, see BaseRBlockCDC).
+# - Artix-7 GTP (Tagus): Not possible, GTPs are limited to 6.6Gbps (10.3125Gbps needed).
+#
+# UDP Streamer: Sends/receives bulk data as UDP packets directly from/to hardware (DRAM DMAs or
+# FIFO), without going through the CPU or Etherbone's register-access protocol.
+#
+# Etherbone Burst: LiteEth's Etherbone buffers records of 16 words and does a Wishbone cycle (and a
+# read/send round-trip) per word. The burst variant buffers records of up to 255 words (the maximum
+# allowed by Etherbone) and issues the accesses of a record back-to-back in a single Wishbone cycle,
+# making block reads/writes (ex: DRAM dumps) 255 words per packet round-trip.
+
+from types import SimpleNamespace
+from functools import reduce
+
+from migen import *
+from migen.genlib.cdc import MultiReg, PulseSynchronizer
+
+from litex.gen import LiteXModule
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+# Constants ----------------------------------------------------------------------------------------
+
+# XGMII control characters.
+XGMII_IDLE  = 0x07
+XGMII_START = 0xfb
+XGMII_TERM  = 0xfd
+XGMII_ERROR = 0xfe
+
+# 10GBASE-R control codes.
+BASER_IDLE  = 0x00
+BASER_ERROR = 0x1e
+
+# Sync headers (bit 0 transmitted first).
+BASER_SYNC_DATA = 0b10
+BASER_SYNC_CTRL = 0b01
+
+# Block types.
+BASER_BLOCK_CTRL   = 0x1e                                           # C0-C7.
+BASER_BLOCK_START0 = 0x78                                           # S0 D1-D7.
+BASER_BLOCK_START4 = 0x33                                           # C0-C3 S4 D5-D7.
+BASER_BLOCK_TERM   = [0x87, 0x99, 0xaa, 0xb4, 0xcc, 0xd2, 0xe1, 0xff] # D0-Dn-1 Tn C(n+1)-C7.
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _lanes(data):
+    return [data[8*i:8*(i + 1)] for i in range(8)]
+
+def _bit_reverse(data):
+    return Cat(*[data[i] for i in reversed(range(len(data)))])
+
+# 10GBASE-R Scrambler ------------------------------------------------------------------------------
+
+class BaseRScrambler(LiteXModule):
+    """x^58 + x^39 + 1 self-synchronizing scrambler (64-bit, bit 0 first)."""
+    def __init__(self):
+        self.i = Signal(64)
+        self.o = Signal(64)
+
+        # # #
+
+        state = Signal(58)
+        bits  = [state[i] for i in range(58)]
+        for i in range(64):
+            bits.append(self.i[i] ^ bits[i + 58 - 39] ^ bits[i])
+        self.sync += [
+            self.o.eq(Cat(*bits[58:])),
+            state.eq(Cat(*bits[-58:])),
+        ]
+
+
+class BaseRDescrambler(LiteXModule):
+    """x^58 + x^39 + 1 self-synchronizing descrambler (64-bit, bit 0 first)."""
+    def __init__(self):
+        self.i = Signal(64)
+        self.o = Signal(64)
+
+        # # #
+
+        state = Signal(58)
+        bits  = [state[i] for i in range(58)] + [self.i[i] for i in range(64)]
+        self.sync += [
+            self.o.eq(Cat(*[bits[i + 58] ^ bits[i + 58 - 39] ^ bits[i] for i in range(64)])),
+            state.eq(self.i[64 - 58:]),
+        ]
+
+# 10GBASE-R PCS TX ---------------------------------------------------------------------------------
+
+class BaseRPCSTX(LiteXModule):
+    """XGMII (64-bit data/8-bit ctl) to 66-bit blocks (2-bit header + 64-bit scrambled payload)."""
+    def __init__(self):
+        self.xgmii_data = Signal(64)
+        self.xgmii_ctl  = Signal(8)
+        self.header     = Signal(2)
+        self.data       = Signal(64)
+
+        # # #
+
+        lanes = _lanes(self.xgmii_data)
+        ctl   = self.xgmii_ctl
+
+        def ctrl_codes(n):
+            # Idle/Error 7-bit control codes of lanes 0 to n-1, invalid characters sent as Error.
+            return Cat(*[Mux(lanes[i] == XGMII_IDLE, C(BASER_IDLE, 7), C(BASER_ERROR, 7)) for i in range(n)])
+
+        def is_ctrl(n):
+            return reduce(lambda a, b: a & b, [(lanes[i] == XGMII_IDLE) | (lanes[i] == XGMII_ERROR) for i in range(n)])
+
+        # Encoder.
+        header  = Signal(2)
+        payload = Signal(64)
+        encoder = If(ctl == 0x00,
+            header.eq(BASER_SYNC_DATA),
+            payload.eq(self.xgmii_data),
+        ).Elif((ctl == 0xff) & is_ctrl(8),
+            header.eq(BASER_SYNC_CTRL),
+            payload.eq(Cat(C(BASER_BLOCK_CTRL, 8), ctrl_codes(8))),
+        ).Elif((ctl == 0x01) & (lanes[0] == XGMII_START),
+            header.eq(BASER_SYNC_CTRL),
+            payload.eq(Cat(C(BASER_BLOCK_START0, 8), self.xgmii_data[8:])),
+        ).Elif((ctl == 0x1f) & (lanes[4] == XGMII_START) & is_ctrl(4),
+            header.eq(BASER_SYNC_CTRL),
+            payload.eq(Cat(C(BASER_BLOCK_START4, 8), ctrl_codes(4), C(0, 4), self.xgmii_data[40:])),
+        )
+        for n in range(8):
+            # Control characters following the Terminate are sent as Idles.
+            encoder = encoder.Elif((ctl == ((0xff << n) & 0xff)) & (lanes[n] == XGMII_TERM),
+                header.eq(BASER_SYNC_CTRL),
+                payload.eq(Cat(C(BASER_BLOCK_TERM[n], 8), *lanes[:n])),
+            )
+        encoder = encoder.Else(
+            header.eq(BASER_SYNC_CTRL),
+            payload.eq(Cat(C(BASER_BLOCK_CTRL, 8), *[C(BASER_ERROR, 7) for i in range(8)])),
+        )
+        self.comb += encoder
+
+        # Scrambler (Header is not scrambled).
+        self.scrambler = scrambler = BaseRScrambler()
+        self.comb += scrambler.i.eq(payload)
+        self.sync += self.header.eq(header)
+        self.comb += self.data.eq(scrambler.o)
+
+# 10GBASE-R PCS RX ---------------------------------------------------------------------------------
+
+class BaseRBlockLock(LiteXModule):
+    """Block lock: Slip until 64 consecutive valid sync headers, unlock on 16 invalid headers in 64."""
+    def __init__(self, slip_wait=64, lock_count=64, window=64, unlock_count=16):
+        self.header = Signal(2)
+        self.slip   = Signal()
+        self.lock   = Signal()
+
+        # # #
+
+        valid = Signal()
+        count = Signal(max=max(lock_count, window) + 1)
+        bad   = Signal(max=unlock_count + 1)
+        wait  = Signal(max=slip_wait + 1)
+        self.comb += valid.eq((self.header == BASER_SYNC_DATA) | (self.header == BASER_SYNC_CTRL))
+        self.sync += [
+            self.slip.eq(0),
+            # Unlocked: Slip on invalid headers (letting the slip settle), lock after lock_count valid ones.
+            If(~self.lock,
+                If(wait != 0,
+                    wait.eq(wait - 1),
+                ).Elif(valid,
+                    count.eq(count + 1),
+                    If(count == (lock_count - 1),
+                        self.lock.eq(1),
+                        count.eq(0),
+                        bad.eq(0),
+                    )
+                ).Else(
+                    count.eq(0),
+                    wait.eq(slip_wait),
+                    self.slip.eq(1),
+                )
+            # Locked: Unlock on unlock_count invalid headers in a window of window headers.
+            ).Else(
+                count.eq(count + 1),
+                If(~valid,
+                    bad.eq(bad + 1),
+                ),
+                If(~valid & (bad == (unlock_count - 1)),
+                    self.lock.eq(0),
+                    count.eq(0),
+                ).Elif(count == (window - 1),
+                    count.eq(0),
+                    bad.eq(0),
+                )
+            )
+        ]
+
+
+class BaseRPCSRX(LiteXModule):
+    """66-bit blocks (2-bit header + 64-bit scrambled payload) to XGMII (64-bit data/8-bit ctl)."""
+    def __init__(self):
+        self.header     = Signal(2)
+        self.data       = Signal(64)
+        self.slip       = Signal()
+        self.block_lock = Signal()
+        self.xgmii_data = Signal(64)
+        self.xgmii_ctl  = Signal(8)
+
+        # # #
+
+        # Block Lock.
+        self.lock_detector = block_lock = BaseRBlockLock()
+        self.comb += [
+            block_lock.header.eq(self.header),
+            self.slip.eq(block_lock.slip),
+            self.block_lock.eq(block_lock.lock),
+        ]
+
+        # Descrambler (Header delayed to match descrambler's latency).
+        self.descrambler = descrambler = BaseRDescrambler()
+        header = Signal(2)
+        lock   = Signal()
+        self.comb += descrambler.i.eq(self.data)
+        self.sync += header.eq(self.header)
+        self.sync += lock.eq(block_lock.lock)
+        payload = descrambler.o
+
+        # Decoder.
+        block_type = payload[:8]
+        data       = Signal(64)
+        ctl        = Signal(8)
+
+        def ctrl_chars(offset, n):
+            # XGMII characters of n 7-bit control codes at offset, unknown codes decoded as Error.
+            codes = [payload[offset + 7*i:offset + 7*(i + 1)] for i in range(n)]
+            return [Mux(code == BASER_IDLE, C(XGMII_IDLE, 8), C(XGMII_ERROR, 8)) for code in codes]
+
+        idles   = [C(XGMII_IDLE,  8)]
+        errors  = [C(XGMII_ERROR, 8)]
+        decoder = If(~lock,
+            data.eq(Cat(*(8*errors))),
+            ctl.eq(0xff),
+        ).Elif(header == BASER_SYNC_DATA,
+            data.eq(payload),
+            ctl.eq(0x00),
+        ).Elif(header != BASER_SYNC_CTRL,
+            data.eq(Cat(*(8*errors))),
+            ctl.eq(0xff),
+        ).Elif(block_type == BASER_BLOCK_CTRL,
+            data.eq(Cat(*ctrl_chars(8, 8))),
+            ctl.eq(0xff),
+        ).Elif(block_type == BASER_BLOCK_START0,
+            data.eq(Cat(C(XGMII_START, 8), payload[8:])),
+            ctl.eq(0x01),
+        ).Elif(block_type == BASER_BLOCK_START4,
+            data.eq(Cat(*ctrl_chars(8, 4), C(XGMII_START, 8), payload[40:])),
+            ctl.eq(0x1f),
+        )
+        for n in range(8):
+            decoder = decoder.Elif(block_type == BASER_BLOCK_TERM[n],
+                data.eq(Cat(*_lanes(payload)[1:n + 1], C(XGMII_TERM, 8), *((7 - n)*idles))),
+                ctl.eq((0xff << n) & 0xff),
+            )
+        decoder = decoder.Else(
+            data.eq(Cat(*(8*errors))),
+            ctl.eq(0xff),
+        )
+        self.comb += decoder
+        self.sync += [
+            self.xgmii_data.eq(data),
+            self.xgmii_ctl.eq(ctl),
+        ]
+
+# USP GTY 10GBASE-R PHY ----------------------------------------------------------------------------
+
+class USP10GBASERPHY(LiteXModule):
+    """10GBASE-R PHY over an UltraScale+ GTY transceiver (lane of SFP+/QSFP28 pads), with LiteEth 64-bit XGMII TX/RX."""
+    dw          = 64
+    tx_clk_freq = 156.25e6
+    rx_clk_freq = 156.25e6
+    def __init__(self, pads, refclk_freq, sys_clk_freq, lane=0, tx_polarity=0, rx_polarity=0):
+        from liteiclink.serdes.gty_ultrascale import GTYQuadPLL
+        from liteeth.phy.usp_gty_10g_baser import USP_GTY_10G_BASER
+        from liteeth.phy.xgmii import LiteEthPHYXGMIITX, LiteEthPHYXGMIIRX
+        self.integrated_ifg_inserter = True
+
+        self._status = CSRStatus(fields=[
+            CSRField("block_lock", size=1, description="10GBASE-R RX Block Lock."),
+        ])
+
+        # # #
+
+        # RefClk / QPLL.
+        refclk = Signal()
+        self.specials += Instance("IBUFDS_GTE4",
+            i_CEB = 0,
+            i_I   = pads.clk_p,
+            i_IB  = pads.clk_n,
+            o_O   = refclk,
+        )
+        self.qpll = GTYQuadPLL(refclk, refclk_freq, 10.3125e9)
+
+        # Lane.
+        data_pads = SimpleNamespace(**{name: getattr(pads, name)[lane] for name in ["txp", "txn", "rxp", "rxn"]})
+
+        # Transceiver (Also used as CRG: Provides eth_tx/eth_rx clock domains).
+        self.crg = serdes = USP_GTY_10G_BASER(self.qpll, data_pads, sys_clk_freq,
+            tx_polarity = tx_polarity,
+            rx_polarity = rx_polarity)
+
+        # PCS (GTY transmits/receives 64b/66b gearbox data MSB first).
+        xgmii = Record([("tx_ctl", 8), ("tx_data", 64), ("rx_ctl", 8), ("rx_data", 64)])
+        self.pcs_tx = pcs_tx = ClockDomainsRenamer("eth_tx")(BaseRPCSTX())
+        self.pcs_rx = pcs_rx = ClockDomainsRenamer("eth_rx")(BaseRPCSRX())
+        self.comb += [
+            pcs_tx.xgmii_data.eq(xgmii.tx_data),
+            pcs_tx.xgmii_ctl.eq(xgmii.tx_ctl),
+            serdes.tx_header.eq(_bit_reverse(pcs_tx.header)),
+            serdes.tx_data.eq(_bit_reverse(pcs_tx.data)),
+            pcs_rx.header.eq(_bit_reverse(serdes.rx_header)),
+            pcs_rx.data.eq(_bit_reverse(serdes.rx_data)),
+            serdes.rx_slip.eq(pcs_rx.slip),
+            xgmii.rx_data.eq(pcs_rx.xgmii_data),
+            xgmii.rx_ctl.eq(pcs_rx.xgmii_ctl),
+        ]
+        self.specials += MultiReg(pcs_rx.block_lock, self._status.fields.block_lock)
+
+        # XGMII TX/RX.
+        self.tx = ClockDomainsRenamer("eth_tx")(LiteEthPHYXGMIITX(xgmii, self.dw))
+        self.rx = ClockDomainsRenamer("eth_rx")(LiteEthPHYXGMIIRX(xgmii, self.dw))
+        self.sink, self.source = self.tx.sink, self.rx.source
+
+# 10GBASE-R Gearboxes ------------------------------------------------------------------------------
+
+class BaseRTXGearbox(LiteXModule):
+    """66-bit blocks (header in LSBs, bit 0 first) to dw-bit transceiver words (bit 0 first).
+
+    A block is consumed (sink.ready) when less than dw bits are buffered (20 blocks every 33 words
+    for dw=40), blocks not available (sink.valid low) are sent as zeros (invalid sync header).
+    """
+    def __init__(self, dw=40):
+        self.sink = sink = stream.Endpoint([("data", 66)])
+        self.data = Signal(dw)
+
+        # # #
+
+        buf   = Signal(66 - 1)
+        level = Signal(max=66)
+        bits  = Signal(dw - 1 + 66)
+        self.comb += [
+            sink.ready.eq(level < dw),
+            If(sink.ready,
+                bits.eq(buf | (Mux(sink.valid, sink.data, 0) << level)),
+            ).Else(
+                bits.eq(buf),
+            )
+        ]
+        self.sync += [
+            self.data.eq(bits[:dw]),
+            buf.eq(bits[dw:]),
+            level.eq(level + Mux(sink.ready, 66, 0) - dw),
+        ]
+
+
+class BaseRRXGearbox(LiteXModule):
+    """dw-bit transceiver words (bit 0 first) to 66-bit blocks (header in LSBs, source.valid on 20
+    cycles out of 33 for dw=40), slip: Drop a received bit, shifting the block alignment by one bit.
+    """
+    def __init__(self, dw=40):
+        self.data   = Signal(dw)
+        self.slip   = Signal()
+        self.source = source = stream.Endpoint([("data", 66)])
+
+        # # #
+
+        buf   = Signal(66 - 1)
+        level = Signal(max=66)
+        bits  = Signal(dw + 66 - 1)
+        count = Signal(max=dw + 66)
+        self.comb += [
+            bits.eq((buf | (self.data << level)) >> self.slip),
+            count.eq(level + dw - self.slip),
+        ]
+        self.sync += [
+            source.valid.eq(count >= 66),
+            source.data.eq(bits[:66]),
+            If(count >= 66,
+                buf.eq(bits[66:]),
+                level.eq(count - 66),
+            ).Else(
+                buf.eq(bits),
+                level.eq(count),
+            )
+        ]
+
+# 10GBASE-R Block CDC ------------------------------------------------------------------------------
+
+class BaseRBlockCDC(LiteXModule):
+    """66-bit blocks from cd_from to cd_to, both clocked from the same source at the same block rate
+    (one of them with gaps: Transceiver side of the gearboxes).
+
+    Blocks are only written once the reader is ready: The FIFO is prefilled with prefill blocks
+    before source.valid is asserted (absorbing the gaps), and drained/restarted on underflow.
+    """
+    def __init__(self, cd_from, cd_to, depth=16, prefill=8, drain_cycles=8):
+        self.sink   = sink   = stream.Endpoint([("data", 66)])
+        self.source = source = stream.Endpoint([("data", 66)])
+
+        # # #
+
+        # FIFO.
+        self.fifo = fifo = ClockDomainsRenamer({"write": cd_from, "read": cd_to})(
+            stream.AsyncFIFO([("data", 66)], depth))
+        enable      = Signal()
+        enable_from = Signal()
+        self.specials += MultiReg(enable, enable_from, cd_from)
+        self.comb += [
+            fifo.sink.valid.eq(sink.valid & enable_from),
+            fifo.sink.data.eq(sink.data),
+            sink.ready.eq(1),
+        ]
+
+        # Control.
+        count = Signal(max=max(prefill, drain_cycles) + 1)
+        self.fsm = fsm = ClockDomainsRenamer(cd_to)(FSM(reset_state="DRAIN"))
+        fsm.act("DRAIN",
+            fifo.source.ready.eq(1),
+            NextValue(count, Mux(fifo.source.valid, 0, count + 1)),
+            If(count == drain_cycles,
+                NextValue(count, 0),
+                NextState("PREFILL")
+            )
+        )
+        fsm.act("PREFILL",
+            enable.eq(1),
+            If(fifo.source.valid,
+                NextValue(count, count + 1),
+            ),
+            If(count == prefill,
+                NextValue(count, 0),
+                NextState("RUN")
+            )
+        )
+        fsm.act("RUN",
+            enable.eq(1),
+            fifo.source.connect(source),
+            If(source.ready & ~fifo.source.valid,
+                NextState("DRAIN")
+            )
+        )
+
+# GTX/GTH 10GBASE-R PHYs ---------------------------------------------------------------------------
+
+class _BaseRSerDesPHY(LiteXModule):
+    """10GBASE-R PHY over a LiteICLink transceiver in raw 40-bit mode, with LiteEth 64-bit XGMII TX/RX.
+
+    Transceiver words are geared to/from 66-bit blocks in the transceiver clock domains
+    (eth_serdes_tx/eth_serdes_rx, 257.8125MHz), the PCS and XGMII TX/RX run in eth_tx/eth_rx
+    (156.25MHz) generated by MMCMs from the transceiver clocks.
+    """
+    dw          = 64
+    linerate    = 10.3125e9
+    tx_clk_freq = linerate/66
+    rx_clk_freq = linerate/66
+
+    def get_refclk(self, refclk_or_clk_pads, ibufds):
+        if isinstance(refclk_or_clk_pads, (Signal, ClockSignal)):
+            return refclk_or_clk_pads
+        refclk = Signal()
+        self.specials += Instance(ibufds,
+            i_CEB = 0,
+            i_I   = refclk_or_clk_pads.p,
+            i_IB  = refclk_or_clk_pads.n,
+            o_O   = refclk,
+        )
+        return refclk
+
+    def add_datapath(self, serdes, serdes_params, mmcm_cls, tx_ports, rx_ports):
+        from liteeth.phy.xgmii import LiteEthPHYXGMIITX, LiteEthPHYXGMIIRX
+        self.integrated_ifg_inserter = True
+
+        self._status = CSRStatus(fields=[
+            CSRField("block_lock", size=1, description="10GBASE-R RX Block Lock."),
+        ])
+
+        # # #
+
+        # Transceiver: Raw 40-bit words (4 10-bit symbols, bits 8/9 of each symbol on separate ports).
+        tx_data = Signal(40)
+        rx_data = Signal(40)
+        for ports, data in [(tx_ports, tx_data), (rx_ports, rx_data)]:
+            serdes_params.update({
+                ports[0] : Cat(*[data[10*i:10*i + 8] for i in range(4)]),
+                ports[1] : Cat(*[data[10*i + 8]      for i in range(4)]),
+                ports[2] : Cat(*[data[10*i + 9]      for i in range(4)]),
+            })
+        self.serdes = ClockDomainsRenamer({"tx": "eth_serdes_tx", "rx": "eth_serdes_rx"})(serdes)
+        self.txoutclk = serdes.txoutclk
+        self.rxoutclk = serdes.rxoutclk
+
+        # Clocking: eth_tx/eth_rx at the block rate, from the transceiver clocks.
+        self.cd_eth_tx = ClockDomain()
+        self.cd_eth_rx = ClockDomain()
+        self.tx_mmcm = tx_mmcm = mmcm_cls(speedgrade=-1)
+        self.rx_mmcm = rx_mmcm = mmcm_cls(speedgrade=-1)
+        for mmcm, cd_serdes, cd in [(tx_mmcm, serdes.cd_tx, self.cd_eth_tx), (rx_mmcm, serdes.cd_rx, self.cd_eth_rx)]:
+            self.comb += mmcm.reset.eq(cd_serdes.rst)
+            mmcm.register_clkin(cd_serdes.clk, self.linerate/40)
+            mmcm.create_clkout(cd, self.linerate/66, margin=0)
+
+        # TX: PCS -> CDC -> Gearbox.
+        xgmii = Record([("tx_ctl", 8), ("tx_data", 64), ("rx_ctl", 8), ("rx_data", 64)])
+        self.pcs_tx     = pcs_tx     = ClockDomainsRenamer("eth_tx")(BaseRPCSTX())
+        self.tx_cdc     = tx_cdc     = BaseRBlockCDC("eth_tx", "eth_serdes_tx")
+        self.tx_gearbox = tx_gearbox = ClockDomainsRenamer("eth_serdes_tx")(BaseRTXGearbox())
+        self.comb += [
+            pcs_tx.xgmii_data.eq(xgmii.tx_data),
+            pcs_tx.xgmii_ctl.eq(xgmii.tx_ctl),
+            tx_cdc.sink.valid.eq(1),
+            tx_cdc.sink.data.eq(Cat(pcs_tx.header, pcs_tx.data)),
+            tx_cdc.source.connect(tx_gearbox.sink),
+            tx_data.eq(tx_gearbox.data),
+        ]
+
+        # RX: Gearbox -> CDC -> PCS (Blocks not available sent as invalid sync headers).
+        self.rx_gearbox = rx_gearbox = ClockDomainsRenamer("eth_serdes_rx")(BaseRRXGearbox())
+        self.rx_cdc     = rx_cdc     = BaseRBlockCDC("eth_serdes_rx", "eth_rx")
+        self.pcs_rx     = pcs_rx     = ClockDomainsRenamer("eth_rx")(BaseRPCSRX())
+        self.rx_slip    = rx_slip    = PulseSynchronizer("eth_rx", "eth_serdes_rx")
+        self.comb += [
+            rx_gearbox.data.eq(rx_data),
+            rx_gearbox.source.connect(rx_cdc.sink),
+            rx_cdc.source.ready.eq(1),
+            pcs_rx.header.eq(Mux(rx_cdc.source.valid, rx_cdc.source.data[:2], 0b00)),
+            pcs_rx.data.eq(rx_cdc.source.data[2:]),
+            rx_slip.i.eq(pcs_rx.slip),
+            rx_gearbox.slip.eq(rx_slip.o),
+            xgmii.rx_data.eq(pcs_rx.xgmii_data),
+            xgmii.rx_ctl.eq(pcs_rx.xgmii_ctl),
+        ]
+        self.specials += MultiReg(pcs_rx.block_lock, self._status.fields.block_lock)
+
+        # XGMII TX/RX.
+        self.tx = ClockDomainsRenamer("eth_tx")(LiteEthPHYXGMIITX(xgmii, self.dw))
+        self.rx = ClockDomainsRenamer("eth_rx")(LiteEthPHYXGMIIRX(xgmii, self.dw))
+        self.sink, self.source = self.tx.sink, self.rx.source
+
+
+class S7GTX10GBASERPHY(_BaseRSerDesPHY):
+    """10GBASE-R PHY over a 7-Series GTX transceiver (SFP+ pads), with LiteEth 64-bit XGMII TX/RX."""
+    def __init__(self, refclk_or_clk_pads, data_pads, sys_clk_freq, refclk_freq=156.25e6, tx_polarity=0, rx_polarity=0):
+        from litex.soc.cores.clock import S7MMCM
+        from liteiclink.serdes.gtx_7series import GTXQuadPLL, GTX
+        self.qpll = GTXQuadPLL(self.get_refclk(refclk_or_clk_pads, "IBUFDS_GTE2"), refclk_freq, self.linerate)
+        serdes = GTX(self.qpll,
+            tx_pads          = SimpleNamespace(p=data_pads.txp, n=data_pads.txn),
+            rx_pads          = SimpleNamespace(p=data_pads.rxp, n=data_pads.rxn),
+            sys_clk_freq     = sys_clk_freq,
+            data_width       = 40,
+            tx_buffer_enable = True,
+            clock_aligner    = False,
+            tx_polarity      = tx_polarity,
+            rx_polarity      = rx_polarity)
+        serdes.gtx_params.update(p_RXCDR_CFG=0x0b000023ff10400020) # > 6.6Gbps CDR settings (UG476).
+        self.add_datapath(serdes, serdes.gtx_params, S7MMCM,
+            tx_ports = ["i_TXDATA", "i_TXCHARDISPVAL", "i_TXCHARDISPMODE"],
+            rx_ports = ["o_RXDATA", "o_RXCHARISK",     "o_RXDISPERR"])
+
+
+class USGTH10GBASERPHY(_BaseRSerDesPHY):
+    """10GBASE-R PHY over an UltraScale GTH transceiver (SFP+ pads), with LiteEth 64-bit XGMII TX/RX."""
+    def __init__(self, refclk_or_clk_pads, data_pads, sys_clk_freq, refclk_freq=156.25e6, tx_polarity=0, rx_polarity=0):
+        from litex.soc.cores.clock import USMMCM
+        from liteiclink.serdes.gth3_ultrascale import GTH3QuadPLL, GTH3
+        self.qpll = GTH3QuadPLL(self.get_refclk(refclk_or_clk_pads, "IBUFDS_GTE3"), refclk_freq, self.linerate)
+        serdes = GTH3(self.qpll,
+            tx_pads          = SimpleNamespace(p=data_pads.txp, n=data_pads.txn),
+            rx_pads          = SimpleNamespace(p=data_pads.rxp, n=data_pads.rxn),
+            sys_clk_freq     = sys_clk_freq,
+            data_width       = 40,
+            tx_buffer_enable = True,
+            clock_aligner    = False,
+            tx_polarity      = tx_polarity,
+            rx_polarity      = rx_polarity)
+        self.add_datapath(serdes, serdes.gth_params, USMMCM,
+            tx_ports = ["i_TXDATA", "i_TXCTRL0", "i_TXCTRL1"],
+            rx_ports = ["o_RXDATA", "o_RXCTRL0", "o_RXCTRL1"])
+
+# UDP/IP Core --------------------------------------------------------------------------------------
+
+def _add_udpip_core(soc, name, phy, phy_cd, mac_address, ip_address, data_width, with_timing_constraints=True, with_ethmac=False):
+    """Add a LiteEthUDPIPCore on phy to the SoC as ethcore_{name} (as LiteX's add_etherbone).
+
+    with_ethmac: Use the hybrid MAC interface, sharing the PHY with a CPU Ethernet MAC (see _add_ethmac).
+    """
+    from liteeth.core import LiteEthUDPIPCore
+    with_sys_datapath = (data_width == 32)
+    ethcore = LiteEthUDPIPCore(
+        phy         = phy,
+        mac_address = mac_address,
+        ip_address  = ip_address,
+        clk_freq    = soc.clk_freq,
+        dw          = data_width,
+        with_sys_datapath = with_sys_datapath,
+        interface   = {True : "hybrid",            False: "crossbar"}[with_ethmac],
+        endianness  = {True : soc.cpu.endianness, False:      "big"}[with_ethmac],
+    )
+    if not with_sys_datapath:
+        # Use PHY's eth_tx/eth_rx clock domains.
+        ethcore = ClockDomainsRenamer({
+            "eth_tx": phy_cd + "_tx",
+            "eth_rx": phy_cd + "_rx",
+            "sys"   : {True: "sys", False: phy_cd + "_rx"}[with_ethmac],
+        })(ethcore)
+    soc.add_module(name=f"ethcore_{name}", module=ethcore)
+    if with_timing_constraints:
+        eth_rx_clk = getattr(phy, "crg", phy).cd_eth_rx.clk
+        eth_tx_clk = getattr(phy, "crg", phy).cd_eth_tx.clk
+        soc.platform.add_period_constraint(eth_rx_clk, 1e9/phy.rx_clk_freq)
+        if eth_rx_clk is not eth_tx_clk:
+            soc.platform.add_period_constraint(eth_tx_clk, 1e9/phy.tx_clk_freq)
+            soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk, eth_rx_clk, eth_tx_clk)
+        else:
+            soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk, eth_rx_clk)
+    return ethcore
+
+def _add_ethmac(soc, ethcore, mac_address, local_ip, remote_ip):
+    """Expose the MAC of a hybrid UDP/IP core to the CPU as ethmac (as LiteX's add_etherbone with_ethmac)."""
+    from litex.soc.integration.soc import SoCRegion, add_ip_address_constants, add_mac_address_constants
+    ethcore.autocsr_exclude = {"mac"}
+    soc.ethmac = ethmac = ethcore.mac
+    rx_region_size = ethmac.rx_slots.constant*ethmac.slot_size.constant
+    tx_region_size = ethmac.tx_slots.constant*ethmac.slot_size.constant
+    soc.bus.add_region("ethmac", SoCRegion(
+        origin = soc.mem_map.get("ethmac", None),
+        size   = rx_region_size + tx_region_size,
+        linker = True,
+        cached = False))
+    origin = soc.bus.regions["ethmac"].origin
+    soc.bus.add_slave(name="ethmac_rx", slave=ethmac.bus_rx, region=SoCRegion(origin=origin, size=rx_region_size, linker=True, cached=False))
+    soc.bus.add_slave(name="ethmac_tx", slave=ethmac.bus_tx, region=SoCRegion(origin=origin + rx_region_size, size=tx_region_size, linker=True, cached=False))
+    if soc.irq.enabled:
+        soc.irq.add("ethmac", use_loc_if_exists=True)
+    soc.add_constant("ETH_PHY_NO_RESET") # Disable reset from BIOS to avoid disabling Hardware Interface.
+    add_ip_address_constants(soc,  "LOCALIP",  local_ip)
+    add_ip_address_constants(soc,  "REMOTEIP", remote_ip)
+    add_mac_address_constants(soc, "MACADDR",  mac_address)
+
+# UDP Streamer -------------------------------------------------------------------------------------
+
+class UDPStreamer(LiteXModule):
+    """Hardware UDP streamer: sink data sent as fixed-size UDP packets to a configurable destination,
+    data of UDP packets received on udp_port presented on source."""
+    def __init__(self, udp_port, dst_ip="192.168.1.100", dst_port=None, data_width=32, packet_words=256, fifo_depth=None):
+        from liteeth.common import eth_udp_user_description, convert_ip
+        fifo_depth = fifo_depth or 2*packet_words
+        self.sink   = sink   = stream.Endpoint([("data", data_width)])
+        self.source = source = stream.Endpoint([("data", data_width)])
+        self.udp_tx = udp_tx = stream.Endpoint(eth_udp_user_description(data_width))
+        self.udp_rx = udp_rx = stream.Endpoint(eth_udp_user_description(data_width))
+
+        self._enable       = CSRStorage(reset=1, description="TX Enable.")
+        self._dst_ip       = CSRStorage(32, reset=convert_ip(dst_ip), description="TX Destination IP Address.")
+        self._dst_port     = CSRStorage(16, reset=dst_port or udp_port, description="TX Destination UDP Port.")
+        self._packet_words = CSRStorage(16, reset=packet_words, description=f"""TX Packet Size (in {data_width}-bit words).\n
+            Data is buffered until a full packet is available: Clamped to the TX FIFO depth ({fifo_depth}),
+            packets are sent at line rate when <= {fifo_depth//2} (next packet buffered while sending).""")
+        self._tx_packets   = CSRStatus(32, description="TX Packets Count.")
+        self._rx_packets   = CSRStatus(32, description="RX Packets Count.")
+
+        # # #
+
+        # Packet length, clamped to the TX FIFO depth (packet never fully buffered otherwise).
+        length = Signal(16)
+        self.comb += length.eq(Mux(self._packet_words.storage > fifo_depth, fifo_depth, self._packet_words.storage))
+
+        # TX: Send packets once fully buffered (Ethernet frames can't be paused once started).
+        self.tx_fifo = tx_fifo = stream.SyncFIFO([("data", data_width)], fifo_depth, buffered=True)
+        self.comb += sink.connect(tx_fifo.sink)
+
+        count = Signal(16)
+        self.tx_fsm = tx_fsm = FSM(reset_state="IDLE")
+        tx_fsm.act("IDLE",
+            NextValue(count, 0),
+            If(self._enable.storage & (length != 0) & (tx_fifo.level >= length),
+                NextState("SEND")
+            )
+        )
+        tx_fsm.act("SEND",
+            udp_tx.valid.eq(1),
+            udp_tx.last.eq(count == (length - 1)),
+            udp_tx.last_be.eq(Mux(udp_tx.last, 1 << (data_width//8 - 1), 0)),
+            udp_tx.src_port.eq(udp_port),
+            udp_tx.dst_port.eq(self._dst_port.storage),
+            udp_tx.ip_address.eq(self._dst_ip.storage),
+            udp_tx.length.eq(length*(data_width//8)),
+            udp_tx.data.eq(tx_fifo.source.data),
+            tx_fifo.source.ready.eq(udp_tx.ready),
+            If(udp_tx.ready,
+                NextValue(count, count + 1),
+                If(udp_tx.last,
+                    NextValue(self._tx_packets.status, self._tx_packets.status + 1),
+                    NextState("IDLE")
+                )
+            )
+        )
+
+        # RX.
+        self.comb += udp_rx.connect(source, keep={"valid", "ready", "last", "data"})
+        self.sync += If(udp_rx.valid & udp_rx.ready & udp_rx.last,
+            self._rx_packets.status.eq(self._rx_packets.status + 1)
+        )
+
+def add_udp_streamer(soc, name="udp_streamer", phy=None, phy_cd="eth",
+    udp_port     = 5678,
+    dst_ip       = "192.168.1.100",
+    dst_port     = None,
+    data_width   = 32,
+    packet_words = 256,
+    mac_address  = 0x10e2d5000000,
+    ip_address   = "192.168.1.50",
+    with_dram    = True):
+    """Add a UDPStreamer to the SoC, fed from/to DRAM (DMAs) when available or in FIFO loopback.
+
+    The UDP/IP core of Etherbone is shared when present, otherwise a UDP/IP core is created on phy.
+    """
+    if hasattr(soc, "ethmac"):
+        raise ValueError("UDP Streamer can't be used with Ethernet (PHY can't be shared with the CPU's Ethernet MAC), use it alone or with Etherbone.")
+
+    # UDP/IP Core.
+    ethcore = getattr(soc, "ethcore_etherbone", None)
+    if ethcore is None:
+        ethcore = _add_udpip_core(soc, name, phy, phy_cd,
+            mac_address = mac_address,
+            ip_address  = ip_address,
+            data_width  = phy.dw)
+
+    # Streamer (UDP port accessed from its own clock domain, running from sys clock).
+    setattr(soc, f"cd_{name}", ClockDomain(name))
+    soc.comb += getattr(soc, f"cd_{name}").clk.eq(ClockSignal("sys"))
+    soc.comb += getattr(soc, f"cd_{name}").rst.eq(ResetSignal("sys"))
+    port     = ethcore.udp.crossbar.get_port(udp_port, dw=data_width, cd=name)
+    streamer = UDPStreamer(udp_port,
+        dst_ip       = dst_ip,
+        dst_port     = dst_port,
+        data_width   = data_width,
+        packet_words = packet_words)
+    soc.add_module(name=name, module=streamer)
+    soc.comb += [
+        streamer.udp_tx.connect(port.sink),
+        port.source.connect(streamer.udp_rx),
+    ]
+
+    # DRAM -> UDP TX / UDP RX -> DRAM (DMAs controlled through their CSRs).
+    if with_dram and hasattr(soc, "sdram"):
+        from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+        dram_reader = LiteDRAMDMAReader(
+            port          = soc.sdram.crossbar.get_port(mode="read", data_width=data_width),
+            fifo_depth    = 16,
+            fifo_buffered = True,
+            with_csr      = True)
+        soc.add_module(name=f"{name}_dram_reader", module=dram_reader)
+        dram_writer = LiteDRAMDMAWriter(
+            port          = soc.sdram.crossbar.get_port(mode="write", data_width=data_width),
+            fifo_depth    = 16,
+            fifo_buffered = True,
+            with_csr      = True)
+        soc.add_module(name=f"{name}_dram_writer", module=dram_writer)
+        soc.comb += [
+            dram_reader.source.connect(streamer.sink),
+            streamer.source.connect(dram_writer.sink),
+        ]
+    # UDP RX -> FIFO -> UDP TX (Loopback).
+    else:
+        soc.comb += streamer.source.connect(streamer.sink)
+    return streamer
+
+# Etherbone Burst ----------------------------------------------------------------------------------
+
+class EtherboneBurstWishboneMaster(LiteXModule):
+    """Etherbone Wishbone master issuing the accesses of a record back-to-back in a single Wishbone
+    cycle, the read data of an access being sent while the next one is issued."""
+    def __init__(self):
+        from liteeth.common import eth_etherbone_mmap_description
+        from litex.soc.interconnect import wishbone
+        self.sink   = sink   = stream.Endpoint(eth_etherbone_mmap_description(32))
+        self.source = source = stream.Endpoint(eth_etherbone_mmap_description(32))
+        self.bus    = bus    = wishbone.Interface()
+
+        # # #
+
+        # Bus is kept (cyc) for the whole record, accesses only wait on the read data to be sent.
+        self.comb += [
+            bus.adr.eq(sink.addr),
+            bus.dat_w.eq(sink.data),
+            bus.sel.eq(sink.be),
+            bus.we.eq(sink.we),
+        ]
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(sink.valid,
+                NextState("ACCESS")
+            )
+        )
+        fsm.act("ACCESS",
+            bus.cyc.eq(1),
+            bus.stb.eq(sink.valid & (sink.we | ~source.valid | source.ready)),
+            If(bus.stb & bus.ack,
+                sink.ready.eq(1),
+                If(sink.last,
+                    NextState("IDLE")
+                )
+            )
+        )
+
+        # Read data (returned as writes to the record's base_addr).
+        self.sync += [
+            If(source.ready,
+                source.valid.eq(0)
+            ),
+            If(bus.stb & bus.ack & ~sink.we,
+                sink.connect(source, keep={"base_addr", "addr", "count", "be", "last", "last_be"}),
+                source.valid.eq(1),
+                source.we.eq(1),
+                source.data.eq(bus.dat_r)
+            )
+        ]
+
+class EtherboneBurst(LiteXModule):
+    """LiteEthEtherbone with EtherboneBurstWishboneMaster."""
+    def __init__(self, udp, udp_port, buffer_depth=255, cd="sys"):
+        from liteeth.frontend.etherbone import LiteEthEtherbonePacket, LiteEthEtherboneProbe, LiteEthEtherboneRecord
+        from litex.soc.interconnect.packet import Arbiter, Dispatcher
+        self.packet = packet = LiteEthEtherbonePacket(udp, udp_port, cd)
+
+        # Probe/Records.
+        self.probe  = probe  = LiteEthEtherboneProbe()
+        self.record = record = LiteEthEtherboneRecord(buffer_depth=buffer_depth)
+        dispatcher = Dispatcher(packet.source, [probe.sink, record.sink])
+        self.comb += dispatcher.sel.eq(~packet.source.pf)
+        arbiter = Arbiter([probe.source, record.source], packet.sink)
+        self.submodules += dispatcher, arbiter
+
+        # Wishbone.
+        self.wishbone = EtherboneBurstWishboneMaster()
+        self.comb += [
+            record.receiver.source.connect(self.wishbone.sink),
+            self.wishbone.source.connect(record.sender.sink)
+        ]
+
+def add_etherbone_burst(soc, name="etherbone", phy=None, phy_cd="eth", data_width=8,
+    mac_address             = 0x10e2d5000000,
+    ip_address              = "192.168.1.50",
+    udp_port                = 1234,
+    buffer_depth            = 255,
+    with_timing_constraints = True,
+    with_ethmac             = False,
+    ethmac_address          = 0x10e2d5000001,
+    ethmac_local_ip         = "192.168.1.51",
+    ethmac_remote_ip        = "192.168.1.100"):
+    """Add an EtherboneBurst to the SoC (drop-in replacement of LiteX's add_etherbone).
+
+    Records of up to buffer_depth (255 max, as allowed by Etherbone and used by LiteX's RemoteClient
+    bursts) words are buffered (instead of 16), allowing a block read of 255 words per round-trip.
+    As with LiteX's add_etherbone, with_ethmac shares the PHY with a CPU Ethernet MAC.
+    """
+    assert data_width in [8, 32, 64]
+    assert buffer_depth <= 255
+    if hasattr(soc, "ethmac"):
+        raise ValueError("Etherbone Burst can't share the PHY with an Ethernet MAC added separately (add_ethernet), use with_ethmac=True instead.")
+    if with_ethmac and ((mac_address == ethmac_address) or (ip_address == ethmac_local_ip)):
+        raise ValueError("Etherbone Burst and Ethernet MAC require different MAC/IP addresses.")
+
+    # UDP/IP Core.
+    ethcore = _add_udpip_core(soc, name, phy, phy_cd,
+        mac_address             = mac_address,
+        ip_address              = ip_address,
+        data_width              = data_width,
+        with_timing_constraints = with_timing_constraints,
+        with_ethmac             = with_ethmac)
+
+    # Etherbone (run from sys clock, in its own clock domain when the UDP/IP core is not).
+    etherbone_cd = "sys"
+    if data_width != 32:
+        etherbone_cd = name
+        setattr(soc, f"cd_{name}", ClockDomain(name))
+        soc.comb += getattr(soc, f"cd_{name}").clk.eq(ClockSignal("sys"))
+        soc.comb += getattr(soc, f"cd_{name}").rst.eq(ResetSignal("sys"))
+    etherbone = EtherboneBurst(ethcore.udp, udp_port, buffer_depth=buffer_depth, cd=etherbone_cd)
+    soc.add_module(name=name, module=etherbone)
+    soc.bus.add_master(name=name, master=etherbone.wishbone.bus)
+
+    # Ethernet MAC (CPU).
+    if with_ethmac:
+        _add_ethmac(soc, ethcore,
+            mac_address = ethmac_address,
+            local_ip    = ethmac_local_ip,
+            remote_ip   = ethmac_remote_ip)
+    return etherbone
@@ -0,0 +1,156 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# HBM2 helpers shared by the HBM2 targets.
+#
+# USPHBM2 extends LiteX's USPHBM2 wrapper: the HBM IP is generated locally from its configuration
+# through the IP cache (see tools/ip_cache.py) instead of requiring a downloaded .xci in ip/hbm.
+#
+# HBM2Interleaver spreads a linear AXI region over several HBM2 ports/pseudo-channels.
+#
+# add_hbm2_slaves() connects the HBM2 ports to the SoC bus as main RAM, through AXI-Lite (single-beat
+# accesses) or as full AXI. Full AXI only preserves bursts with an AXI main bus (--bus-standard=axi):
+# with Wishbone/AXI-Lite main buses, accesses are still converted to single-beat transactions by the
+# SoC. DMA masters should use the free HBM2 ports directly.
+
+from migen import *
+
+from litex.gen import LiteXModule
+
+from litex.soc.interconnect.axi import AXIInterface, AXILiteInterface, AXILite2AXI, AXICrossbar
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2 as _USPHBM2
+
+from litex_boards.tools.ip_cache import add_vivado_ip
+
+# HBM2 IP Configuration ----------------------------------------------------------------------------
+
+def usp_hbm2_ip_config(axi_clk_freq, density="8GB", stacks=2, ref_clk_freq=100e6, apb_clk_freq=100e6, hbm_clk_freq=900e6):
+    """Return the configuration of the HBM IP matching the USPHBM2 wrapper (all 32 AXI ports enabled)."""
+    config = {
+        "USER_HBM_DENSITY"    : density,
+        "USER_HBM_STACK"      : stacks,
+        "USER_AUTO_POPULATE"  : "yes",
+        "USER_XSDB_INTF_EN"   : "FALSE",
+        "USER_AXI_CLK_FREQ"   : int(axi_clk_freq/1e6),
+        "USER_CLK_SEL_LIST0"  : "AXI_00_ACLK",
+        "USER_CLK_SEL_LIST1"  : "AXI_16_ACLK",
+    }
+    for s in range(stacks):
+        config.update({
+            f"USER_SWITCH_ENABLE_{s:02d}" : "TRUE",
+            f"USER_HBM_REF_CLK_{s}"       : int(ref_clk_freq/1e6),
+            f"USER_APB_PCLK_{s}"          : int(apb_clk_freq/1e6),
+            f"USER_HBM_TCK_{s}"           : int(hbm_clk_freq/1e6),
+        })
+    for i in range(8*stacks):
+        config[f"USER_MC_ENABLE_{i:02d}"] = "TRUE"
+    for i in range(16*stacks):
+        config[f"USER_SAXI_{i:02d}"] = "true"
+    return config
+
+# HBM2 ---------------------------------------------------------------------------------------------
+
+class USPHBM2(_USPHBM2):
+    def __init__(self, platform, ip_config, hbm_ip_name="hbm_0"):
+        _USPHBM2.__init__(self, platform, hbm_ip_name=hbm_ip_name)
+        self.ip_config = ip_config
+
+    def add_sources(self, platform):
+        add_vivado_ip(platform, name=self.hbm_name, ip="hbm", config=self.ip_config)
+
+# HBM2 Interleaver ---------------------------------------------------------------------------------
+
+# Spreads a linear AXI region over the HBM2 ports every granularity bytes: address bits selecting
+# the port are moved to the pseudo-channel selection bits of the HBM2 (28+). Granularity is >= 4KB
+# since AXI bursts can't cross 4KB boundaries and are then never split between two ports.
+
+class HBM2Interleaver(LiteXModule):
+    def __init__(self, ports, size, granularity=4096, data_width=256, address_width=33, id_width=6):
+        assert granularity >= 4096
+        nports = len(ports)
+        k = log2_int(nports)
+        g = log2_int(granularity)
+        w = log2_int(size)
+        assert (w - k) <= 28 # 256MB per port.
+        self.axi = axi = AXIInterface(data_width=data_width, address_width=address_width, id_width=id_width)
+
+        # # #
+
+        def interleave(addr):
+            fields = [addr[:g], addr[g+k:w], Replicate(0, 28 - (w - k)), addr[g:g+k]]
+            return Cat(*[f for f in fields if len(f)])
+
+        if nports == 1:
+            interleaved = ports[0]
+        else:
+            # Crossbar decoders get word addresses.
+            s = 28 - log2_int(data_width//8)
+            interleaved = AXIInterface(data_width=data_width, address_width=address_width, id_width=id_width)
+            self.crossbar = AXICrossbar(
+                masters = [interleaved],
+                slaves  = [(lambda a, n=n: a[s:s+k] == n, port) for n, port in enumerate(ports)])
+        self.comb += [
+            axi.aw.connect(interleaved.aw, omit={"addr"}),
+            interleaved.aw.addr.eq(interleave(axi.aw.addr)),
+            axi.w.connect(interleaved.w),
+            interleaved.b.connect(axi.b),
+            axi.ar.connect(interleaved.ar, omit={"addr"}),
+            interleaved.ar.addr.eq(interleave(axi.ar.addr)),
+            interleaved.r.connect(axi.r),
+        ]
+
+# Check HBM2 Arguments ----------------------------------------------------------------------------
+
+def check_hbm2_ports(parser, nports, interleave):
+    """Check HBM2 ports/interleaving arguments of a target (parser error when not supported)."""
+    if interleave and ((interleave & (interleave - 1)) or (interleave < 4096)):
+        parser.error(f"--hbm-interleave must be a power of 2 >= 4096 (got {interleave}).")
+    if (nports > 4) and not interleave:
+        parser.error(f"--hbm-ports={nports} requires --hbm-interleave (4 ports max in separate 256MB regions).")
+
+# Add HBM2 Slaves ----------------------------------------------------------------------------------
+
+def add_hbm2_slaves(soc, axi, nports=4, interleave=0, axi_full=False, origin=0x4000_0000):
+    """Connect the first nports HBM2 AXI ports to the SoC bus and link them as main RAM.
+
+    interleave : Interleave the ports every N bytes in a single region (0: One 256MB region per port).
+    axi_full   : Connect the ports as full AXI (Burst-capable, requires an AXI main bus) instead of
+                 AXI-Lite.
+
+    The remaining ports (axi[nports:]) are left free for DMA masters. Returns the main RAM size.
+    """
+    if axi_full and (soc.bus.standard != "axi"):
+        raise ValueError(f"Full AXI HBM2 attachment requires an AXI main bus (got {soc.bus.standard}, bursts would be lost).")
+
+    def hbm_slave(axi_hbm):
+        # Full AXI: Burst-capable, adapted by the SoC when required.
+        if axi_full:
+            return axi_hbm
+        # AXI-Lite: Single-beat accesses.
+        else:
+            axi_lite_hbm = AXILiteInterface(data_width=len(axi_hbm.r.data), address_width=len(axi_hbm.ar.addr))
+            soc.submodules += AXILite2AXI(axi_lite_hbm, axi_hbm)
+            return axi_lite_hbm
+
+    # Interleaved: Ports behind a single linear region, spread every interleave bytes.
+    if interleave:
+        size = min(nports*0x1000_0000, 0x4000_0000) # Window limited to 1GB on 32-bit SoC bus.
+        soc.hbm_interleaver = HBM2Interleaver(axi[:nports],
+            size        = size,
+            granularity = interleave)
+        soc.bus.add_slave("hbm", hbm_slave(soc.hbm_interleaver.axi), SoCRegion(origin=origin, size=size))
+
+    # Separate: One 256MB region per port.
+    else:
+        if nports > 4:
+            raise ValueError(f"{nports} HBM2 ports require interleaving (4 max in separate 256MB regions, below IO region).")
+        size = 0x1000_0000
+        for i in range(nports):
+            soc.bus.add_slave(f"hbm{i}", hbm_slave(axi[i]), SoCRegion(origin=origin + 0x1000_0000*i, size=0x1000_0000)) # 256MB.
+
+    # Link HBM2 channel 0 (or interleaved region) as main RAM.
+    soc.bus.add_region("main_ram", SoCRegion(origin=origin, size=size, linker=True))
+    return size
@@ -0,0 +1,197 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# PCIe helpers shared by the PCIe targets.
+#
+# add_pcie() extends SoC.add_pcie with:
+# - MSI-X: One vector per DMA channel and direction (instead of a single MSI vector shared by all
+#   the IRQs), the MSI-X Table/PBA being placed in BAR0 at the location of their CSRs.
+# - IRQs coalescing: DMA IRQs are only forwarded to the host every N events or when an event has
+#   been pending for more than a timeout (thresholds are configurable at runtime through CSRs).
+#
+# add_pcie_dram_dma() connects the PCIe DMAs directly to DRAM through native LiteDRAM ports (not
+# going through the main bus): DRAM reader -> PCIe DMA writer and PCIe DMA reader -> DRAM writer.
+
+from migen import *
+
+from litex.gen import LiteXModule
+
+from litex.soc.interconnect.csr import *
+
+# IRQ Coalescer ------------------------------------------------------------------------------------
+
+class LitePCIeIRQCoalescer(LiteXModule):
+    def __init__(self, n, count_width=8, timeout_width=32, default_count=1, default_timeout=0):
+        self.irqs_in  = Signal(n) # IRQ events (from DMAs).
+        self.irqs_out = Signal(n) # Coalesced IRQs (to MSI/MSI-X).
+
+        self.count = CSRStorage(count_width, reset=default_count, description="""IRQ Count Threshold.\n
+            Forward an IRQ every ``count`` events (``0``/``1``: Forward all events).""")
+        self.timeout = CSRStorage(timeout_width, reset=default_timeout, description="""IRQ Timeout Threshold.\n
+            Forward an IRQ when an event has been pending for ``timeout`` sys clock cycles (``0``: Disabled).""")
+
+        # # #
+
+        for i in range(n):
+            events = Signal(count_width)
+            timer  = Signal(timeout_width)
+            fire   = Signal()
+
+            # Fire when count threshold is reached or when oldest pending event times out.
+            self.comb += [
+                If(self.irqs_in[i] & ((events + 1) >= self.count.storage),
+                    fire.eq(1)
+                ),
+                If((events != 0) & (self.timeout.storage != 0) & (timer >= self.timeout.storage),
+                    fire.eq(1)
+                ),
+            ]
+            self.sync += [
+                self.irqs_out[i].eq(fire),
+                If(fire,
+                    events.eq(0),
+                    timer.eq(0),
+                ).Else(
+                    If(self.irqs_in[i],
+                        events.eq(events + 1)
+                    ),
+                    If((events != 0) | self.irqs_in[i],
+                        timer.eq(timer + 1)
+                    )
+                )
+            ]
+
+# MSI-X PHY Configuration --------------------------------------------------------------------------
+
+def _configure_phy_msix(soc, name, phy, width):
+    from litepcie.phy.s7pciephy import S7PCIEPHY
+    from litepcie.phy.usppciephy import USPPCIEPHY
+
+    # Reserve MSI-X CSRs locations now to get the Table/PBA offsets in BAR0 (BAR0 is mapped on the
+    # CSR region by the PCIe Wishbone Master); the PBA is at offset 8 of the MSI-X CSRs.
+    soc.csr.add(f"{name}_msi",       use_loc_if_exists=True)
+    soc.csr.add(f"{name}_msi_table", use_loc_if_exists=True)
+    table_offset = soc.csr.paging*soc.csr.locs[f"{name}_msi_table"]
+    pba_offset   = soc.csr.paging*soc.csr.locs[f"{name}_msi"] + 8
+    assert table_offset + 16*width <= phy.bar0_size
+    assert pba_offset   +  8       <= phy.bar0_size
+
+    # 7-Series.
+    if isinstance(phy, S7PCIEPHY):
+        phy.msi_type = "msi-x"
+        phy.update_config({
+            "MSIx_Table_Size"   : f"{width:X}",
+            "MSIx_Table_Offset" : f"{table_offset:X}",
+            "MSIx_PBA_Offset"   : f"{pba_offset:X}",
+        })
+    # UltraScale+ (MSI-X Table/PBA implemented in the FPGA fabric).
+    elif isinstance(phy, USPPCIEPHY):
+        phy.update_config({
+            "pf0_msi_enabled"           : False,
+            "pf0_msix_enabled"          : True,
+            "MSI_X_OPTIONS"             : "MSI-X_External",
+            "PF0_MSIX_CAP_TABLE_SIZE"   : f"{width - 1:03X}",
+            "PF0_MSIX_CAP_TABLE_BIR"    : "BAR_0",
+            "PF0_MSIX_CAP_TABLE_OFFSET" : f"{table_offset:08X}",
+            "PF0_MSIX_CAP_PBA_BIR"      : "BAR_0",
+            "PF0_MSIX_CAP_PBA_OFFSET"   : f"{pba_offset:08X}",
+        })
+    else:
+        raise NotImplementedError(f"MSI-X not supported on {type(phy).__name__}.")
+
+# Add PCIe -----------------------------------------------------------------------------------------
+
+def add_pcie(soc, name="pcie", phy=None, ndmas=0, address_width=32, data_width=None,
+    msi_type    = "msi",
+    irq_count   = 1,
+    irq_timeout = 0):
+    """Add PCIe to the SoC (see SoC.add_pcie), with optional MSI-X and DMA IRQs coalescing.
+
+    msi_type    : "msi" (single vector) or "msi-x" (one vector per DMA channel/direction).
+    irq_count   : Default IRQ count threshold (1: No coalescing).
+    irq_timeout : Default IRQ timeout threshold in us (0: Disabled).
+    """
+    from litepcie.frontend.dma import LitePCIeDMA
+
+    assert msi_type in ["msi", "msi-x"]
+    with_irq_coalescing = (irq_count > 1) or (irq_timeout > 0)
+
+    # MSI-X PHY configuration.
+    if msi_type == "msi-x":
+        _configure_phy_msix(soc, name, phy, width=32)
+
+    # Without IRQs coalescing, directly use SoC.add_pcie.
+    if not with_irq_coalescing:
+        soc.add_pcie(name=name, phy=phy, ndmas=ndmas,
+            address_width = address_width,
+            data_width    = data_width,
+            msi_type      = msi_type)
+        return
+
+    # With IRQs coalescing, add DMAs behind the IRQ Coalescer: SoC.add_pcie is called without DMAs
+    # and with the coalesced IRQs as MSIs (same names, so same IRQ numbers than SoC.add_pcie).
+    irq_names = []
+    for i in range(ndmas):
+        irq_names += [f"{name.upper()}_DMA{i}_WRITER", f"{name.upper()}_DMA{i}_READER"]
+    irq_coalescer = LitePCIeIRQCoalescer(len(irq_names),
+        default_count   = irq_count,
+        default_timeout = int(irq_timeout*soc.sys_clk_freq/1e6))
+    soc.add_module(name=f"{name}_irq_coalescer", module=irq_coalescer)
+    soc.add_pcie(name=name, phy=phy, ndmas=0,
+        address_width = address_width,
+        data_width    = data_width,
+        msi_type      = msi_type,
+        msis          = {k: irq_coalescer.irqs_out[n] for n, k in enumerate(irq_names)})
+
+    # DMAs.
+    endpoint = getattr(soc, f"{name}_endpoint")
+    for i in range(ndmas):
+        soc.check_if_exists(f"{name}_dma{i}")
+        dma = LitePCIeDMA(phy, endpoint,
+            with_buffering = True, buffering_depth=1024,
+            with_loopback  = True,
+            address_width  = address_width,
+            data_width     = data_width,
+        )
+        soc.add_module(name=f"{name}_dma{i}", module=dma)
+        soc.comb += [
+            irq_coalescer.irqs_in[2*i + 0].eq(dma.writer.irq),
+            irq_coalescer.irqs_in[2*i + 1].eq(dma.reader.irq),
+        ]
+    soc.add_constant("DMA_CHANNELS", ndmas, check_duplicate=False)
+
+# Add PCIe <-> DRAM DMAs ---------------------------------------------------------------------------
+
+def add_pcie_dram_dma(soc, name="pcie", ndmas=1, fifo_depth=512):
+    """Connect the PCIe DMAs of add_pcie/SoC.add_pcie to DRAM through native LiteDRAM ports.
+
+    Each DMA channel gets a DRAM reader (DRAM -> Host) and a DRAM writer (Host -> DRAM), with CSRs
+    to program the DRAM base/length (``{name}_dma{i}_dram_reader``/``{name}_dma{i}_dram_writer``).
+    """
+    from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+
+    if not hasattr(soc, "sdram"):
+        raise ValueError("PCIe <-> DRAM DMAs require DRAM (not available with integrated main RAM).")
+    phy = getattr(soc, f"{name}_phy")
+    for i in range(ndmas):
+        pcie_dma = getattr(soc, f"{name}_dma{i}")
+        # DRAM -> Host: DRAM reader feeding the PCIe DMA writer.
+        dram_reader = LiteDRAMDMAReader(
+            port          = soc.sdram.crossbar.get_port(mode="read", data_width=phy.data_width),
+            fifo_depth    = fifo_depth,
+            fifo_buffered = True,
+            with_csr      = True)
+        soc.add_module(name=f"{name}_dma{i}_dram_reader", module=dram_reader)
+        # Host -> DRAM: PCIe DMA reader feeding the DRAM writer.
+        dram_writer = LiteDRAMDMAWriter(
+            port          = soc.sdram.crossbar.get_port(mode="write", data_width=phy.data_width),
+            fifo_depth    = fifo_depth,
+            fifo_buffered = True,
+            with_csr      = True)
+        soc.add_module(name=f"{name}_dma{i}_dram_writer", module=dram_writer)
+        soc.comb += [
+            dram_reader.source.connect(pcie_dma.sink),
+            pcie_dma.source.connect(dram_writer.sink),
+        ]
@@ -0,0 +1,572 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SATA helpers shared by the SATA targets.
+#
+# Gen/Data-Width: SATA targets can run the link at Gen1/Gen2/Gen3 (1.5/3.0/6.0Gbps). Gen3 uses the
+# 32-bit PHY datapath (sata_tx/sata_rx clocks at 150MHz instead of 300MHz with 16-bit) and requires
+# a sys clock >= 150MHz, LiteSATA's core being 32-bit in the sys clock domain.
+#
+# DRAM Streamer: Executes a queue of descriptors (SATA sector, DRAM address, number of sectors and
+# direction) by streaming sectors between a LiteSATA user port and LiteDRAM DMAs, allowing continuous
+# recording/playback at the SATA line rate without CPU copies through sector buffers.
+#
+# RAID-0: Boards with multiple transceivers (SATA connectors or SFP cages with SFP to SATA adapters)
+# can instantiate one LiteSATA core per drive and stripe their sectors (configurable stripe size),
+# sub-commands being executed concurrently on all drives so recording bandwidth scales with the
+# number of drives (up to the 32-bit sys clock datapath of the user port).
+
+import re
+import argparse
+from functools import reduce
+from operator import and_
+from types import SimpleNamespace
+
+from migen import *
+
+from litex.gen import LiteXModule
+from litex.gen.common import reverse_bytes
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+
+# Constants ----------------------------------------------------------------------------------------
+
+sata_linerates = {
+    "gen1": 1.5e9,
+    "gen2": 3.0e9,
+    "gen3": 6.0e9,
+}
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def sata_phy_data_width(gen, data_width=None):
+    """Return the PHY data-width for gen: 32-bit for Gen3 (16-bit would require 300MHz sata_tx/rx clocks), 16-bit otherwise."""
+    if data_width is None:
+        data_width = {"gen3": 32}.get(gen, 16)
+    if (gen == "gen3") and (data_width != 32):
+        raise ValueError("SATA Gen3 requires a 32-bit PHY data-width.")
+    return data_width
+
+def sata_max_linerate(device):
+    """Return the maximum transceiver linerate of device (Artix7 GTPs are limited to 3.75Gbps on -1 speedgrade)."""
+    if re.match("^xc7a.*-1", device):
+        return 3.75e9
+    return 6.6e9
+
+def sata_args(parser, default="2"):
+    """Add SATA Gen/Data-Width arguments to a target's parser."""
+    parser.add_target_argument("--sata-gen",        default=default, choices=["1", "2", "3"], help="SATA Gen (3: 6Gbps, requires --sys-clk-freq >= 150e6).")
+    parser.add_target_argument("--sata-data-width", default=None, type=int, choices=[16, 32], help="SATA PHY data-width (default: 32 for Gen3, 16 otherwise).")
+
+def check_sata_args(parser, args):
+    """Check SATA Gen/Data-Width arguments of a target against its sys clock (parser error when not supported)."""
+    if not args.with_sata:
+        return
+    if (args.sata_gen == "3") and (args.sata_data_width == 16):
+        parser.error("--sata-gen=3 requires --sata-data-width=32.")
+    sata_clk_freq = sata_linerates["gen" + args.sata_gen]/40 # 32-bit (40-bit 8b10b) core datapath.
+    if args.sys_clk_freq < sata_clk_freq:
+        parser.error(f"--sata-gen={args.sata_gen} requires --sys-clk-freq >= {sata_clk_freq/1e6:g}e6 (got {args.sys_clk_freq/1e6:g}e6).")
+
+def sata_stripe_sectors(value):
+    """Argparse type for the RAID-0 stripe size: Number of sectors, power of 2."""
+    stripe_sectors = int(value)
+    if (stripe_sectors <= 0) or (stripe_sectors & (stripe_sectors - 1)):
+        raise argparse.ArgumentTypeError(f"SATA RAID-0 stripe size must be a power of 2 (got {value}).")
+    return stripe_sectors
+
+def sata_raid0_args(parser):
+    """Add SATA RAID-0 arguments to a target's parser."""
+    parser.add_target_argument("--sata-raid0",      action="store_true", help="Enable SATA RAID-0 with --with-sata (One SATA core per SFP cage, with SFP to SATA adapters).")
+    parser.add_target_argument("--sata-stripe",     default=16, type=sata_stripe_sectors, help="SATA RAID-0 stripe size (in sectors, power of 2).")
+
+def sata_sfp_pads(pads):
+    """Return SATA pads (tx_p/tx_n/rx_p/rx_n) from SFP cage pads (txp/txn/rxp/rxn), for SFP to SATA adapters."""
+    return SimpleNamespace(tx_p=pads.txp, tx_n=pads.txn, rx_p=pads.rxp, rx_n=pads.rxn)
+
+def check_sata_phy(soc, phy):
+    """Check the PHY's Gen against the device and sys clock."""
+    if sata_linerates[phy.gen] > sata_max_linerate(soc.platform.device):
+        raise ValueError(f"SATA {phy.gen.capitalize()} not supported on {soc.platform.device} (transceivers limited to {sata_max_linerate(soc.platform.device)/1e9}Gbps).")
+    sata_clk_freq = sata_linerates[phy.gen]/40 # 32-bit (40-bit 8b10b) core datapath.
+    if soc.clk_freq < sata_clk_freq:
+        raise ValueError(f"SATA {phy.gen.capitalize()} requires a sys clock >= {sata_clk_freq/1e6}MHz (current {soc.clk_freq/1e6}MHz).")
+
+# SATA DRAM Streamer -------------------------------------------------------------------------------
+
+class LiteSATADRAMStreamer(LiteXModule):
+    """SATA <-> DRAM streamer: Descriptors pushed to the queue are executed in order, each one as a
+    single SATA command whose data is streamed from/to DRAM through LiteDRAM DMAs."""
+    def __init__(self, port, dram_read_port, dram_write_port, queue_depth=16, fifo_depth=256):
+        from litesata.common import logical_sector_size
+        from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+        assert port.dw == 32
+        assert dram_read_port.data_width  == 32
+        assert dram_write_port.data_width == 32
+
+        self._sector   = CSRStorage(48, description="Descriptor: SATA Start Sector.")
+        self._base     = CSRStorage(32, description="Descriptor: DRAM Base Address (Byte offset in DRAM, 4-byte aligned).")
+        self._nsectors = CSRStorage(16, description="Descriptor: Number of Sectors (512 bytes).")
+        self._write    = CSRStorage(description="Descriptor: Direction (``0``: SATA -> DRAM, ``1``: DRAM -> SATA).")
+        self._push     = CSR() # Push Descriptor to the queue on write (Ignored when the queue is full).
+        self._level    = CSRStatus(bits_for(queue_depth), description="Number of queued Descriptors (excluding the one being executed).")
+        self._busy     = CSRStatus(description="Streamer busy (``0``: All Descriptors executed).")
+        self._done     = CSRStatus(32, description="Executed Descriptors Count.")
+        self._errors   = CSRStatus(32, description="Failed Descriptors Count (SATA command failed).")
+
+        # # #
+
+        words_per_sector = logical_sector_size//4
+
+        # Descriptors Queue.
+        self.queue = queue = stream.SyncFIFO([
+            ("sector",   48),
+            ("base",     32),
+            ("nsectors", 16),
+            ("write",     1)],
+            depth = queue_depth)
+        self.comb += [
+            queue.sink.valid.eq(self._push.re),
+            queue.sink.sector.eq(self._sector.storage),
+            queue.sink.base.eq(self._base.storage),
+            queue.sink.nsectors.eq(self._nsectors.storage),
+            queue.sink.write.eq(self._write.storage),
+            self._level.status.eq(queue.level),
+        ]
+        desc = queue.source
+
+        # DMAs.
+        self.dram_reader = reader = LiteDRAMDMAReader(dram_read_port,  fifo_depth=fifo_depth, fifo_buffered=True)
+        self.dram_writer = writer = LiteDRAMDMAWriter(dram_write_port, fifo_depth=fifo_depth, fifo_buffered=True)
+
+        # Descriptor execution.
+        words      = Signal(32)
+        addr_count = Signal(32)
+        data_count = Signal(32)
+        self.comb += [
+            words.eq(desc.nsectors*words_per_sector),
+            port.sink.sector.eq(desc.sector),
+            port.sink.count.eq(desc.nsectors),
+            reader.sink.address.eq(desc.base[2:] + addr_count),
+            writer.sink.address.eq(desc.base[2:] + data_count),
+            writer.sink.data.eq(reverse_bytes(port.source.data)),
+        ]
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            NextValue(addr_count, 0),
+            NextValue(data_count, 0),
+            If(desc.valid,
+                If(desc.nsectors == 0,
+                    NextState("DONE")
+                ).Elif(desc.write,
+                    NextState("WRITE-CMD-AND-DATA")
+                ).Else(
+                    NextState("READ-CMD")
+                )
+            )
+        )
+        # DRAM -> SATA: DRAM reads issued ahead of the SATA write command/data.
+        fsm.act("WRITE-CMD-AND-DATA",
+            reader.sink.valid.eq(addr_count != words),
+            If(reader.sink.valid & reader.sink.ready,
+                NextValue(addr_count, addr_count + 1)
+            ),
+            port.sink.valid.eq(reader.source.valid),
+            port.sink.last.eq(data_count == (words - 1)),
+            port.sink.write.eq(1),
+            port.sink.data.eq(reverse_bytes(reader.source.data)),
+            reader.source.ready.eq(port.sink.ready),
+            If(port.sink.valid & port.sink.ready,
+                NextValue(data_count, data_count + 1),
+                If(port.sink.last,
+                    NextState("WAIT-STATUS")
+                )
+            )
+        )
+        # SATA -> DRAM.
+        fsm.act("READ-CMD",
+            port.sink.valid.eq(1),
+            port.sink.last.eq(1),
+            port.sink.read.eq(1),
+            If(port.sink.ready,
+                NextState("READ-DATA")
+            )
+        )
+        fsm.act("READ-DATA",
+            If(port.source.valid & port.source.end,
+                NextState("WAIT-STATUS")
+            ).Else(
+                writer.sink.valid.eq(port.source.valid),
+                port.source.ready.eq(writer.sink.ready),
+                If(writer.sink.valid & writer.sink.ready,
+                    NextValue(data_count, data_count + 1)
+                )
+            )
+        )
+        fsm.act("WAIT-STATUS",
+            port.source.ready.eq(1),
+            If(port.source.valid & port.source.end & port.source.last,
+                If(port.source.failed,
+                    NextValue(self._errors.status, self._errors.status + 1)
+                ),
+                NextState("DONE")
+            )
+        )
+        fsm.act("DONE",
+            desc.ready.eq(1),
+            NextValue(self._done.status, self._done.status + 1),
+            NextState("IDLE")
+        )
+        self.comb += self._busy.status.eq(~fsm.ongoing("IDLE") | desc.valid)
+
+def add_sata_dram_streamer(soc, name="sata_dram_streamer", sata_name="sata", queue_depth=16):
+    """Add a LiteSATADRAMStreamer to the SoC on a port of SATA's crossbar and DRAM ports."""
+    if not hasattr(soc, "sdram"):
+        raise ValueError("SATA DRAM Streamer requires DRAM.")
+    streamer = LiteSATADRAMStreamer(
+        port            = getattr(soc, f"{sata_name}_crossbar").get_port(),
+        dram_read_port  = soc.sdram.crossbar.get_port(mode="read",  data_width=32),
+        dram_write_port = soc.sdram.crossbar.get_port(mode="write", data_width=32),
+        queue_depth     = queue_depth)
+    soc.add_module(name=name, module=streamer)
+    return streamer
+
+# SATA RAID-0 --------------------------------------------------------------------------------------
+
+class LiteSATARAID0(LiteXModule):
+    """SATA RAID-0: Stripes the sectors of a controller port across N controllers (LiteSATA cores).
+
+    Sectors are grouped in stripes of stripe_sectors, distributed round-robin over the controllers.
+    Commands are split in per-stripe sub-commands buffered per controller (FIFOs of 2 stripes) and
+    executed concurrently, so that bandwidth scales with the number of drives. Identify commands are
+    forwarded to the first controller.
+    """
+    def __init__(self, controllers, stripe_sectors=16):
+        from litesata.common import logical_sector_size, command_tx_description, command_rx_description
+        n  = len(controllers)
+        dw = len(controllers[0].sink.data)
+        assert n & (n - 1) == 0
+        assert stripe_sectors & (stripe_sectors - 1) == 0
+        self.sink   = sink   = stream.Endpoint(command_tx_description(dw))
+        self.source = source = stream.Endpoint(command_rx_description(dw))
+
+        # # #
+
+        words_per_sector = logical_sector_size*8//dw
+        stripe_words     = stripe_sectors*words_per_sector
+        fifo_depth       = 2*stripe_words
+
+        # Command (Latched).
+        sector    = Signal(48)
+        remaining = Signal(16)
+        write     = Signal()
+
+        # Current Stripe: Drive, Drive Sector and Number of Sectors.
+        offset       = Signal(max=stripe_sectors)
+        room         = Signal(max=stripe_sectors + 1)
+        drive        = Signal(max=max(n, 2))
+        drive_sector = Signal(48)
+        chunk        = Signal(max=stripe_sectors + 1)
+        self.comb += [
+            offset.eq(sector & (stripe_sectors - 1)),
+            room.eq(stripe_sectors - offset),
+            drive.eq((sector >> log2_int(stripe_sectors)) & (n - 1)),
+            drive_sector.eq(((sector >> log2_int(stripe_sectors*n)) << log2_int(stripe_sectors)) | offset),
+            chunk.eq(Mux(remaining < room, remaining, room)),
+        ]
+
+        # Sub-Commands/Data FIFOs (Data: Write data from sink or Read data to source) and Read Order.
+        cmd_fifos  = [stream.SyncFIFO([("write", 1), ("sector", 48), ("count", 16)], 4) for i in range(n)]
+        data_fifos = [stream.SyncFIFO([("data", dw)], fifo_depth, buffered=True) for i in range(n)]
+        self.submodules += cmd_fifos + data_fifos
+        self.order = order = stream.SyncFIFO([("drive", len(drive)), ("words", bits_for(stripe_words))], 4*n)
+        cmd_ready = Signal()
+        self.comb += Case(drive, {i: cmd_ready.eq(cmd_fifos[i].sink.ready) for i in range(n)})
+        for cmd in cmd_fifos:
+            self.comb += [
+                cmd.sink.write.eq(write),
+                cmd.sink.sector.eq(drive_sector),
+                cmd.sink.count.eq(chunk),
+            ]
+        self.comb += [
+            order.sink.drive.eq(drive),
+            order.sink.words.eq(chunk*words_per_sector),
+        ]
+
+        # Controllers: Execute Sub-Commands.
+        failed = Signal(n)
+        idle   = Signal(n)
+        for i, (controller, cmd, fifo) in enumerate(zip(controllers, cmd_fifos, data_fifos)):
+            words = Signal(32)
+            count = Signal(32)
+            self.comb += words.eq(cmd.source.count*words_per_sector)
+            fsm = FSM(reset_state="IDLE")
+            self.submodules += fsm
+            fsm.act("IDLE",
+                NextValue(count, 0),
+                If(cmd.source.valid,
+                    # Write: Wait for the Sub-Command's data to be buffered.
+                    If(cmd.source.write,
+                        If(fifo.level >= words,
+                            NextState("WRITE")
+                        )
+                    # Read: Wait for room for the Sub-Command's data.
+                    ).Elif((fifo_depth - fifo.level) >= words,
+                        NextState("READ-CMD")
+                    )
+                )
+            )
+            fsm.act("WRITE",
+                controller.sink.valid.eq(fifo.source.valid),
+                controller.sink.last.eq(count == (words - 1)),
+                controller.sink.write.eq(1),
+                controller.sink.sector.eq(cmd.source.sector),
+                controller.sink.count.eq(cmd.source.count),
+                controller.sink.data.eq(fifo.source.data),
+                fifo.source.ready.eq(controller.sink.ready),
+                If(controller.sink.valid & controller.sink.ready,
+                    NextValue(count, count + 1),
+                    If(controller.sink.last,
+                        NextState("STATUS")
+                    )
+                )
+            )
+            fsm.act("READ-CMD",
+                controller.sink.valid.eq(1),
+                controller.sink.last.eq(1),
+                controller.sink.read.eq(1),
+                controller.sink.sector.eq(cmd.source.sector),
+                controller.sink.count.eq(cmd.source.count),
+                If(controller.sink.ready,
+                    NextState("READ-DATA")
+                )
+            )
+            fsm.act("READ-DATA",
+                If(controller.source.valid & controller.source.end,
+                    NextState("READ-PAD")
+                ).Else(
+                    fifo.sink.valid.eq(controller.source.valid),
+                    fifo.sink.data.eq(controller.source.data),
+                    controller.source.ready.eq(fifo.sink.ready),
+                    If(fifo.sink.valid & fifo.sink.ready,
+                        NextValue(count, count + 1)
+                    )
+                )
+            )
+            # Pad missing Read data (failed command) to keep the Read Order.
+            fsm.act("READ-PAD",
+                fifo.sink.valid.eq(count != words),
+                If(fifo.sink.valid & fifo.sink.ready,
+                    NextValue(count, count + 1)
+                ),
+                If(count == words,
+                    NextState("STATUS")
+                )
+            )
+            fsm.act("STATUS",
+                controller.source.ready.eq(1),
+                If(controller.source.valid & controller.source.end & controller.source.last,
+                    cmd.source.ready.eq(1),
+                    NextState("IDLE")
+                )
+            )
+            self.comb += idle[i].eq(fsm.ongoing("IDLE") & ~cmd.source.valid)
+            self.sync += If(fsm.ongoing("STATUS") & controller.source.valid & controller.source.failed,
+                failed[i].eq(1)
+            )
+
+        # Read Data: Merge Sub-Commands data in order.
+        merge_count = Signal(bits_for(stripe_words))
+        self.comb += If(order.source.valid,
+            Case(order.source.drive, {i: [
+                source.valid.eq(data_fifos[i].source.valid),
+                source.data.eq(data_fifos[i].source.data),
+                data_fifos[i].source.ready.eq(source.ready),
+            ] for i in range(n)}),
+            source.read.eq(1),
+            source.last.eq(merge_count == (order.source.words - 1)),
+            order.source.ready.eq(source.valid & source.ready & source.last),
+        )
+        self.sync += If(source.valid & source.ready & order.source.valid,
+            merge_count.eq(merge_count + 1),
+            If(source.last,
+                merge_count.eq(0)
+            )
+        )
+
+        # Command FSM: Split Commands in Sub-Commands.
+        words_count = Signal(bits_for(stripe_words))
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            NextValue(sector,    sink.sector),
+            NextValue(remaining, sink.count),
+            NextValue(write,     sink.write),
+            If(sink.valid,
+                If(sink.identify,
+                    NextState("IDENTIFY")
+                ).Elif(sink.count == 0,
+                    sink.ready.eq(1),
+                    If(sink.last,
+                        NextState("WAIT")
+                    )
+                ).Else(
+                    NextState("SPLIT")
+                )
+            )
+        )
+        fsm.act("SPLIT",
+            NextValue(words_count, 0),
+            If(cmd_ready & (write | order.sink.ready),
+                Case(drive, {i: cmd_fifos[i].sink.valid.eq(1) for i in range(n)}),
+                order.sink.valid.eq(~write),
+                If(write,
+                    NextState("WRITE-DATA")
+                ).Else(
+                    NextState("NEXT")
+                )
+            )
+        )
+        fsm.act("WRITE-DATA",
+            Case(drive, {i: [
+                data_fifos[i].sink.valid.eq(sink.valid),
+                data_fifos[i].sink.data.eq(sink.data),
+                sink.ready.eq(data_fifos[i].sink.ready),
+            ] for i in range(n)}),
+            If(sink.valid & sink.ready,
+                NextValue(words_count, words_count + 1),
+                If(words_count == (chunk*words_per_sector - 1),
+                    NextState("NEXT")
+                )
+            )
+        )
+        fsm.act("NEXT",
+            NextValue(sector,    sector    + chunk),
+            NextValue(remaining, remaining - chunk),
+            If(remaining == chunk,
+                sink.ready.eq(~write), # Read Command.
+                NextState("WAIT")
+            ).Else(
+                NextState("SPLIT")
+            )
+        )
+        fsm.act("WAIT",
+            If((idle == (2**n - 1)) & ~order.source.valid,
+                NextState("STATUS")
+            )
+        )
+        fsm.act("STATUS",
+            source.valid.eq(1),
+            source.last.eq(1),
+            source.end.eq(1),
+            source.write.eq(write),
+            source.read.eq(~write),
+            source.failed.eq(failed != 0),
+            If(source.ready,
+                NextState("IDLE")
+            )
+        )
+        self.sync += If(fsm.ongoing("STATUS") & source.ready,
+            failed.eq(0)
+        )
+        fsm.act("IDENTIFY",
+            sink.connect(controllers[0].sink),
+            controllers[0].source.connect(source),
+            If(source.valid & source.ready & source.end & source.last,
+                NextState("IDLE")
+            )
+        )
+
+class LiteSATARAID0PHYCSR(LiteXModule):
+    """Control/Status of the RAID-0 PHYs (as a LiteSATAPHY's CSRs): PHYs enabled together, ready when all ready."""
+    def __init__(self, phys):
+        self._enable = CSRStorage(reset=1)
+        self._status = CSRStatus(fields=[
+            CSRField("ready", size=1, description="PHYs initialized and ready."),
+        ])
+
+        # # #
+
+        self.comb += [phy.enable.eq(self._enable.storage) for phy in phys]
+        self.comb += self._status.fields.ready.eq(reduce(and_, [phy.ready for phy in phys]))
+
+# Add SATA -----------------------------------------------------------------------------------------
+
+def add_sata(soc, name="sata", phy=None, mode="read+write", with_dram_streamer=False, **kwargs):
+    """Add SATA to the SoC (see SoC.add_sata), checking the PHY's Gen against the device and sys clock.
+
+    With with_dram_streamer, a LiteSATADRAMStreamer is also added as {name}_dram_streamer.
+    """
+    check_sata_phy(soc, phy)
+    soc.add_sata(name=name, phy=phy, mode=mode, **kwargs)
+    if with_dram_streamer:
+        add_sata_dram_streamer(soc, name=f"{name}_dram_streamer", sata_name=name)
+
+def add_sata_raid0(soc, name="sata", phys=[], stripe_sectors=16, mode="read+write", with_dram_streamer=False):
+    """Add SATA RAID-0 to the SoC: One LiteSATA core per PHY ({name}{i}_core) striped by a LiteSATARAID0
+    ({name}_raid0), with Crossbar/Identify/DMAs on top as SoC.add_sata.
+
+    PHYs are created without CSRs (with_csr=False) and controlled together through {name}_phy.
+    With with_dram_streamer, a LiteSATADRAMStreamer is also added as {name}_dram_streamer.
+    """
+    from litesata.core import LiteSATACore
+    from litesata.frontend.arbitration import LiteSATACrossbar
+    from litesata.frontend.identify import LiteSATAIdentify, LiteSATAIdentifyCSR
+    from litesata.frontend.dma import LiteSATASector2MemDMA, LiteSATAMem2SectorDMA
+    from litex.soc.interconnect import wishbone
+
+    # PHYs.
+    soc.add_module(name=f"{name}_phy", module=LiteSATARAID0PHYCSR(phys))
+    for i, phy in enumerate(phys):
+        check_sata_phy(soc, phy)
+        soc.add_module(name=f"{name}{i}_phy", module=phy)
+        sata_clk_freq = sata_linerates[phy.gen]/10/(phy.phy.data_width//8)
+        soc.platform.add_period_constraint(phy.crg.cd_sata_tx.clk, 1e9/sata_clk_freq)
+        soc.platform.add_period_constraint(phy.crg.cd_sata_rx.clk, 1e9/sata_clk_freq)
+        soc.platform.add_false_path_constraints(
+            soc.crg.cd_sys.clk,
+            phy.crg.cd_sata_tx.clk,
+            phy.crg.cd_sata_rx.clk,
+        )
+
+    # Cores/RAID-0.
+    cores = [LiteSATACore(phy) for phy in phys]
+    for i, core in enumerate(cores):
+        soc.add_module(name=f"{name}{i}_core", module=core)
+    sata_raid0 = LiteSATARAID0(cores, stripe_sectors=stripe_sectors)
+    soc.add_module(name=f"{name}_raid0", module=sata_raid0)
+
+    # Crossbar.
+    sata_crossbar = LiteSATACrossbar(sata_raid0)
+    soc.add_module(name=f"{name}_crossbar", module=sata_crossbar)
+
+    # Identify.
+    sata_identify = LiteSATAIdentifyCSR(LiteSATAIdentify(sata_crossbar.get_port()))
+    soc.add_module(name=f"{name}_identify", module=sata_identify)
+
+    # Sector2Mem/Mem2Sector DMAs.
+    for dma_mode, dma_name, dma_cls in [
+        ("read",  "sector2mem", LiteSATASector2MemDMA),
+        ("write", "mem2sector", LiteSATAMem2SectorDMA)]:
+        if dma_mode not in mode:
+            continue
+        bus = wishbone.Interface(
+            data_width = soc.bus.data_width,
+            adr_width  = soc.bus.get_address_width(standard="wishbone"),
+            addressing = "word",
+        )
+        dma = dma_cls(
+            port       = sata_crossbar.get_port(),
+            bus        = bus,
+            endianness = soc.cpu.endianness,
+        )
+        soc.add_module(name=f"{name}_{dma_name}", module=dma)
+        dma_bus = getattr(soc, "dma_bus", soc.bus)
+        dma_bus.add_master(name=f"{name}_{dma_name}", master=bus)
+
+    # DRAM Streamer.
+    if with_dram_streamer:
+        add_sata_dram_streamer(soc, name=f"{name}_dram_streamer", sata_name=name)
@@ -0,0 +1,440 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SDRAM helpers shared by the SDRAM targets.
+#
+# add_sdram() extends SoC.add_sdram with a configurable L2 cache:
+# - Size: Optionally scaled to the Block RAM/UltraRAM available on the device (--l2-size-auto), 8KiB
+#   by default as SoC.add_sdram.
+# - Associativity: N-way set-associative with Pseudo-LRU replacement (instead of direct-mapped).
+# - Memory: UltraRAM on UltraScale+ devices for large caches (instead of Block RAM).
+#
+# LiteDRAMInterleaver spreads a linear Wishbone region over several LiteDRAM cores/channels.
+
+import re
+import math
+import argparse
+
+from functools import reduce
+from operator import and_
+
+from migen import *
+from migen.fhdl.simplify import FullMemoryWE
+
+from litex.gen import LiteXModule
+from litex.gen.genlib.misc import split, displacer, chooser
+
+from litex.soc.interconnect import wishbone
+from litex.soc.integration.soc import SoCRegion
+
+# L2 Cache -----------------------------------------------------------------------------------------
+
+class L2Cache(LiteXModule):
+    """N-way set-associative write-back Wishbone cache.
+
+    Drop-in replacement for wishbone.Cache (same interfaces/parameters, cachesize in 32-bit words)
+    with ``ways`` ways (power of 2) selected with a tree Pseudo-LRU; invalid ways are refilled first.
+    """
+    def __init__(self, cachesize, master, slave, ways=1, reverse=True):
+        self.master    = master
+        self.slave     = slave
+        self.data_mems = []
+        self.tag_mems  = []
+
+        # # #
+
+        # Parameters.
+        # -----------
+        dw_from = len(master.dat_r)
+        dw_to   = len(slave.dat_r)
+        if dw_to > dw_from and (dw_to % dw_from) != 0:
+            raise ValueError("Slave data width must be a multiple of {dw}".format(dw=dw_from))
+        if dw_to < dw_from and (dw_from % dw_to) != 0:
+            raise ValueError("Master data width must be a multiple of {dw}".format(dw=dw_to))
+        if ways < 1 or (ways & (ways - 1)) != 0:
+            raise ValueError("Number of ways must be a power of 2.")
+
+        # Address Split.
+        # --------------
+        # TAG | SET NUMBER | LINE OFFSET.
+        waybits                      = log2_int(ways)
+        offsetbits                   = log2_int(max(dw_to//dw_from, 1))
+        addressbits                  = len(slave.adr) + offsetbits
+        setbits                      = log2_int(cachesize) - offsetbits - waybits
+        tagbits                      = addressbits - setbits
+        wordbits                     = log2_int(max(dw_from//dw_to, 1))
+        if setbits < 1:
+            raise ValueError("Cache size too small for {ways} ways.".format(ways=ways))
+        adr_offset, adr_set, adr_tag = split(master.adr, offsetbits, setbits, tagbits)
+        word                         = Signal(wordbits) if wordbits else None
+
+        # Way Selection.
+        # --------------
+        # Way accessed by the FSM: Hit way on hits, victim way on misses/evictions/refills.
+        way        = Signal(max(waybits, 1))
+        victim     = Signal(max(waybits, 1))
+        victim_sel = Signal(max(waybits, 1))
+        hits       = Signal(ways)
+        hit        = Signal()
+        hit_way    = Signal(max(waybits, 1))
+
+        # Data/Tag Memories (one per way, read in parallel).
+        # --------------------------------------------------
+        write_from_slave = Signal()
+        tag_we           = Signal()
+        tag_layout       = [("tag", tagbits), ("dirty", 1), ("valid", 1)]
+        tag_di           = Record(tag_layout)
+        tag_dos          = []
+        data_dats_r      = []
+        data_dat_w       = Signal(dw_to*2**wordbits)
+        data_we          = Signal(dw_to*2**wordbits//8)
+        for n in range(ways):
+            data_mem  = Memory(dw_to*2**wordbits, 2**setbits)
+            data_port = data_mem.get_port(write_capable=True, we_granularity=8)
+            tag_mem   = Memory(layout_len(tag_layout), 2**setbits)
+            tag_port  = tag_mem.get_port(write_capable=True)
+            tag_do    = Record(tag_layout)
+            self.specials += data_mem, data_port, tag_mem, tag_port
+            self.comb += [
+                data_port.adr.eq(adr_set),
+                data_port.dat_w.eq(data_dat_w),
+                If(way == n, data_port.we.eq(data_we)),
+                tag_port.adr.eq(adr_set),
+                tag_port.dat_w.eq(tag_di.raw_bits()),
+                tag_port.we.eq(tag_we & (way == n)),
+                tag_do.raw_bits().eq(tag_port.dat_r),
+                hits[n].eq(tag_do.valid & (tag_do.tag == adr_tag)),
+            ]
+            self.data_mems.append(data_mem)
+            self.tag_mems.append(tag_mem)
+            tag_dos.append(tag_do)
+            data_dats_r.append(data_port.dat_r)
+        tag_do = Array(tag_dos)[way]
+        data_r = Signal(dw_to*2**wordbits)
+        self.comb += data_r.eq(Array(data_dats_r)[way])
+
+        if adr_offset is None:
+            adr_offset_r = None
+        else:
+            adr_offset_r = Signal(offsetbits, reset_less=True)
+            self.sync += adr_offset_r.eq(adr_offset)
+
+        self.comb += [
+            If(write_from_slave,
+                displacer(slave.dat_r, word, data_dat_w),
+                displacer(Replicate(1, dw_to//8), word, data_we)
+            ).Else(
+                data_dat_w.eq(Replicate(master.dat_w, max(dw_to//dw_from, 1))),
+                If(master.cyc & master.stb & master.we & master.ack,
+                    displacer(master.sel, adr_offset, data_we, 2**offsetbits, reverse=reverse)
+                )
+            ),
+            chooser(data_r, word, slave.dat_w),
+            slave.sel.eq(2**(dw_to//8)-1),
+            chooser(data_r, adr_offset_r, master.dat_r, reverse=reverse)
+        ]
+
+        self.comb += [
+            tag_di.tag.eq(adr_tag),
+            tag_di.valid.eq(1),
+            hit.eq(hits != 0),
+        ]
+        for n in range(ways):
+            self.comb += If(hits[n], hit_way.eq(n))
+        if word is not None:
+            self.comb += slave.adr.eq(Cat(word, adr_set, tag_do.tag))
+        else:
+            self.comb += slave.adr.eq(Cat(adr_set, tag_do.tag))
+
+        # Replacement Policy (Tree Pseudo-LRU, nodes pointing to the least recently used side).
+        # -------------------------------------------------------------------------------------
+        plru_update = Signal()
+        if ways > 1:
+            plru_mem  = Memory(ways - 1, 2**setbits)
+            plru_port = plru_mem.get_port(write_capable=True)
+            self.specials += plru_mem, plru_port
+
+            def way_path(n):
+                node, path = 0, []
+                for level in range(waybits):
+                    direction = (n >> (waybits - 1 - level)) & 1
+                    path.append((node, direction))
+                    node = 2*node + 1 + direction
+                return path
+
+            plru_victim = Signal(waybits)
+            plru_cases  = {}
+            for n in range(ways):
+                path = way_path(n)
+                self.comb += If(reduce(and_, [plru_port.dat_r[node] == d for node, d in path]),
+                    plru_victim.eq(n)
+                )
+                plru_cases[n] = [plru_port.dat_w[node].eq(1 - d) for node, d in path]
+            self.comb += [
+                plru_port.adr.eq(adr_set),
+                plru_port.dat_w.eq(plru_port.dat_r),
+                Case(way, plru_cases),
+                plru_port.we.eq(plru_update),
+                victim_sel.eq(plru_victim),
+            ]
+            # Refill invalid ways first.
+            for n in reversed(range(ways)):
+                self.comb += If(~tag_dos[n].valid, victim_sel.eq(n))
+
+        # Slave word compute.
+        # -------------------
+        # word_clr and word_inc will be simplified at synthesis when wordbits=0.
+        word_clr = Signal()
+        word_inc = Signal()
+        if word is not None:
+            self.sync += [
+                If(word_clr,
+                    word.eq(0),
+                ).Elif(word_inc,
+                    word.eq(word+1)
+                )
+            ]
+
+        def word_is_last(word):
+            if word is not None:
+                return word == 2**wordbits-1
+            else:
+                return 1
+
+        # FSM.
+        # ----
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        self.comb += way.eq(victim)
+        fsm.act("IDLE",
+            If(master.cyc & master.stb,
+                NextState("TEST_HIT")
+            )
+        )
+        fsm.act("TEST_HIT",
+            word_clr.eq(1),
+            If(hit,
+                way.eq(hit_way),
+                master.ack.eq(1),
+                plru_update.eq(1),
+                If(master.we,
+                    tag_di.dirty.eq(1),
+                    tag_we.eq(1)
+                ),
+                NextState("IDLE")
+            ).Else(
+                way.eq(victim_sel),
+                NextValue(victim, victim_sel),
+                If(tag_do.valid & tag_do.dirty,
+                    NextState("EVICT")
+                ).Else(
+                    # Write the tag first to set the slave address
+                    tag_we.eq(1),
+                    word_clr.eq(1),
+                    NextState("REFILL")
+                )
+            )
+        )
+        fsm.act("EVICT",
+            slave.stb.eq(1),
+            slave.cyc.eq(1),
+            slave.we.eq(1),
+            If(slave.ack,
+                word_inc.eq(1),
+                If(word_is_last(word),
+                    # Write the tag first to set the slave address
+                    tag_we.eq(1),
+                    word_clr.eq(1),
+                    NextState("REFILL")
+                )
+            )
+        )
+        fsm.act("REFILL",
+            slave.stb.eq(1),
+            slave.cyc.eq(1),
+            slave.we.eq(0),
+            If(slave.ack,
+                write_from_slave.eq(1),
+                word_inc.eq(1),
+                If(word_is_last(word),
+                    NextState("TEST_HIT"),
+                ).Else(
+                    NextState("REFILL")
+                )
+            )
+        )
+
+# L2 Cache Defaults --------------------------------------------------------------------------------
+
+# Default L2 cache size (in bytes) per device family, scaled to the on-chip RAM of the family's
+# smallest devices (first match).
+_l2_cache_default_sizes = [
+    # Regexp                                Size (bytes).
+    (r"xcvu\d+p|xcu\d+",                    1024*1024), # Virtex UltraScale+/Alveo (UltraRAM).
+    (r"xcku\d+p|xczu(4|5|7|11|17|19)ev",     256*1024), # Kintex UltraScale+/Zynq MPSoC (UltraRAM).
+    (r"xcku|xcvu|xczu|xcau",                 128*1024), # UltraScale/Zynq MPSoC/Artix UltraScale+.
+    (r"xc7k|xc7v",                            64*1024), # Kintex-7/Virtex-7.
+]
+
+# Devices with UltraRAM.
+_uram_devices = r"xcvu\d+p|xcu\d+|xcku\d+p|xczu(4|5|7|11|17|19)ev"
+
+def l2_cache_default_size(device):
+    """Return the default L2 cache size (in bytes) of a device."""
+    for regexp, size in _l2_cache_default_sizes:
+        if re.match(regexp, device.lower()):
+            return size
+    return 8192
+
+def l2_cache_args(parser):
+    """Add L2 cache arguments to a target's parser (--l2-size keeps LiteX's 8KiB default)."""
+    parser.add_target_argument("--l2-size-auto", dest="l2_size", action="store_const", const="auto", default=argparse.SUPPRESS,
+        help="Scale L2 cache size to the device's Block RAM/UltraRAM (instead of --l2-size).")
+    parser.add_target_argument("--l2-ways", default=1, type=int, help="L2 cache associativity (number of ways, power of 2).")
+
+# Add SDRAM ----------------------------------------------------------------------------------------
+
+def add_sdram(soc, name="sdram", phy=None, module=None, origin=None, size=None,
+    l2_cache_size           = None,
+    l2_cache_ways           = 1,
+    l2_cache_ram_style      = "auto",
+    l2_cache_min_data_width = 128,
+    l2_cache_reverse        = False,
+    l2_cache_full_memory_we = True,
+    **kwargs):
+    """Add SDRAM to the SoC (see SoC.add_sdram), with a configurable L2 cache.
+
+    l2_cache_size      : L2 cache size in bytes (None: 8KiB as SoC.add_sdram, "auto": l2_cache_default_size
+                         of the device).
+    l2_cache_ways      : L2 cache associativity (1: Direct-mapped).
+    l2_cache_ram_style : "block", "ultra" or "auto" (UltraRAM on UltraScale+ for caches >= 256KiB).
+    """
+    from litedram.frontend.wishbone import LiteDRAMWishbone2Native
+
+    device = soc.platform.device
+    if l2_cache_size is None:
+        l2_cache_size = 8192
+    if l2_cache_size == "auto":
+        l2_cache_size = l2_cache_default_size(device)
+    if l2_cache_ram_style == "auto":
+        with_uram = re.match(_uram_devices, device.lower()) is not None
+        l2_cache_ram_style = "ultra" if (with_uram and l2_cache_size >= 256*1024) else "block"
+    assert l2_cache_ram_style in ["block", "ultra"]
+
+    # Directly use SoC.add_sdram when its L2 cache can be used (or is not used: CPU memory buses).
+    sdram_kwargs = dict(
+        name                    = name,
+        phy                     = phy,
+        module                  = module,
+        origin                  = origin,
+        size                    = size,
+        l2_cache_size           = l2_cache_size,
+        l2_cache_min_data_width = l2_cache_min_data_width,
+        l2_cache_reverse        = l2_cache_reverse,
+        l2_cache_full_memory_we = l2_cache_full_memory_we,
+        **kwargs
+    )
+    with_l2_cache = (l2_cache_size != 0) and ((l2_cache_ways > 1) or (l2_cache_ram_style == "ultra"))
+    with_memory_buses = len(soc.cpu.memory_buses) or hasattr(soc.cpu, "add_memory_buses")
+    if (not with_l2_cache) or with_memory_buses:
+        soc.add_sdram(**sdram_kwargs)
+        return
+
+    # Else add LiteDRAM core without SoC interconnect and connect Main bus to LiteDRAM through L2Cache.
+    sdram_kwargs["with_soc_interconnect"] = False
+    soc.add_sdram(**sdram_kwargs)
+    sdram = getattr(soc, name)
+
+    # Compute/Check SDRAM size.
+    sdram_size = 2**(module.geom_settings.bankbits +
+                     module.geom_settings.rowbits +
+                     module.geom_settings.colbits)*phy.settings.nranks*phy.settings.databits//8
+    if size is not None:
+        sdram_size = min(sdram_size, size)
+
+    # Add SDRAM region.
+    main_ram_region = SoCRegion(
+        origin = soc.mem_map.get("main_ram", origin),
+        size   = sdram_size,
+        mode   = "rwx")
+    soc.bus.add_region("main_ram", main_ram_region)
+
+    # Request a LiteDRAM native port.
+    port = sdram.crossbar.get_port()
+    port.data_width = 2**int(math.log2(port.data_width)) # Round to nearest power of 2.
+
+    # Create Wishbone Slave.
+    wb_sdram = wishbone.Interface(data_width=soc.bus.data_width, address_width=32, addressing="word")
+    soc.bus.add_slave(name="main_ram", slave=wb_sdram)
+
+    # L2 Cache.
+    l2_cache_size = max(l2_cache_size, int(2*l2_cache_ways*port.data_width/8)) # Use minimal size if lower.
+    l2_cache_size = 2**int(math.log2(l2_cache_size))                            # Round to nearest power of 2.
+    l2_cache_data_width = max(port.data_width, l2_cache_min_data_width)
+    l2_cache = L2Cache(
+        cachesize = l2_cache_size//4,
+        master    = wb_sdram,
+        slave     = wishbone.Interface(data_width=l2_cache_data_width, address_width=32, addressing="word"),
+        ways      = l2_cache_ways,
+        reverse   = l2_cache_reverse)
+    if l2_cache_ram_style == "ultra":
+        # Keep byte-enables for UltraRAM inference (72-bit wide with 9-bit byte-write).
+        for data_mem in l2_cache.data_mems:
+            data_mem.attr = {("ram_style", "ultra")}
+    elif l2_cache_full_memory_we:
+        l2_cache = FullMemoryWE()(l2_cache)
+    soc.l2_cache = l2_cache
+    litedram_wb = soc.l2_cache.slave
+    soc.add_config("L2_SIZE", l2_cache_size)
+
+    # Wishbone Slave <--> LiteDRAM bridge.
+    soc.wishbone_bridge = LiteDRAMWishbone2Native(
+        wishbone     = litedram_wb,
+        port         = port,
+        base_address = soc.bus.regions["main_ram"].origin
+    )
+
+# DRAM Interleaver ---------------------------------------------------------------------------------
+
+# Spreads a linear Wishbone region over several LiteDRAM cores every granularity bytes: address bits
+# selecting the channel are removed from the address presented to the channel, which is then offset
+# by offset bytes (to use a range of the channels not already exposed in other regions).
+
+class LiteDRAMInterleaver(LiteXModule):
+    def __init__(self, ports, size, granularity=4096, data_width=32, offset=0):
+        from litedram.frontend.wishbone import LiteDRAMWishbone2Native
+
+        nports = len(ports)
+        k = log2_int(nports)
+        g = log2_int(granularity//(data_width//8))
+        w = log2_int(size//(data_width//8))
+        assert g + k <= w
+        self.bus = bus = wishbone.Interface(data_width=data_width)
+
+        # # #
+
+        slaves = []
+        for n, port in enumerate(ports):
+            wb_channel = wishbone.Interface(data_width=data_width)
+            wb_local   = wishbone.Interface(data_width=data_width)
+            wb_port    = wishbone.Interface(data_width=port.data_width)
+            fields     = [wb_channel.adr[:g], wb_channel.adr[g+k:w]]
+            self.comb += [
+                wb_channel.connect(wb_local, omit={"adr"}),
+                wb_local.adr.eq(Cat(*[f for f in fields if len(f)]) + offset//(data_width//8)),
+            ]
+            self.submodules += wishbone.Converter(wb_local, wb_port)
+            self.submodules += LiteDRAMWishbone2Native(wishbone=wb_port, port=port)
+            slaves.append((lambda a, n=n: a[g:g+k] == n, wb_channel))
+        self.decoder = wishbone.Decoder(bus, slaves, register=True)
+
+def check_dram_interleave(parser, nchannels, granularity, data_width=32):
+    """Check DRAM interleaving arguments of a target (parser error when not supported)."""
+    if (nchannels < 2) or (granularity == 0):
+        return
+    if nchannels & (nchannels - 1):
+        parser.error(f"DRAM interleaving requires a power of 2 number of channels (got {nchannels}), "
+                      "use --ddram-interleave=0 to disable it.")
+    if (granularity & (granularity - 1)) or (granularity < data_width//8):
+        parser.error(f"--ddram-interleave must be a power of 2 >= {data_width//8} (got {granularity}).")
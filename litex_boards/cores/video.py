@@ -0,0 +1,270 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Video helpers shared by the HDMI/DVI targets.
+#
+# Timings: Targets expose a --video-timings option restricted to the timings whose pixel clock is
+# supported by the board's Video PHY/fabric (ex 5x pixel clock of the HDMI serializers), the video
+# PLL being configured from the selected timings' pixel clock.
+#
+# FrameBuffer: The framebuffer DMA is sized from the timings: Pixel format reduced to RGB565 when
+# the DRAM can't sustain RGB888 pixels and DMA FIFO sized to a few lines of pixels (with LiteX's
+# 64KiB default as minimum).
+#
+# Page Flipping: With 2/3 buffers (double/triple buffering), the framebuffer displays the page
+# selected by software, the flip being applied at the end of the frame (vsync) to avoid tearing.
+# LiteX's VideoFrameBuffer is reused, its DMA reading the DRAM through a pager adding the offset
+# of the page. Pages are at LiteX's framebuffer location when they fit in main_ram there, else at
+# the end of main_ram.
+# The DMA uses a dedicated read-only LiteDRAM port, a deeper prefetch FIFO and fetches in bursts:
+# LiteDRAM's crossbar keeping a bank granted to a port as long as the port requests it, bursts
+# are not interleaved with CPU accesses, limiting underruns when the CPU is loading the DRAM.
+# Underruns (pixels not available when displayed) are counted in the underruns CSR.
+
+from migen import *
+from migen.genlib.cdc import MultiReg, BusSynchronizer
+
+from litex.gen import LiteXModule
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import stream
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.cores.video import video_timings
+from litex.soc.cores.video import VideoTimingGenerator, VideoFrameBuffer
+
+# Constants ----------------------------------------------------------------------------------------
+
+# Maximum share of the DRAM's peak bandwidth used by the framebuffer.
+video_framebuffer_max_dram_ratio = 0.8
+
+# Number of lines of pixels buffered in the framebuffer's DMA FIFO (without/with page flipping).
+video_framebuffer_fifo_lines      = 2
+video_framebuffer_flip_fifo_lines = 4
+
+# Minimum framebuffer's DMA FIFO depth (in bytes, LiteX's default).
+video_framebuffer_min_fifo_depth = 64*1024
+
+video_formats_bits = {
+    "rgb888" : 32,
+    "rgb565" : 16,
+}
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def video_timings_args(parser, default="800x600@60Hz", max_pix_clk=148.5e6):
+    """Add --video-timings argument to a target's parser (Timings up to max_pix_clk)."""
+    choices = [name for name, timings in video_timings.items() if timings["pix_clk"] <= max_pix_clk]
+    parser.add_target_argument("--video-timings", default=default, choices=choices, help="Video Timings.")
+
+def video_framebuffer_args(parser):
+    """Add --video-framebuffer-buffers argument to a target's parser."""
+    parser.add_target_argument("--video-framebuffer-buffers", default=1, type=int, choices=[1, 2, 3],
+        help="Video FrameBuffer buffers (2: Double/3: Triple buffering with page flip on VSync).")
+
+def video_framebuffer_config(timings, dram_bandwidth, fifo_lines=video_framebuffer_fifo_lines):
+    """Return the framebuffer's (format, fifo_depth) to sustain timings with dram_bandwidth (bytes/s)."""
+    hres    = int(timings.split("@")[0].split("x")[0])
+    pix_clk = video_timings[timings]["pix_clk"]
+    for format, bits in video_formats_bits.items():
+        if pix_clk*bits/8 <= video_framebuffer_max_dram_ratio*dram_bandwidth:
+            fifo_depth = max(2**(fifo_lines*hres*bits//8 - 1).bit_length(), video_framebuffer_min_fifo_depth)
+            return format, fifo_depth
+    raise ValueError(f"DRAM bandwidth ({dram_bandwidth/1e6:.0f}MB/s) too low for {timings} framebuffer.")
+
+# Video FrameBuffer Pager --------------------------------------------------------------------------
+
+class VideoFrameBufferPager(LiteXModule):
+    """Page flipping between a framebuffer's DMA (LiteDRAMDMAReader with CSRs, on dma_port) and the
+    DRAM port: npages pages of the DMA's length (page n at the DMA's base + n*length).
+
+    The page read is switched to the page CSR at the end of each frame (page_current reporting the
+    page being read) and reads are issued in bursts of burst words, once the DMA's FIFO (fifo_depth
+    words) has room for a full burst.
+    """
+    def __init__(self, dma, dma_port, dram_port, npages=2, fifo_depth=16, burst=None):
+        burst = burst or max(fifo_depth//4, 1)
+        assert burst <= fifo_depth
+        self._page         = CSRStorage(bits_for(npages - 1), description=f"""Page to display (0-{npages - 1}).\n
+            Applied at the end of the current frame (VSync).""")
+        self._page_current = CSRStatus(bits_for(npages - 1), description="Page currently displayed.")
+
+        # # #
+
+        shift  = log2_int(dram_port.data_width//8)
+        length = Signal(dram_port.address_width)
+        page   = Signal(bits_for(npages - 1))
+        self.comb += [
+            length.eq(dma._length.storage[shift:]),
+            self._page_current.status.eq(page),
+        ]
+        pages_offset = Array([n*length for n in range(npages)])
+
+        # Next page (Invalid pages ignored).
+        page_next = Signal(bits_for(npages - 1))
+        self.comb += If(self._page.storage < npages,
+            page_next.eq(self._page.storage)
+        ).Else(
+            page_next.eq(page)
+        )
+
+        # Page switched after the last word of the frame or when the DMA is disabled.
+        self.sync += If(~dma.enable | (dma_port.cmd.valid & dma_port.cmd.ready & dma_port.cmd.last),
+            page.eq(page_next)
+        )
+
+        # FIFO level (Requested words not yet consumed).
+        level = Signal(max=fifo_depth + 1)
+        self.sync += level.eq(level
+            + (dma_port.cmd.valid & dma_port.cmd.ready)
+            - (dma.source.valid & (dma.source.ready | ~dma.enable))
+        )
+
+        # FSM.
+        count = Signal(max=burst + 1)
+        self.fsm = fsm = ResetInserter()(FSM(reset_state="WAIT"))
+        self.comb += fsm.reset.eq(~dma.enable)
+        fsm.act("WAIT",
+            If(level <= (fifo_depth - burst),
+                NextValue(count, burst),
+                NextState("BURST")
+            )
+        )
+        fsm.act("BURST",
+            dma_port.cmd.connect(dram_port.cmd, omit={"addr"}),
+            dram_port.cmd.addr.eq(dma_port.cmd.addr + pages_offset[page]),
+            If(dram_port.cmd.valid & dram_port.cmd.ready,
+                NextValue(count, count - 1),
+                If(count == 1,
+                    NextState("WAIT")
+                )
+            )
+        )
+        self.comb += dram_port.rdata.connect(dma_port.rdata)
+
+# Video Page Flip FrameBuffer ----------------------------------------------------------------------
+
+class VideoPageFlipFrameBuffer(VideoFrameBuffer):
+    """LiteX's VideoFrameBuffer with nbuffers pages (see VideoFrameBufferPager) and underruns counter."""
+    def __init__(self, dram_port, hres=800, vres=600, base=0x00000000, nbuffers=2, fifo_depth=64*1024, clock_domain="sys", clock_faster_than_sys=False, format="rgb888"):
+        from litedram.common import LiteDRAMNativePort
+
+        # Video FrameBuffer (DMA on its own port, connected to the DRAM port through the pager).
+        dma_port = LiteDRAMNativePort("read", address_width=dram_port.address_width, data_width=dram_port.data_width)
+        VideoFrameBuffer.__init__(self, dma_port,
+            hres                  = hres,
+            vres                  = vres,
+            base                  = base,
+            fifo_depth            = fifo_depth,
+            clock_domain          = clock_domain,
+            clock_faster_than_sys = clock_faster_than_sys,
+            format                = format,
+        )
+
+        self._underruns = CSRStatus(32, description="Underruns Count (pixels not available when displayed).")
+
+        # # #
+
+        # Video Pager.
+        self.pager = VideoFrameBufferPager(self.dma, dma_port, dram_port,
+            npages     = nbuffers,
+            fifo_depth = fifo_depth//(dram_port.data_width//8),
+        )
+
+        # Underruns: Pixels to display not available, once the first frame has been synchronized.
+        if (dram_port.data_width > self.depth) and clock_faster_than_sys:
+            video_pipe_source = self.conv.source
+        else:
+            video_pipe_source = self.cdc.source
+        reset     = Signal()
+        synced    = Signal()
+        underruns = Signal(32)
+        self.specials += MultiReg(self.dma.fsm.reset, reset, clock_domain)
+        sync = getattr(self.sync, clock_domain)
+        sync += [
+            If(reset,
+                synced.eq(0)
+            ).Elif(video_pipe_source.valid & video_pipe_source.ready & video_pipe_source.last,
+                synced.eq(1)
+            ),
+            If(synced & self.vtg_sink.valid & self.source.de & ~self.source.valid,
+                underruns.eq(underruns + 1)
+            )
+        ]
+        # Counted in Video clock domain and synchronized to sys.
+        if clock_domain == "sys":
+            self.comb += self._underruns.status.eq(underruns)
+        else:
+            self.underruns_sync = BusSynchronizer(32, clock_domain, "sys")
+            self.comb += [
+                self.underruns_sync.i.eq(underruns),
+                self._underruns.status.eq(self.underruns_sync.o),
+            ]
+
+# Add Video FrameBuffer ----------------------------------------------------------------------------
+
+def add_video_framebuffer(soc, name="video_framebuffer", phy=None, timings="800x600@60Hz", clock_domain="sys", nbuffers=1):
+    """Add a Video FrameBuffer to the SoC (see SoC.add_video_framebuffer) with format/DMA FIFO sized to
+    sustain timings from the SoC's DRAM, with page flipping between nbuffers pages when nbuffers > 1."""
+    phy_settings   = soc.sdram.controller.settings.phy
+    dram_bandwidth = phy_settings.databits/8*phy_settings.nphases*soc.sys_clk_freq
+    if phy_settings.memtype != "SDR":
+        dram_bandwidth *= 2 # DDR.
+    if nbuffers == 1:
+        format, fifo_depth = video_framebuffer_config(timings, dram_bandwidth)
+        soc.add_video_framebuffer(name=name, phy=phy, timings=timings, clock_domain=clock_domain,
+            format     = format,
+            fifo_depth = fifo_depth)
+        return
+    format, fifo_depth = video_framebuffer_config(timings, dram_bandwidth,
+        fifo_lines = video_framebuffer_flip_fifo_lines)
+
+    # Video Timing Generator.
+    vtg = VideoTimingGenerator(default_video_timings=timings)
+    vtg = ClockDomainsRenamer(clock_domain)(vtg)
+    soc.add_module(name=f"{name}_vtg", module=vtg)
+
+    # Video FrameBuffer (Pages at base + n*page_size, on a dedicated read-only LiteDRAM port).
+    hres     = int(timings.split("@")[0].split("x")[0])
+    vres     = int(timings.split("@")[0].split("x")[1])
+    size     = nbuffers*hres*vres*video_formats_bits[format]//8
+    main_ram = soc.bus.regions["main_ram"]
+    base     = soc.mem_map.get(name, None)
+    if base is None:
+        # At LiteX's default location when the pages fit in main_ram there, else at the end of main_ram.
+        origin, region_size = 0x40c00000, max(0x800000, 2**(size - 1).bit_length())
+        if origin + size > main_ram.origin + main_ram.size:
+            origin      = (main_ram.origin + main_ram.size - size) & ~0xffff # 64KiB aligned.
+            region_size = main_ram.origin + main_ram.size - origin
+        soc.bus.add_region(name, SoCRegion(
+            origin = origin,
+            size   = region_size,
+            linker = True)
+        )
+        base = soc.bus.regions[name].origin
+    if (base < main_ram.origin) or (base - main_ram.origin + size > main_ram.size):
+        raise ValueError(f"Video FrameBuffer pages (0x{base:08x}-0x{base + size:08x}) don't fit in main_ram "
+                         f"(0x{main_ram.origin:08x}-0x{main_ram.origin + main_ram.size:08x}), reduce buffers or resolution.")
+    vfb = VideoPageFlipFrameBuffer(soc.sdram.crossbar.get_port(mode="read"),
+        hres                  = hres,
+        vres                  = vres,
+        base                  = base,
+        nbuffers              = nbuffers,
+        fifo_depth            = fifo_depth,
+        format                = format,
+        clock_domain          = clock_domain,
+        clock_faster_than_sys = vtg.video_timings["pix_clk"] >= soc.sys_clk_freq,
+    )
+    soc.add_module(name=name, module=vfb)
+
+    # Connect Video Timing Generator to Video FrameBuffer and Video FrameBuffer to Video PHY.
+    soc.comb += vtg.source.connect(vfb.vtg_sink)
+    soc.comb += vfb.source.connect(phy if isinstance(phy, stream.Endpoint) else phy.sink)
+
+    # Constants.
+    soc.add_constant("VIDEO_FRAMEBUFFER_BASE",     base)
+    soc.add_constant("VIDEO_FRAMEBUFFER_HRES",     hres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_VRES",     vres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_DEPTH",    vfb.depth)
+    soc.add_constant("VIDEO_FRAMEBUFFER_NBUFFERS", nbuffers)
@@ -29,6 +29,9 @@ from litedram.phy import usddrphy
 from litepcie.phy.usppciephy import USPPCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -62,8 +65,13 @@ class CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=150e6, ddram_channel=0,
-        with_led_chaser = True,
-        with_pcie       = False,
+        with_led_chaser  = True,
+        with_pcie        = False,
+        pcie_lanes       = 4,
+        pcie_dmas        = 1,
+        pcie_msi_type    = "msi",
+        pcie_irq_count   = 1,
+        pcie_irq_timeout = 0,
         **kwargs):
         platform = adi_adrv2crr_fmc.Platform()
 
@@ -80,22 +88,26 @@ class BaseSoC(SoCCore):
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 400e6)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT40A512M16(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
             assert self.csr_data_width == 32
 
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                speed = "gen3",
-                data_width = 128,
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                speed      = "gen3",
+                data_width = {4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -125,14 +137,26 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=adi_adrv2crr_fmc.Platform, description="LiteX SoC on ADI ADRV2CRR-FMC.")
-    parser.add_target_argument("--sys-clk-freq", default=150e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",     default=150e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",       default=4,     type=int,   help="PCIe lanes (4 or 8).", choices=[4, 8])
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",             help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq     = args.sys_clk_freq,
+        with_pcie        = args.with_pcie,
+        pcie_lanes       = args.pcie_lanes,
+        pcie_dmas        = args.pcie_dmas,
+        pcie_msi_type    = args.pcie_msi_type,
+        pcie_irq_count   = args.pcie_irq_count,
+        pcie_irq_timeout = args.pcie_irq_timeout,
+        l2_ways          = args.l2_ways,
         **parser.soc_argdict
     )
 
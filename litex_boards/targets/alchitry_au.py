@@ -11,6 +11,7 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import alchitry_au
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
@@ -69,10 +70,11 @@ class BaseSoC(SoCCore):
                 nphases          = 4,
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = AS4C128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -96,12 +98,14 @@ def main():
     parser.add_target_argument("--variant",         default="au",                 help="Board variant (au or au+).")
     parser.add_target_argument("--sys-clk-freq",    default=83.333e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash",  action="store_true",          help="Enable SPI Flash (MMAPed).")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         variant        = args.variant,
         sys_clk_freq   = args.sys_clk_freq,
         with_spi_flash = args.with_spi_flash,
+        l2_ways        = args.l2_ways,
         **parser.soc_argdict
     )
 
@@ -26,8 +26,7 @@
 #     --integrated-rom-size 32768 \
 #     --integrated-sram-size 4096
 #
-# # Video Framebuffer (double sdram speed to have enough bandwidth)
-# # Lower the fifo_depth in litex/litex/soc/cores/video.py "class VideoFrameBuffer" to 1024
+# # Video Framebuffer (double sdram speed to have enough bandwidth, RGB565 pixels)
 # ./alchitry_mojo.py \
 #     --build \
 #     --with-hdmi-shield \
@@ -37,7 +36,7 @@
 #     --sdram-rate 1:2
 #
 # litex> # Turn screen Red
-# litex> mem_write 0x40c00000 0xffff0000 307200
+# litex> mem_write 0x40c00000 0xf800f800 153600
 
 from migen import *
 
@@ -45,13 +44,15 @@ from litex.gen import LiteXModule
 
 from litex.build.io import DDROutput
 from litex_boards.platforms import alchitry_mojo
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.video import add_video_framebuffer, video_timings_args, video_framebuffer_args
 
 from litex.soc.interconnect.csr import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
 from litex.soc.cores.clock import *
-from litex.soc.cores.video import VideoS6HDMIPHY
+from litex.soc.cores.video import VideoS6HDMIPHY, video_timings
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT48LC32M8, SDRModule
@@ -60,7 +61,7 @@ from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1"):
+    def __init__(self, platform, sys_clk_freq, sdram_rate="1:1", pix_clk=25e6):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_hdmi   = ClockDomain()
@@ -81,8 +82,8 @@ class CRG(LiteXModule):
         self.comb += pll.reset.eq(~rst | ~avr_ready | self.rst)
         pll.register_clkin(clk50, 50e6)
         pll.create_clkout(self.cd_sys,    sys_clk_freq)
-        pll.create_clkout(self.cd_hdmi,   25e6,  margin=0)
-        pll.create_clkout(self.cd_hdmi5x, 125e6, margin=0)
+        pll.create_clkout(self.cd_hdmi,     pix_clk)
+        pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
         if sdram_rate == "1:2":
             pll.create_clkout(self.cd_sys2x,    2*sys_clk_freq)
             pll.create_clkout(self.cd_sys2x_ps, 2*sys_clk_freq, phase=90)
@@ -99,11 +100,13 @@ class BaseSoC(SoCCore):
         with_video_terminal    = False,
         with_video_framebuffer = False,
         with_video_colorbars   = False,
+        video_timing           = "640x480@60Hz",
+        video_buffers          = 1,
         **kwargs):
         platform = alchitry_mojo.Platform()
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = CRG(platform, sys_clk_freq, sdram_rate)
+        self.crg = CRG(platform, sys_clk_freq, sdram_rate, pix_clk=video_timings[video_timing]["pix_clk"])
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Alchitry Mojo", **kwargs)
@@ -123,21 +126,22 @@ class BaseSoC(SoCCore):
 
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.sdrphy,
                 module        = MT48LC32M8(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 1024)
+                l2_cache_size = kwargs.get("l2_size", 1024),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
         
         # HDMI Options -----------------------------------------------------------------------------
         if with_hdmi_shield and (with_video_colorbars or with_video_framebuffer or with_video_terminal):
             self.videophy = VideoS6HDMIPHY(platform.request("hdmi_out"), clock_domain="hdmi")
             if with_video_colorbars:
-                self.add_video_colorbars(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                self.add_video_colorbars(phy=self.videophy, timings=video_timing, clock_domain="hdmi")
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                self.add_video_terminal(phy=self.videophy, timings=video_timing, clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@60Hz", clock_domain="hdmi")
+                add_video_framebuffer(self, phy=self.videophy, timings=video_timing, clock_domain="hdmi", nbuffers=video_buffers)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -159,6 +163,9 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
+    video_timings_args(parser, default="640x480@60Hz", max_pix_clk=40e6) # Shared PLL/SDRAM bandwidth: Up to 800x600@60Hz.
+    video_framebuffer_args(parser)
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     # Note: baudrate is fixed because regardless of USB->TTL baud, the AVR <-> FPGA baudrate is
@@ -171,6 +178,9 @@ def main():
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_colorbars   = args.with_video_colorbars,
+        video_timing           = args.video_timings,
+        video_buffers          = args.video_framebuffer_buffers,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
 
@@ -28,6 +28,10 @@ from liteeth.phy import LiteEthS7PHYRGMII
 
 from litepcie.phy.s7pciephy import S7PCIEPHY
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import add_etherbone_burst
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -63,12 +67,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, *, device, toolchain="vivado", sys_clk_freq=100e6,
-        with_pcie      = False,
-        with_etherbone = False,
-        with_ethernet  = False,
-        eth_dynamic_ip = False,
-        eth_reset_time = "10e-3",
-        eth_ip         = "192.168.1.120",
+        with_pcie        = False,
+        pcie_dmas        = 1,
+        pcie_msi_type    = "msi",
+        pcie_irq_count   = 1,
+        pcie_irq_timeout = 0,
+        with_etherbone   = False,
+        etherbone_burst  = False,
+        with_ethernet    = False,
+        eth_dynamic_ip   = False,
+        eth_reset_time   = "10e-3",
+        eth_ip           = "192.168.1.120",
         **kwargs):
         platform = antmicro_artix_dc_scm.Platform(device=device, toolchain=toolchain)
 
@@ -84,10 +93,11 @@ class BaseSoC(SoCCore):
                 memtype      = "DDR3",
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
@@ -100,7 +110,10 @@ class BaseSoC(SoCCore):
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                if etherbone_burst:
+                    add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip)
+                else:
+                    self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets main_ethphy_eth_rx_clk_ibuf]")
 
@@ -109,7 +122,10 @@ class BaseSoC(SoCCore):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
         # Leds -------------------------------------------------------------------------------------
         self.leds = LedChaser(
@@ -121,18 +137,24 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=antmicro_artix_dc_scm.Platform, description="LiteX SoC on Artix DC-SCM.")
-    parser.add_target_argument("--flash",        action="store_true",       help="Flash bitstream.")
-    parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--device",       default="xc7a100tfgg484-1", choices=["xc7a100tfgg484-1", "xc7a15tfgg484-1"])
-    parser.add_target_argument("--with-pcie",    action="store_true",      help="Add PCIe.")
+    parser.add_target_argument("--flash",            action="store_true",       help="Flash bitstream.")
+    parser.add_target_argument("--sys-clk-freq",     default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--device",           default="xc7a100tfgg484-1", choices=["xc7a100tfgg484-1", "xc7a15tfgg484-1"])
+    parser.add_target_argument("--with-pcie",        action="store_true",      help="Add PCIe.")
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,  help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",            help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,  help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",        action="store_true",    help="Add Ethernet.")
-    ethopts.add_argument("--with-etherbone",       action="store_true",    help="Add EtherBone.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--eth-reset-time", default="10e-3",        help="Duration of Ethernet PHY reset.")
-    parser.add_target_argument("--with-sdram",     action="store_true",    help="Add SDRAM.")
-    parser.add_target_argument("--with-emmc",      action="store_true",    help="Add eMMC.")
+    ethopts.add_argument("--with-ethernet",         action="store_true",    help="Add Ethernet.")
+    ethopts.add_argument("--with-etherbone",        action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--etherbone-burst", action="store_true",    help="Use Etherbone with 255-word records and back-to-back Wishbone accesses (faster block accesses).")
+    parser.add_target_argument("--eth-ip",          default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-dynamic-ip",  action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--eth-reset-time",  default="10e-3",        help="Duration of Ethernet PHY reset.")
+    parser.add_target_argument("--with-sdram",      action="store_true",    help="Add SDRAM.")
+    parser.add_target_argument("--with-emmc",       action="store_true",    help="Add eMMC.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -142,11 +164,17 @@ def main():
         device                 = args.device,
         sys_clk_freq           = args.sys_clk_freq,
         with_pcie              = args.with_pcie,
+        pcie_dmas              = args.pcie_dmas,
+        pcie_msi_type          = args.pcie_msi_type,
+        pcie_irq_count         = args.pcie_irq_count,
+        pcie_irq_timeout       = args.pcie_irq_timeout,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_burst        = args.etherbone_burst,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         eth_reset_time         = args.eth_reset_time,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
 
@@ -14,6 +14,9 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import antmicro_datacenter_ddr4_test_board
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import add_etherbone_burst
+from litex_boards.cores.video import add_video_framebuffer, video_timings_args, video_framebuffer_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -21,7 +24,7 @@ from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
-from litex.soc.cores.video import VideoS7HDMIPHY
+from litex.soc.cores.video import VideoS7HDMIPHY, video_timings
 
 from litedram.modules import MTA18ASF2G72PZ
 from litedram.phy.s7ddrphy import A7DDRPHY
@@ -38,7 +41,7 @@ from litespi.opcodes import SpiNorFlashOpCodes as Codes
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, iodelay_clk_freq, with_video_pll=False):
+    def __init__(self, platform, sys_clk_freq, iodelay_clk_freq, with_video_pll=False, pix_clk=40e6):
         self.cd_sys       = ClockDomain()
         self.cd_sys2x     = ClockDomain()
         self.cd_sys4x     = ClockDomain()
@@ -67,8 +70,8 @@ class _CRG(LiteXModule):
         if with_video_pll:
             self.video_pll = video_pll = S7MMCM(speedgrade=-1)
             video_pll.register_clkin(clk100, 100e6)
-            video_pll.create_clkout(self.cd_hdmi,   40e6)
-            video_pll.create_clkout(self.cd_hdmi5x, 5*40e6)
+            video_pll.create_clkout(self.cd_hdmi,   pix_clk)
+            video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
 
 # BaseSoC ------------------------------------------------------------------------------------------
@@ -77,6 +80,7 @@ class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=100e6, iodelay_clk_freq=200e6,
             with_ethernet          = False,
             with_etherbone         = False,
+            etherbone_burst        = False,
             eth_ip                 = "192.168.1.50",
             eth_reset_time         = "10e-3",
             eth_dynamic_ip         = False,
@@ -88,12 +92,18 @@ class BaseSoC(SoCCore):
             with_led_chaser        = True,
             with_video_terminal    = False,
             with_video_framebuffer = False,
+            video_timing           = "800x600@60Hz",
+            video_buffers          = 1,
             **kwargs):
         platform = antmicro_datacenter_ddr4_test_board.Platform()
 
         # CRG --------------------------------------------------------------------------------------
         with_video_pll = (with_video_terminal or with_video_framebuffer)
-        self.crg = _CRG(platform, sys_clk_freq, iodelay_clk_freq=iodelay_clk_freq, with_video_pll=with_video_pll)
+        self.crg = _CRG(platform, sys_clk_freq,
+            iodelay_clk_freq = iodelay_clk_freq,
+            with_video_pll   = with_video_pll,
+            pix_clk          = video_timings[video_timing]["pix_clk"]
+        )
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on data center test board", **kwargs)
@@ -106,10 +116,11 @@ class BaseSoC(SoCCore):
                 sys_clk_freq     = sys_clk_freq,
                 is_rdimm         = True,
             )
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy                     = self.ddrphy,
                 module                  = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_size           = kwargs.get("l2_size"),
+                l2_cache_ways           = kwargs.get("l2_ways", 1),
                 l2_cache_min_data_width = 256,
                 size                    = 0x40000000,
             )
@@ -137,7 +148,10 @@ class BaseSoC(SoCCore):
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                if etherbone_burst:
+                    add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip)
+                else:
+                    self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
         # UartBone ---------------------------------------------------------------------------------
         if with_uartbone:
@@ -153,9 +167,9 @@ class BaseSoC(SoCCore):
         if with_video_terminal or with_video_framebuffer:
             self.videophy = VideoS7HDMIPHY(platform.request("hdmi_out"), clock_domain="hdmi")
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                self.add_video_terminal(phy=self.videophy, timings=video_timing, clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                add_video_framebuffer(self, phy=self.videophy, timings=video_timing, clock_domain="hdmi", nbuffers=video_buffers)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -197,6 +211,7 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",                action="store_true",    help="Add Ethernet.")
     ethopts.add_argument("--with-etherbone",               action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--etherbone-burst",        action="store_true",    help="Use Etherbone with 255-word records and back-to-back Wishbone accesses (faster block accesses).")
     parser.add_target_argument("--eth-ip",                 default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-dynamic-ip",         action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--eth-reset-time",         default="10e-3",        help="Duration of Ethernet PHY reset.")
@@ -206,7 +221,10 @@ def main():
     parser.add_target_argument("--with-uartbone",          action="store_true",    help="Add UartBone on 2nd serial.")
     parser.add_target_argument("--with-video-terminal",    action="store_true",    help="Enable Video Terminal (HDMI).")
     parser.add_target_argument("--with-video-framebuffer", action="store_true",    help="Enable Video Framebuffer (HDMI).")
+    video_timings_args(parser, max_pix_clk=125e6) # Kintex7 -1: 5x pixel clock limited to 625MHz (BUFG/OSERDESE2).
+    video_framebuffer_args(parser)
     parser.add_target_argument("--with-spi-flash",         action="store_true",    help="Enable SPI Flash (MMAPed).")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -216,6 +234,7 @@ def main():
         iodelay_clk_freq       = args.iodelay_clk_freq,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
+        etherbone_burst        = args.etherbone_burst,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_hyperram          = args.with_hyperram,
@@ -225,6 +244,9 @@ def main():
         with_spi_flash         = args.with_spi_flash,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timing           = args.video_timings,
+        video_buffers          = args.video_framebuffer_buffers,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -10,6 +10,8 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import antmicro_lpddr4_test_board
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import add_etherbone_burst
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -49,6 +51,7 @@ class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=50e6, iodelay_clk_freq=200e6,
             with_ethernet   = False,
             with_etherbone  = False,
+            etherbone_burst = False,
             eth_ip          = "192.168.1.50",
             eth_dynamic_ip  = False,
             with_hyperram   = False,
@@ -71,10 +74,11 @@ class BaseSoC(SoCCore):
                 iodelay_clk_freq = iodelay_clk_freq,
                 sys_clk_freq     = sys_clk_freq,
             )
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy                     = self.ddrphy,
                 module                  = MT53E256M16D1(sys_clk_freq, "1:8"),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_size           = kwargs.get("l2_size"),
+                l2_cache_ways           = kwargs.get("l2_ways", 1),
                 l2_cache_min_data_width = 256,
             )
 
@@ -100,7 +104,10 @@ class BaseSoC(SoCCore):
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                if etherbone_burst:
+                    add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip)
+                else:
+                    self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
         # Jtagbone ---------------------------------------------------------------------------------
         if with_jtagbone:
@@ -127,12 +134,14 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",          action="store_true",    help="Add Ethernet.")
     ethopts.add_argument("--with-etherbone",         action="store_true",    help="Add EtherBone.")
+    parser.add_target_argument("--etherbone-burst",  action="store_true",    help="Use Etherbone with 255-word records and back-to-back Wishbone accesses (faster block accesses).")
     parser.add_target_argument("--eth-ip",           default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-dynamic-ip",   action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-hyperram",    action="store_true",    help="Add HyperRAM.")
     parser.add_target_argument("--with-sdcard",      action="store_true",    help="Add SDCard.")
     parser.add_target_argument("--with-jtagbone",    action="store_true",    help="Add JTAGBone.")
     parser.add_target_argument("--with-uartbone",    action="store_true",    help="Add UartBone on 2nd serial.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -142,12 +151,14 @@ def main():
         iodelay_clk_freq  = args.iodelay_clk_freq,
         with_ethernet     = args.with_ethernet,
         with_etherbone    = args.with_etherbone,
+        etherbone_burst   = args.etherbone_burst,
         eth_ip            = args.eth_ip,
         eth_dynamic_ip    = args.eth_dynamic_ip,
         with_hyperram     = args.with_hyperram,
         with_sdcard       = args.with_sdcard,
         with_jtagbone     = args.with_jtagbone,
         with_uartbone     = args.with_uartbone,
+        l2_ways           = args.l2_ways,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -13,6 +13,7 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import arduino_mkrvidor4000
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.cores.clock import Cyclone10LPPLL
 from litex.soc.integration.soc_core import *
@@ -62,10 +63,11 @@ class BaseSoC(SoCCore):
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
             self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.sdrphy,
                 module        = AS4C4M16(sys_clk_freq, "1:1"), # Alliance Memory AS4C4M16
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
 # Build --------------------------------------------------------------------------------------------
@@ -74,10 +76,12 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=arduino_mkrvidor4000.Platform, description="LiteX SoC on MKR Vidor 4000.")
     parser.add_argument("--sys-clk-freq", default=48e6, type=float, help="System clock frequency.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
+        l2_ways      = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
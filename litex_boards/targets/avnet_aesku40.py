@@ -14,6 +14,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import avnet_aesku40
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -97,11 +98,12 @@ class BaseSoC(SoCCore):
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = EDY4016A(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
 
@@ -111,10 +113,12 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=avnet_aesku40.Platform, description="LiteX SoC on AESKU40.")
     parser.add_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
+        l2_ways      = args.l2_ways,
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
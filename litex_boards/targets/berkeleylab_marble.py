@@ -29,6 +29,8 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import berkeleylab_marble
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import add_udp_streamer
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -70,11 +72,13 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        with_rts_reset  = False,
-        with_led_chaser = True,
-        spd_dump        = None,
+        with_ethernet       = False,
+        with_etherbone      = False,
+        with_udp_streamer   = False,
+        udp_streamer_dst_ip = "192.168.1.100",
+        with_rts_reset      = False,
+        with_led_chaser     = True,
+        spd_dump            = None,
         **kwargs):
         platform = berkeleylab_marble.Platform()
 
@@ -105,16 +109,17 @@ class BaseSoC(SoCCore):
                 ram_module = MT8JTF12864(sys_clk_freq, "1:4")  # KC705 chip, 1 GB
                 print('DDR3: No spd data specified, falling back to MT8JTF12864')
 
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy    = self.ddrphy,
                 module = ram_module,
                 # size=0x40000000,  # Limit its size to 1 GB
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1),
                 with_bist     = kwargs.get("with_bist", False)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_udp_streamer:
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -131,6 +136,10 @@ class BaseSoC(SoCCore):
         if with_etherbone:
             self.add_etherbone(phy=self.ethphy, buffer_depth=255)
 
+        # UDP Streamer -----------------------------------------------------------------------------
+        if with_udp_streamer:
+            add_udp_streamer(self, phy=self.ethphy, dst_ip=udp_streamer_dst_ip)
+
         # System I2C (behing multiplexer) ----------------------------------------------------------
         i2c_pads = platform.request('i2c_fpga')
         self.i2c = I2CMaster(i2c_pads)
@@ -146,20 +155,29 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=berkeleylab_marble.Platform, description="LiteX SoC on BerkeleyLab Marble.")
-    parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
-    parser.add_target_argument("--with-rts-reset", action="store_true",       help="Connect UART RTS line to sys_clk reset.")
-    parser.add_target_argument("--with-bist",      action="store_true",       help="Add DDR3 BIST Generator/Checker.")
-    parser.add_target_argument("--spd-dump",                                  help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
+    parser.add_target_argument("--sys-clk-freq",        default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",       action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--with-etherbone",      action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--with-udp-streamer",   action="store_true",       help="Enable UDP Streamer (DRAM <-> UDP, alone or with Etherbone).")
+    parser.add_target_argument("--udp-streamer-dst-ip", default="192.168.1.100",   help="UDP Streamer destination IP address (also configurable through CSR).")
+    parser.add_target_argument("--with-rts-reset",      action="store_true",       help="Connect UART RTS line to sys_clk reset.")
+    parser.add_target_argument("--with-bist",           action="store_true",       help="Add DDR3 BIST Generator/Checker.")
+    parser.add_target_argument("--spd-dump",                                       help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
+    if args.with_ethernet and args.with_udp_streamer:
+        parser.error("--with-udp-streamer can't be used with --with-ethernet (PHY can't be shared with the CPU's Ethernet MAC), use it alone or with --with-etherbone.")
+
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        with_bist      = args.with_bist,
-        spd_dump       = args.spd_dump,
+        sys_clk_freq        = args.sys_clk_freq,
+        with_ethernet       = args.with_ethernet,
+        with_etherbone      = args.with_etherbone,
+        with_udp_streamer   = args.with_udp_streamer,
+        udp_streamer_dst_ip = args.udp_streamer_dst_ip,
+        with_bist           = args.with_bist,
+        spd_dump            = args.spd_dump,
+        l2_ways             = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
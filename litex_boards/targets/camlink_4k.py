@@ -12,6 +12,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import camlink_4k
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -85,10 +86,11 @@ class BaseSoC(SoCCore):
                 platform.request("ddram"),
                 sys_clk_freq=sys_clk_freq)
             self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41K64M16(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Leds -------------------------------------------------------------------------------------
@@ -104,11 +106,13 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=camlink_4k.Platform, description="LiteX SoC on Cam Link 4K.")
     parser.add_target_argument("--sys-clk-freq", default=81e6, type=float, help="System clock frequency.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         toolchain    = args.toolchain,
+        l2_ways      = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -48,6 +48,8 @@ from litex.gen import LiteXModule
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import colorlight_5a_75b, colorlight_5a_75e
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import add_udp_streamer, add_etherbone_burst
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -116,13 +118,16 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, board, revision, sys_clk_freq=60e6, toolchain="trellis",
-        with_ethernet    = False,
-        with_etherbone   = False,
-        eth_ip           = "192.168.1.50",
-        eth_phy          = 0,
-        with_led_chaser  = True,
-        use_internal_osc = False,
-        sdram_rate       = "1:1",
+        with_ethernet       = False,
+        with_etherbone      = False,
+        etherbone_burst     = False,
+        eth_ip              = "192.168.1.50",
+        eth_phy             = 0,
+        with_udp_streamer   = False,
+        udp_streamer_dst_ip = "192.168.1.100",
+        with_led_chaser     = True,
+        use_internal_osc    = False,
+        sdram_rate          = "1:1",
         **kwargs):
         board = board.lower()
         assert board in ["5a-75b", "5a-75e"]
@@ -131,7 +136,7 @@ class BaseSoC(SoCCore):
         elif board == "5a-75e":
             platform = colorlight_5a_75e.Platform(revision=revision, toolchain=toolchain)
 
-        if board == "5a-75e" and revision == "6.0" and (with_etherbone or with_ethernet):
+        if board == "5a-75e" and revision == "6.0" and (with_etherbone or with_ethernet or with_udp_streamer):
             assert use_internal_osc, "You cannot use the 25MHz clock as system clock since it is provided by the Ethernet PHY and will stop during PHY reset."
 
         # CRG --------------------------------------------------------------------------------------
@@ -155,16 +160,17 @@ class BaseSoC(SoCCore):
                 sdram_cls  = M12L64322A
             else:
                 sdram_cls  = M12L16161A
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy                     = self.sdrphy,
                 module                  = sdram_cls(sys_clk_freq, sdram_rate),
-                l2_cache_size           = kwargs.get("l2_size", 8192),
+                l2_cache_size           = kwargs.get("l2_size"),
+                l2_cache_ways           = kwargs.get("l2_ways", 1),
                 l2_cache_full_memory_we = False,
 
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_udp_streamer:
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
@@ -172,7 +178,14 @@ class BaseSoC(SoCCore):
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, data_width=32)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=32)
+                if etherbone_burst:
+                    add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip, data_width=32)
+                else:
+                    self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=32)
+
+        # UDP Streamer -----------------------------------------------------------------------------
+        if with_udp_streamer:
+            add_udp_streamer(self, phy=self.ethphy, ip_address=eth_ip, dst_ip=udp_streamer_dst_ip)
 
         # Leds -------------------------------------------------------------------------------------
         # Disable leds when serial is used.
@@ -190,23 +203,34 @@ def main():
     parser.add_target_argument("--revision",          default="7.0",            help="Board revision (6.0, 6.1, 7.0 or 8.0).")
     parser.add_target_argument("--sys-clk-freq",      default=60e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",           action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",          action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",            default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-phy",           default=0, type=int,    help="Ethernet PHY (0 or 1).")
-    parser.add_target_argument("--use-internal-osc",  action="store_true",    help="Use internal oscillator.")
-    parser.add_target_argument("--sdram-rate",        default="1:1",          help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    ethopts.add_argument("--with-ethernet",             action="store_true",     help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",            action="store_true",     help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-burst",     action="store_true",     help="Use Etherbone with 255-word records and back-to-back Wishbone accesses (faster block accesses).")
+    parser.add_target_argument("--eth-ip",              default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-phy",             default=0, type=int,     help="Ethernet PHY (0 or 1).")
+    parser.add_target_argument("--with-udp-streamer",   action="store_true",     help="Enable UDP Streamer (DRAM <-> UDP, alone or with Etherbone).")
+    parser.add_target_argument("--udp-streamer-dst-ip", default="192.168.1.100", help="UDP Streamer destination IP address (also configurable through CSR).")
+    parser.add_target_argument("--use-internal-osc",    action="store_true",     help="Use internal oscillator.")
+    parser.add_target_argument("--sdram-rate",          default="1:1",           help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
+    if args.with_ethernet and args.with_udp_streamer:
+        parser.error("--with-udp-streamer can't be used with --with-ethernet (PHY can't be shared with the CPU's Ethernet MAC), use it alone or with --with-etherbone.")
+
     soc = BaseSoC(board=args.board, revision=args.revision,
-        sys_clk_freq     = args.sys_clk_freq,
-        toolchain        = args.toolchain,
-        with_ethernet    = args.with_ethernet,
-        with_etherbone   = args.with_etherbone,
-        eth_ip           = args.eth_ip,
-        eth_phy          = args.eth_phy,
-        use_internal_osc = args.use_internal_osc,
-        sdram_rate       = args.sdram_rate,
+        sys_clk_freq        = args.sys_clk_freq,
+        toolchain           = args.toolchain,
+        with_ethernet       = args.with_ethernet,
+        with_etherbone      = args.with_etherbone,
+        etherbone_burst     = args.etherbone_burst,
+        eth_ip              = args.eth_ip,
+        eth_phy             = args.eth_phy,
+        with_udp_streamer   = args.with_udp_streamer,
+        udp_streamer_dst_ip = args.udp_streamer_dst_ip,
+        use_internal_osc    = args.use_internal_osc,
+        sdram_rate          = args.sdram_rate,
+        l2_ways             = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
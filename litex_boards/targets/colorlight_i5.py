@@ -13,11 +13,13 @@ from litex.gen import LiteXModule
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import colorlight_i5
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.video import add_video_framebuffer, video_timings_args, video_framebuffer_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
-from litex.soc.cores.video import VideoHDMIPHY
+from litex.soc.cores.video import VideoHDMIPHY, video_timings
 from litex.soc.cores.led import LedChaser
 
 from litex.soc.interconnect.csr import *
@@ -30,7 +32,7 @@ from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, use_internal_osc=False, with_usb_pll=False, with_video_pll=False, sdram_rate="1:1"):
+    def __init__(self, platform, sys_clk_freq, use_internal_osc=False, with_usb_pll=False, with_video_pll=False, pix_clk=40e6, sdram_rate="1:1"):
         self.rst    = Signal()
         self.cd_sys = ClockDomain()
         if sdram_rate == "1:2":
@@ -84,8 +86,8 @@ class _CRG(LiteXModule):
             video_pll.register_clkin(clk, clk_freq)
             self.cd_hdmi   = ClockDomain()
             self.cd_hdmi5x = ClockDomain()
-            video_pll.create_clkout(self.cd_hdmi,    40e6, margin=0)
-            video_pll.create_clkout(self.cd_hdmi5x, 200e6, margin=0)
+            video_pll.create_clkout(self.cd_hdmi,     pix_clk)
+            video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
         # SDRAM clock
         sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
@@ -105,6 +107,8 @@ class BaseSoC(SoCCore):
         sdram_rate             = "1:1",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timing           = "800x600@60Hz",
+        video_buffers          = 1,
         **kwargs):
         board = board.lower()
         assert board in ["i5", "i9"]
@@ -117,6 +121,7 @@ class BaseSoC(SoCCore):
             use_internal_osc = use_internal_osc,
             with_usb_pll     = with_usb_pll,
             with_video_pll   = with_video_pll,
+            pix_clk          = video_timings[video_timing]["pix_clk"],
             sdram_rate       = sdram_rate
         )
 
@@ -141,10 +146,11 @@ class BaseSoC(SoCCore):
         if not self.integrated_main_ram_size:
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"))
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.sdrphy,
                 module        = M12L64322A(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
@@ -176,9 +182,9 @@ class BaseSoC(SoCCore):
         if with_video_terminal or with_video_framebuffer:
             self.videophy = VideoHDMIPHY(platform.request("gpdi"), clock_domain="hdmi")
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                self.add_video_terminal(phy=self.videophy, timings=video_timing, clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                add_video_framebuffer(self, phy=self.videophy, timings=video_timing, clock_domain="hdmi", nbuffers=video_buffers)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -202,6 +208,9 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    video_timings_args(parser, max_pix_clk=80e6) # ECP5: 5x pixel clock limited to 400MHz (ODDRX1F).
+    video_framebuffer_args(parser)
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(board=args.board, revision=args.revision,
@@ -216,6 +225,9 @@ def main():
         sdram_rate             = args.sdram_rate,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timing           = args.video_timings,
+        video_buffers          = args.video_framebuffer_buffers,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
     soc.platform.add_extension(colorlight_i5._sdcard_pmod_io)
@@ -24,6 +24,8 @@ from litex.soc.integration.builder import *
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -41,7 +43,7 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=125e6, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=125e6, with_pcie=False, pcie_dmas=1, pcie_msi_type="msi", pcie_irq_count=1, pcie_irq_timeout=0, **kwargs):
         platform = decklink_intensity_pro_4k.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -56,21 +58,32 @@ class BaseSoC(SoCCore):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=decklink_intensity_pro_4k.Platform, description="LiteX SoC Blackmagic Decklink Intensity Pro 4K.")
-    parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",     default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",             help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie | True, # FIXME: Always enable PCIe for now.
+        sys_clk_freq     = args.sys_clk_freq,
+        with_pcie        = args.with_pcie | True, # FIXME: Always enable PCIe for now.
+        pcie_dmas        = args.pcie_dmas,
+        pcie_msi_type    = args.pcie_msi_type,
+        pcie_irq_count   = args.pcie_irq_count,
+        pcie_irq_timeout = args.pcie_irq_timeout,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -30,6 +30,10 @@ from litedram.phy import s7ddrphy
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie, add_pcie_dram_dma
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.sata import add_sata, sata_args, check_sata_args, sata_phy_data_width
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -74,7 +78,15 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCMini):
     def __init__(self, sys_clk_freq=100e6,
         with_pcie              = False,
+        pcie_dmas              = 1,
+        pcie_msi_type          = "msi",
+        pcie_irq_count         = 1,
+        pcie_irq_timeout       = 0,
+        with_pcie_dram_dma     = False,
         with_sata              = False,
+        sata_gen               = "gen2",
+        sata_data_width        = None,
+        with_sata_streamer     = False,
         with_video_terminal    = False,
         with_video_framebuffer = False,
         **kwargs):
@@ -95,10 +107,11 @@ class BaseSoC(SoCMini):
                 memtype        = "DDR3",
                 nphases        = 4,
                 sys_clk_freq   = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # PCIe -------------------------------------------------------------------------------------
@@ -106,7 +119,14 @@ class BaseSoC(SoCMini):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
+
+            # PCIe <-> DRAM DMAs (Native LiteDRAM ports, not going through the main bus).
+            if with_pcie_dram_dma:
+                add_pcie_dram_dma(self, ndmas=pcie_dmas)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -132,12 +152,12 @@ class BaseSoC(SoCMini):
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = ClockSignal("sata_refclk"),
                 pads       = platform.request("pcie2sata"),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
-                data_width = 16)
+                data_width = sata_phy_data_width(sata_gen, sata_data_width))
 
             # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            add_sata(self, phy=self.sata_phy, mode="read+write", with_dram_streamer=with_sata_streamer)
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
             self.videophy = VideoS7GTPHDMIPHY(platform.request("hdmi_out"),
@@ -155,22 +175,42 @@ class BaseSoC(SoCMini):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=decklink_mini_4k.Platform, description="LiteX SoC Blackmagic Decklink Mini 4K.")
-    parser.add_target_argument("--sys-clk-freq", default=148.5e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",       default=148.5e6, type=float, help="System clock frequency.")
     pcieopts = parser.target_group.add_mutually_exclusive_group()
-    pcieopts.add_argument("--with-pcie",   action="store_true", help="Enable PCIe support.")
-    parser.add_target_argument("--driver", action="store_true", help="Generate PCIe driver.")
+    pcieopts.add_argument("--with-pcie",               action="store_true",         help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",          default=1,       type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",      default="msi",               help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",     default=1,       type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout",   default=0,       type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--with-pcie-dram-dma", action="store_true",         help="Connect PCIe DMAs directly to DRAM (through native LiteDRAM ports).")
+    parser.add_target_argument("--driver",             action="store_true",         help="Generate PCIe driver.")
     viopts = parser.target_group.add_mutually_exclusive_group()
-    viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
-    viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
-    pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
+    viopts.add_argument("--with-video-terminal",       action="store_true",         help="Enable Video Terminal (HDMI).")
+    viopts.add_argument("--with-video-framebuffer",    action="store_true",         help="Enable Video Framebuffer (HDMI).")
+    pcieopts.add_argument("--with-sata",               action="store_true",         help="Enable SATA support (over PCIe2SATA).")
+    parser.add_target_argument("--with-sata-streamer", action="store_true",         help="Enable SATA <-> DRAM streaming (Descriptors queue, no CPU copies).")
+    sata_args(parser)
+    l2_cache_args(parser)
     args = parser.parse_args()
+    if args.with_sata_streamer and not args.with_sata:
+        parser.error("--with-sata-streamer requires --with-sata.")
+    check_sata_args(parser, args)
 
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         with_pcie              = args.with_pcie,
+        pcie_dmas              = args.pcie_dmas,
+        pcie_msi_type          = args.pcie_msi_type,
+        pcie_irq_count         = args.pcie_irq_count,
+        pcie_irq_timeout       = args.pcie_irq_timeout,
+        with_pcie_dram_dma     = args.with_pcie_dram_dma,
         with_sata              = args.with_sata,
+        sata_gen               = "gen" + args.sata_gen,
+        sata_data_width        = args.sata_data_width,
+        with_sata_streamer     = args.with_sata_streamer,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
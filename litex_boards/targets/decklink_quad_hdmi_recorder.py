@@ -9,6 +9,9 @@
 # Build/Load bitstream:
 # ./decklink_quad_hdmi_recorder.py --csr-csv=csr.csv --build --load
 #
+# With PCIe Gen3 X8 (Without DRAM, see FIXME in PCIe section):
+# ./decklink_quad_hdmi_recorder.py --with-pcie --pcie-lanes=8 --integrated-main-ram-size=0x100 --driver --build --load
+#
 # Use:
 # litex_server --jtag --jtag-config=openocd_xc7_ft232.cfg
 # litex_term crossover
@@ -20,6 +23,7 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import decklink_quad_hdmi_recorder
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -60,7 +64,7 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=200e6, with_pcie=False, pcie_lanes=4, **kwargs):
+    def __init__(self, sys_clk_freq=200e6, with_pcie=False, pcie_lanes=4, pcie_dmas=1, **kwargs):
         platform = decklink_quad_hdmi_recorder.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -80,15 +84,18 @@ class BaseSoC(SoCCore):
                 memtype          = "DDR3",
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41J256M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # PCIe -------------------------------------------------------------------------------------
         # FIXME: Does not seem to be working when also enabling DRAM. Has been tested succesfully by
-        # disabling DRAM with --integrated-main-ram-size=0x100.
+        # disabling DRAM with --integrated-main-ram-size=0x100. sys <-> PCIe crossings are already done
+        # by the PHY (AsyncFIFOs/MultiRegs) and the clocks declared asynchronous by add_pcie, so this
+        # still has to be investigated on hardware.
         if with_pcie:
             data_width = {
                 4 : 128,
@@ -98,10 +105,7 @@ class BaseSoC(SoCCore):
                 speed      = "gen3",
                 data_width = data_width,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
-            # False Paths (FIXME: Improve integration).
-            platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks sys_clk] -to [get_clocks pcie_clk_1]")
-            platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks pcie_clk_1] -to [get_clocks sys_clk]")
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -110,12 +114,18 @@ def main():
     parser = LiteXArgumentParser(platform=decklink_quad_hdmi_recorder.Platform, description="LiteX SoC on Blackmagic Decklink Quad HDMI Recorder.")
     parser.add_target_argument("--sys-clk-freq", default=200e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",   default=4,     type=int,   help="PCIe lanes (4 or 8).", choices=[4, 8])
+    parser.add_target_argument("--pcie-dmas",    default=1,     type=int,   help="Number of PCIe DMA channels.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         with_pcie    = args.with_pcie,
+        pcie_lanes   = args.pcie_lanes,
+        pcie_dmas    = args.pcie_dmas,
+        l2_ways      = args.l2_ways,
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
@@ -17,6 +17,8 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import digilent_arty
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import add_udp_streamer, add_etherbone_burst
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -71,15 +73,18 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", toolchain="vivado", sys_clk_freq=100e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_jtagbone   = True,
-        with_spi_flash  = False,
-        with_buttons    = False,
-        with_pmod_gpio  = False,
+        with_ethernet       = False,
+        with_etherbone      = False,
+        etherbone_burst     = False,
+        eth_ip              = "192.168.1.50",
+        eth_dynamic_ip      = False,
+        with_udp_streamer   = False,
+        udp_streamer_dst_ip = "192.168.1.100",
+        with_led_chaser     = True,
+        with_jtagbone       = True,
+        with_spi_flash      = False,
+        with_buttons        = False,
+        with_pmod_gpio      = False,
         **kwargs):
         platform = digilent_arty.Platform(variant=variant, toolchain=toolchain)
 
@@ -103,21 +108,29 @@ class BaseSoC(SoCCore):
                 memtype        = "DDR3",
                 nphases        = 4,
                 sys_clk_freq   = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41K128M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        if with_ethernet or with_etherbone or with_udp_streamer:
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                if etherbone_burst:
+                    add_etherbone_burst(self, phy=self.ethphy, ip_address=eth_ip)
+                else:
+                    self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+
+        # UDP Streamer -----------------------------------------------------------------------------
+        if with_udp_streamer:
+            add_udp_streamer(self, phy=self.ethphy, ip_address=eth_ip, dst_ip=udp_streamer_dst_ip)
 
         # Jtagbone ---------------------------------------------------------------------------------
         if with_jtagbone:
@@ -160,10 +173,13 @@ def main():
     parser.add_target_argument("--variant",      default="a7-35",           help="Board variant (a7-35 or a7-100).")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",        action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",       action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",         default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--eth-dynamic-ip", action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
+    ethopts.add_argument("--with-ethernet",             action="store_true",     help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",            action="store_true",     help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-burst",     action="store_true",     help="Use Etherbone with 255-word records and back-to-back Wishbone accesses (faster block accesses).")
+    parser.add_target_argument("--eth-ip",              default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-dynamic-ip",      action="store_true",     help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--with-udp-streamer",   action="store_true",     help="Enable UDP Streamer (DRAM <-> UDP, alone or with Etherbone).")
+    parser.add_target_argument("--udp-streamer-dst-ip", default="192.168.1.100", help="UDP Streamer destination IP address (also configurable through CSR).")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",       action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",           action="store_true", help="Enable SDCard support.")
@@ -171,21 +187,29 @@ def main():
     parser.add_target_argument("--with-jtagbone",  action="store_true", help="Enable JTAGbone support.")
     parser.add_target_argument("--with-spi-flash", action="store_true", help="Enable SPI Flash (MMAPed).")
     parser.add_target_argument("--with-pmod-gpio", action="store_true", help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    l2_cache_args(parser)
     args = parser.parse_args()
 
+    if args.with_ethernet and args.with_udp_streamer:
+        parser.error("--with-udp-streamer can't be used with --with-ethernet (PHY can't be shared with the CPU's Ethernet MAC), use it alone or with --with-etherbone.")
+
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        variant        = args.variant,
-        toolchain      = args.toolchain,
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_jtagbone  = args.with_jtagbone,
-        with_spi_flash = args.with_spi_flash,
-        with_pmod_gpio = args.with_pmod_gpio,
+        variant             = args.variant,
+        toolchain           = args.toolchain,
+        sys_clk_freq        = args.sys_clk_freq,
+        with_ethernet       = args.with_ethernet,
+        with_etherbone      = args.with_etherbone,
+        etherbone_burst     = args.etherbone_burst,
+        eth_ip              = args.eth_ip,
+        eth_dynamic_ip      = args.eth_dynamic_ip,
+        with_udp_streamer   = args.with_udp_streamer,
+        udp_streamer_dst_ip = args.udp_streamer_dst_ip,
+        with_jtagbone       = args.with_jtagbone,
+        with_spi_flash      = args.with_spi_flash,
+        with_pmod_gpio      = args.with_pmod_gpio,
+        l2_ways             = args.l2_ways,
         **parser.soc_argdict
     )
     if args.sdcard_adapter == "numato":
@@ -18,6 +18,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import digilent_atlys
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
@@ -173,10 +174,11 @@ class BaseSoC(SoCCore):
                 self.ddrphy.clk4x_wr_strb.eq(self.crg.clk4x_wr_strb),
                 self.ddrphy.clk4x_rd_strb.eq(self.crg.clk4x_rd_strb),
             ]
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT47H64M16(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1),
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
@@ -213,11 +215,13 @@ def main():
     parser.add_target_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
 
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
+        l2_ways        = args.l2_ways,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -11,6 +11,8 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import digilent_nexys4ddr
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.video import add_video_framebuffer, video_framebuffer_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc import SoCRegion
@@ -59,6 +61,7 @@ class BaseSoC(SoCCore):
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_buffers          = 1,
         **kwargs):
         platform = digilent_nexys4ddr.Platform()
 
@@ -74,10 +77,11 @@ class BaseSoC(SoCCore):
                 memtype      = "DDR2",
                 nphases      = 2,
                 sys_clk_freq = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT47H64M16(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
@@ -96,7 +100,7 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="vga")
+                add_video_framebuffer(self, phy=self.videophy, timings="800x600@60Hz", clock_domain="vga", nbuffers=video_buffers)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -119,6 +123,8 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (VGA).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (VGA).")
+    video_framebuffer_args(parser)
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -127,6 +133,8 @@ def main():
         with_etherbone         = args.with_etherbone,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_buffers          = args.video_framebuffer_buffers,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
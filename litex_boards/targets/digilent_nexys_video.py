@@ -11,11 +11,14 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import digilent_nexys_video
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.sata import add_sata, sata_args, check_sata_args, sata_phy_data_width
+from litex_boards.cores.video import add_video_framebuffer, video_timings_args, video_framebuffer_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
-from litex.soc.cores.video import VideoS7HDMIPHY
+from litex.soc.cores.video import VideoS7HDMIPHY, video_timings
 from litex.soc.cores.led import LedChaser
 
 from litedram.modules import MT41K256M16
@@ -26,7 +29,7 @@ from liteeth.phy.s7rgmii import LiteEthPHYRGMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, toolchain="vivado", with_sata_pll_refclk=False, with_video_pll=False):
+    def __init__(self, platform, sys_clk_freq, toolchain="vivado", with_sata_pll_refclk=False, with_video_pll=False, pix_clk=40e6):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys4x     = ClockDomain()
@@ -69,8 +72,8 @@ class _CRG(LiteXModule):
             self.video_pll = video_pll = S7MMCM(speedgrade=-1)
             video_pll.reset.eq(~rst_n | self.rst)
             video_pll.register_clkin(clk100, 100e6)
-            video_pll.create_clkout(self.cd_hdmi,   40e6)
-            video_pll.create_clkout(self.cd_hdmi5x, 5*40e6)
+            video_pll.create_clkout(self.cd_hdmi,   pix_clk)
+            video_pll.create_clkout(self.cd_hdmi5x, 5*pix_clk)
 
 # BaseSoC ------------------------------------------------------------------------------------------
 
@@ -78,10 +81,12 @@ class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", sys_clk_freq=100e6,
         with_ethernet          = False,
         with_led_chaser        = True,
-        with_sata              = False, sata_gen="gen2", with_sata_pll_refclk=False,
+        with_sata              = False, sata_gen="gen2", sata_data_width=None, with_sata_pll_refclk=False, with_sata_streamer=False,
         vadj                   = "1.2V",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timing           = "800x600@60Hz",
+        video_buffers          = 1,
         **kwargs):
         platform = digilent_nexys_video.Platform(toolchain=toolchain)
 
@@ -89,7 +94,8 @@ class BaseSoC(SoCCore):
         with_video_pll = (with_video_terminal or with_video_framebuffer)
         self.crg = _CRG(platform, sys_clk_freq, toolchain,
             with_sata_pll_refclk = with_sata_pll_refclk,
-            with_video_pll       = with_video_pll
+            with_video_pll       = with_video_pll,
+            pix_clk              = video_timings[video_timing]["pix_clk"]
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -101,10 +107,11 @@ class BaseSoC(SoCCore):
                 memtype      = "DDR3",
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41K256M16(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
@@ -139,18 +146,18 @@ class BaseSoC(SoCCore):
                 pads       = platform.request("fmc2sata"),
                 gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
-                data_width = 16)
+                data_width = sata_phy_data_width(sata_gen, sata_data_width))
 
             # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            add_sata(self, phy=self.sata_phy, mode="read+write", with_dram_streamer=with_sata_streamer)
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal or with_video_framebuffer:
             self.videophy = VideoS7HDMIPHY(platform.request("hdmi_out"), clock_domain="hdmi")
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                self.add_video_terminal(phy=self.videophy, timings=video_timing, clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                add_video_framebuffer(self, phy=self.videophy, timings=video_timing, clock_domain="hdmi", nbuffers=video_buffers)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -173,13 +180,20 @@ def main():
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-sata",            action="store_true", help="Enable SATA support (over FMCRAID).")
-    parser.add_target_argument("--sata-gen",             default="2",         help="SATA Gen.", choices=["1", "2"])
+    parser.add_target_argument("--with-sata-streamer",   action="store_true", help="Enable SATA <-> DRAM streaming (Descriptors queue, no CPU copies).")
+    sata_args(parser)
     parser.add_target_argument("--with-sata-pll-refclk", action="store_true", help="Generate SATA RefClk from PLL.")
     parser.add_target_argument("--vadj",                 default="1.2V",      help="FMC VADJ value.", choices=["1.2V", "1.8V", "2.5V", "3.3V"])
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    video_timings_args(parser, max_pix_clk=92.8e6) # Artix7 -1: 5x pixel clock limited to 464MHz (BUFG).
+    video_framebuffer_args(parser)
+    l2_cache_args(parser)
     args = parser.parse_args()
+    if args.with_sata_streamer and not args.with_sata:
+        parser.error("--with-sata-streamer requires --with-sata.")
+    check_sata_args(parser, args)
 
     soc = BaseSoC(
         toolchain              = args.toolchain,
@@ -187,10 +201,15 @@ def main():
         with_ethernet          = args.with_ethernet,
         with_sata              = args.with_sata,
         sata_gen               = "gen" + args.sata_gen,
+        sata_data_width        = args.sata_data_width,
         with_sata_pll_refclk   = args.with_sata_pll_refclk,
+        with_sata_streamer     = args.with_sata_streamer,
         vadj                   = args.vadj,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timing           = args.video_timings,
+        video_buffers          = args.video_framebuffer_buffers,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
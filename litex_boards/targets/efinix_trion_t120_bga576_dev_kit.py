@@ -20,6 +20,7 @@ from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.interconnect import axi
+from litex.soc.interconnect import wishbone
 
 from liteeth.phy.trionrgmii import LiteEthPHYRGMII
 
@@ -41,16 +42,85 @@ class _CRG(LiteXModule):
         pll.register_clkin(clk40, 40e6)
         pll.create_clkout(self.cd_sys, sys_clk_freq, with_reset=True, name="axi_clk")
 
+# DRAM AXI Adapter ---------------------------------------------------------------------------------
+
+# The Trion DDR controller targets have a single address channel (AADDR, ATYPE, ...) shared by reads
+# and writes: AR/AW requests are arbitrated (round-robin when both are valid) and the selection is
+# held until the request is accepted, so full AXI masters with concurrent reads/writes can be used.
+
+class _DRAMAXIAdapter(LiteXModule):
+    def __init__(self, axi_port, io):
+        rw_n         = Signal() # Selected request (1: Read, 0: Write).
+        pending      = Signal() # Request presented but not yet accepted.
+        pending_rw_n = Signal()
+        last_rw_n    = Signal()
+
+        # # #
+
+        # Pseudo AW/AR Channels Arbitration.
+        self.comb += [
+            If(pending,
+                rw_n.eq(pending_rw_n)
+            ).Elif(axi_port.ar.valid & axi_port.aw.valid,
+                rw_n.eq(~last_rw_n)
+            ).Else(
+                rw_n.eq(axi_port.ar.valid)
+            )
+        ]
+        self.sync += [
+            pending.eq(io.avalid & ~io.aready),
+            pending_rw_n.eq(rw_n),
+            If(io.avalid & io.aready,
+                last_rw_n.eq(rw_n)
+            )
+        ]
+
+        self.comb += [
+            # Pseudo AW/AR Channels.
+            io.atype.eq(~rw_n),
+            io.aaddr.eq(  Mux(rw_n,   axi_port.ar.addr,  axi_port.aw.addr)),
+            io.aid.eq(    Mux(rw_n,     axi_port.ar.id,    axi_port.aw.id)),
+            io.alen.eq(   Mux(rw_n,    axi_port.ar.len,   axi_port.aw.len)),
+            io.asize.eq(  Mux(rw_n,   axi_port.ar.size,  axi_port.aw.size)),
+            io.aburst.eq( Mux(rw_n,  axi_port.ar.burst, axi_port.aw.burst)),
+            io.alock.eq(  Mux(rw_n,   axi_port.ar.lock,  axi_port.aw.lock)),
+            io.avalid.eq( Mux(rw_n,  axi_port.ar.valid, axi_port.aw.valid)),
+            axi_port.aw.ready.eq(~rw_n & io.aready),
+            axi_port.ar.ready.eq( rw_n & io.aready),
+
+            # R Channel.
+            axi_port.r.id.eq(io.rid),
+            axi_port.r.data.eq(io.rdata),
+            axi_port.r.last.eq(io.rlast),
+            axi_port.r.resp.eq(io.rresp),
+            axi_port.r.valid.eq(io.rvalid),
+            io.rready.eq(axi_port.r.ready),
+
+            # W Channel.
+            io.wid.eq(axi_port.w.id),
+            io.wstrb.eq(axi_port.w.strb),
+            io.wdata.eq(axi_port.w.data),
+            io.wlast.eq(axi_port.w.last),
+            io.wvalid.eq(axi_port.w.valid),
+            axi_port.w.ready.eq(io.wready),
+
+            # B Channel.
+            axi_port.b.id.eq(io.bid),
+            axi_port.b.valid.eq(io.bvalid),
+            io.bready.eq(axi_port.b.ready),
+        ]
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6,
-        with_spi_flash  = False,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_phy         = 0,
-        eth_ip          = "192.168.1.50",
-        with_led_chaser = True,
+        with_spi_flash     = False,
+        with_ethernet      = False,
+        with_etherbone     = False,
+        eth_phy            = 0,
+        eth_ip             = "192.168.1.50",
+        with_led_chaser    = True,
+        with_dram_axi_full = False,
         **kwargs):
         platform = efinix_trion_t120_bga576_dev_kit.Platform()
 
@@ -254,6 +324,7 @@ calc_result = design.auto_calc_pll_clock("dram_pll", {"CLKOUT0_FREQ": "400.0"})
 
             # DRAM AXI-Ports.
             # --------------
+            self.dram_axi = []
             for n, data_width in {
                 0: 256, # target0: 256-bit.
                 1: 128, # target1: 128-bit
@@ -285,47 +356,35 @@ calc_result = design.auto_calc_pll_clock("dram_pll", {"CLKOUT0_FREQ": "400.0"})
                     Subsignal("alen",    Pins(8)),
                     Subsignal("wlast",   Pins(1)),
                 )]
-                io   = platform.add_iface_ios(ios)
-                rw_n = axi_port.ar.valid
-                self.comb += [
-                    # Pseudo AW/AR Channels.
-                    io.atype.eq(~rw_n),
-                    io.aaddr.eq(  Mux(rw_n,   axi_port.ar.addr,  axi_port.aw.addr)),
-                    io.aid.eq(    Mux(rw_n,     axi_port.ar.id,    axi_port.aw.id)),
-                    io.alen.eq(   Mux(rw_n,    axi_port.ar.len,   axi_port.aw.len)),
-                    io.asize.eq(  Mux(rw_n,   axi_port.ar.size,  axi_port.aw.size)),
-                    io.aburst.eq( Mux(rw_n,  axi_port.ar.burst, axi_port.aw.burst)),
-                    io.alock.eq(  Mux(rw_n,   axi_port.ar.lock,  axi_port.aw.lock)),
-                    io.avalid.eq( Mux(rw_n,  axi_port.ar.valid, axi_port.aw.valid)),
-                    axi_port.aw.ready.eq(~rw_n & io.aready),
-                    axi_port.ar.ready.eq( rw_n & io.aready),
-
-                    # R Channel.
-                    axi_port.r.id.eq(io.rid),
-                    axi_port.r.data.eq(io.rdata),
-                    axi_port.r.last.eq(io.rlast),
-                    axi_port.r.resp.eq(io.rresp),
-                    axi_port.r.valid.eq(io.rvalid),
-                    io.rready.eq(axi_port.r.ready),
-
-                    # W Channel.
-                    io.wid.eq(axi_port.w.id),
-                    io.wstrb.eq(axi_port.w.strb),
-                    io.wdata.eq(axi_port.w.data),
-                    io.wlast.eq(axi_port.w.last),
-                    io.wvalid.eq(axi_port.w.valid),
-                    axi_port.w.ready.eq(io.wready),
-
-                    # B Channel.
-                    axi_port.b.id.eq(io.bid),
-                    axi_port.b.valid.eq(io.bvalid),
-                    io.bready.eq(axi_port.b.ready),
-                ]
-
-                # Connect AXI interface to the main bus of the SoC.
-                axi_lite_port = axi.AXILiteInterface(data_width=data_width, address_width=28)
-                self.submodules += axi.AXILite2AXI(axi_lite_port, axi_port)
-                self.bus.add_slave(f"target{n}", axi_lite_port, SoCRegion(origin=0x4000_0000 + 0x1000_0000*n, size=0x1000_0000)) # 256MB.
+                io = platform.add_iface_ios(ios)
+                self.add_module(name=f"dram_axi{n}_adapter", module=_DRAMAXIAdapter(axi_port, io))
+                self.dram_axi.append(axi_port)
+
+            # Full AXI: target0 connected to the main bus of the SoC (burst-capable with
+            # --bus-standard=axi, adapted by the SoC when required) with optional L2 Cache; target1
+            # (self.dram_axi[1]) is left free for streaming/DMA masters, concurrent with target0.
+            if with_dram_axi_full:
+                l2_size = kwargs.get("l2_size", 8192)
+                if l2_size != 0:
+                    # L2 Cache: 256-bit lines, refilled/written back in single 256-bit AXI beats.
+                    l2_size = 2**log2_int(max(l2_size, 2*256//8), need_pow2=False)
+                    self.l2_cache = wishbone.Cache(
+                        cachesize = l2_size//4,
+                        master    = wishbone.Interface(data_width=self.bus.data_width, address_width=self.bus.address_width, addressing="word"),
+                        slave     = wishbone.Interface(data_width=256, address_width=32, addressing="word"),
+                        reverse   = False)
+                    self.submodules += axi.Wishbone2AXI(self.l2_cache.slave, self.dram_axi[0], base_address=0x4000_0000)
+                    self.bus.add_slave("target0", self.l2_cache.master, SoCRegion(origin=0x4000_0000, size=0x1000_0000)) # 256MB.
+                    self.add_config("L2_SIZE", l2_size)
+                else:
+                    self.bus.add_slave("target0", self.dram_axi[0], SoCRegion(origin=0x4000_0000, size=0x1000_0000)) # 256MB.
+
+            # AXI-Lite: Single-beat accesses, both targets connected to the main bus of the SoC.
+            else:
+                for n, axi_port in enumerate(self.dram_axi):
+                    axi_lite_port = axi.AXILiteInterface(data_width=axi_port.data_width, address_width=28)
+                    self.submodules += axi.AXILite2AXI(axi_lite_port, axi_port)
+                    self.bus.add_slave(f"target{n}", axi_lite_port, SoCRegion(origin=0x4000_0000 + 0x1000_0000*n, size=0x1000_0000)) # 256MB.
 
         # Use DRAM's target0 port as Main Ram  -----------------------------------------------------
         self.bus.add_region("main_ram", SoCRegion(
@@ -342,6 +401,7 @@ def main():
     parser.add_target_argument("--flash",          action="store_true",      help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=75e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash", action="store_true",      help="Enable SPI Flash (MMAPed).")
+    parser.add_target_argument("--dram-axi-full",  action="store_true",      help="Connect LPDDR3 as full AXI (burst-capable with --bus-standard=axi and --l2-size=0).")
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true",    help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",    help="Enable Etherbone support.")
@@ -350,12 +410,13 @@ def main():
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_spi_flash = args.with_spi_flash,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        eth_phy        = args.eth_phy,
+        sys_clk_freq       = args.sys_clk_freq,
+        with_spi_flash     = args.with_spi_flash,
+        with_ethernet      = args.with_ethernet,
+        with_etherbone     = args.with_etherbone,
+        eth_ip             = args.eth_ip,
+        eth_phy            = args.eth_phy,
+        with_dram_axi_full = args.dram_axi_full,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -41,6 +41,8 @@ from litex.soc.cores.clock import *
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -63,7 +65,7 @@ class CRG(LiteXModule):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=125e6, with_pcie=False, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=125e6, with_pcie=False, pcie_dmas=1, pcie_msi_type="msi", pcie_irq_count=1, pcie_irq_timeout=0, with_led_chaser=True, **kwargs):
         platform = fairwaves_xtrx.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -79,7 +81,10 @@ class BaseSoC(SoCCore):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x2"),
                 data_width = 64,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
             # ICAP (For FPGA reload over PCIe).
             from litex.soc.cores.icap import ICAP
@@ -105,15 +110,23 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=fairwaves_xtrx.Platform, description="LiteX SoC on Fairwaves XTRX.")
-    parser.add_target_argument("--flash",           action="store_true",       help="Flash bitstream.")
-    parser.add_target_argument("--sys-clk-freq",    default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",       action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",          action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--flash",            action="store_true",       help="Flash bitstream.")
+    parser.add_target_argument("--sys-clk-freq",     default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",             help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq     = args.sys_clk_freq,
+        with_pcie        = args.with_pcie,
+        pcie_dmas        = args.pcie_dmas,
+        pcie_msi_type    = args.pcie_msi_type,
+        pcie_irq_count   = args.pcie_irq_count,
+        pcie_irq_timeout = args.pcie_irq_timeout,
         **parser.soc_argdict
     )
     builder  = Builder(soc, **parser.builder_argdict)
@@ -29,6 +29,9 @@ from liteeth.phy.rmii import LiteEthPHYRMII
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -62,9 +65,13 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", sys_clk_freq=100e6,
-        with_pcie       = False,
-        with_ethernet   = False,
-        with_led_chaser = True,
+        with_pcie        = False,
+        pcie_dmas        = 1,
+        pcie_msi_type    = "msi",
+        pcie_irq_count   = 1,
+        pcie_irq_timeout = 0,
+        with_ethernet    = False,
+        with_led_chaser  = True,
         **kwargs):
         platform = kosagi_netv2.Platform(variant=variant)
 
@@ -80,10 +87,11 @@ class BaseSoC(SoCCore):
                 memtype      = "DDR3",
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = K4B2G1646F(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
@@ -98,7 +106,10 @@ class BaseSoC(SoCCore):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -111,21 +122,31 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=kosagi_netv2.Platform, description="LiteX SoC on NeTV2.")
-    parser.add_target_argument("--variant",       default="a7-35",           help="Board variant (a7-35 or a7-100).")
-    parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet", action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--with-pcie",     action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",        action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--variant",          default="a7-35",           help="Board variant (a7-35 or a7-100).")
+    parser.add_target_argument("--sys-clk-freq",     default=100e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",    action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",             help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        variant       = args.variant,
-        sys_clk_freq  = args.sys_clk_freq,
-        with_ethernet = args.with_ethernet,
-        with_pcie     = args.with_pcie,
+        variant          = args.variant,
+        sys_clk_freq     = args.sys_clk_freq,
+        with_ethernet    = args.with_ethernet,
+        with_pcie        = args.with_pcie,
+        pcie_dmas        = args.pcie_dmas,
+        pcie_msi_type    = args.pcie_msi_type,
+        pcie_irq_count   = args.pcie_irq_count,
+        pcie_irq_timeout = args.pcie_irq_timeout,
+        l2_ways          = args.l2_ways,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
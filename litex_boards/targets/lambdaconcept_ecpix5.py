@@ -12,12 +12,14 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import lambdaconcept_ecpix5
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.video import add_video_framebuffer, video_timings_args, video_framebuffer_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
-from litex.soc.cores.video import VideoDVIPHY
+from litex.soc.cores.video import VideoDVIPHY, video_timings
 from litex.soc.cores.bitbang import I2CMaster
 
 from litedram.modules import MT41K256M16
@@ -28,7 +30,7 @@ from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, with_video_pll=False, pix_clk=31.5e6):
         self.rst        = Signal()
         self.cd_init    = ClockDomain()
         self.cd_por     = ClockDomain()
@@ -72,6 +74,14 @@ class _CRG(LiteXModule):
             AsyncResetSynchronizer(self.cd_sys, ~pll.locked | self.reset),
         ]
 
+        # Video PLL.
+        if with_video_pll:
+            self.cd_dvi = ClockDomain()
+            self.video_pll = video_pll = ECP5PLL()
+            self.comb += video_pll.reset.eq(~por_done | ~rst_n | self.rst)
+            video_pll.register_clkin(clk100, 100e6)
+            video_pll.create_clkout(self.cd_dvi, pix_clk)
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
@@ -80,12 +90,18 @@ class BaseSoC(SoCCore):
         with_etherbone         = False,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timing           = "640x480@75Hz",
+        video_buffers          = 1,
         with_led_chaser        = True,
         **kwargs):
         platform = lambdaconcept_ecpix5.Platform(device=device, toolchain=toolchain)
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        with_video_pll = (with_video_terminal or with_video_framebuffer)
+        self.crg = _CRG(platform, sys_clk_freq,
+            with_video_pll = with_video_pll,
+            pix_clk        = video_timings[video_timing]["pix_clk"]
+        )
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on ECPIX-5", **kwargs)
@@ -97,10 +113,11 @@ class BaseSoC(SoCCore):
                 sys_clk_freq=sys_clk_freq)
             self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
             self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41K256M16(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
@@ -118,7 +135,7 @@ class BaseSoC(SoCCore):
         if with_video_terminal or with_video_framebuffer:
             # PHY + IT6613 I2C initialization.
             hdmi_pads = platform.request("hdmi")
-            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="init")
+            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="dvi")
             self.videoi2c = I2CMaster(hdmi_pads)
 
             # I2C initialization adapted from https://github.com/ultraembedded/ecpix-5
@@ -179,6 +196,7 @@ class BaseSoC(SoCCore):
             B_NODEF_PHASE   = (1<<2)
             B_PHASE_RESYNC  = (1<<3)
 
+            pclk_high = video_timings[video_timing]["pix_clk"] > 80e6
             self.videoi2c.add_init(addr=0x4c, init=[
                 # Reset.
                 (REG_TX_SW_RST, B_REF_RST | B_VID_RST | B_AUD_RST | B_AREF_RST | B_HDCP_RST),
@@ -187,12 +205,12 @@ class BaseSoC(SoCCore):
                 # Select DVI Mode.
                 (REG_TX_HDMI_MODE, B_TX_DVI_MODE),
 
-                # Configure Clks.
+                # Configure Clks (AFE gain enabled for Pixel Clks > 80MHz).
                 (REG_TX_SW_RST,       B_AUD_RST | B_AREF_RST | B_HDCP_RST),
                 (REG_TX_AFE_DRV_CTRL, B_AFE_DRV_RST),
-                (REG_TX_AFE_XP_CTRL,  0x18),
+                (REG_TX_AFE_XP_CTRL,  0x88 if pclk_high else 0x18),
                 (REG_TX_AFE_ISW_CTRL, 0x10),
-                (REG_TX_AFE_IP_CTRL,  0x0C),
+                (REG_TX_AFE_IP_CTRL,  0x84 if pclk_high else 0x0C),
 
                 # Enable Clks.
                 (REG_TX_AFE_DRV_CTRL, 0),
@@ -202,9 +220,9 @@ class BaseSoC(SoCCore):
             ])
             # Video Terminal/Framebuffer.
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                self.add_video_terminal(phy=self.videophy, timings=video_timing, clock_domain="dvi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                add_video_framebuffer(self, phy=self.videophy, timings=video_timing, clock_domain="dvi", nbuffers=video_buffers)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -232,7 +250,10 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    video_timings_args(parser, default="640x480@75Hz", max_pix_clk=148.5e6) # IT6613: Up to 165MHz Pixel Clk.
+    video_framebuffer_args(parser)
 
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -243,6 +264,9 @@ def main():
         with_etherbone         = args.with_etherbone,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timing           = args.video_timings,
+        video_buffers          = args.video_framebuffer_buffers,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
     if args.with_sdcard:
@@ -13,6 +13,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import lattice_ecp5_vip
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -102,10 +103,11 @@ class BaseSoC(SoCCore):
             sys_clk_freq=sys_clk_freq)
         self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
         self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
-        self.add_sdram("sdram",
+        add_sdram(self, "sdram",
             phy           = self.ddrphy,
             module        = MT41K64M16(sys_clk_freq, "1:2"), # Not entirely MT41J64M16 but similar and works(c)
-            l2_cache_size = kwargs.get("l2_size", 8192),
+            l2_cache_size = kwargs.get("l2_size"),
+            l2_cache_ways = kwargs.get("l2_ways", 1),
         )
 
         # Video ------------------------------------------------------------------------------------
@@ -189,11 +191,13 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=lattice_ecp5_vip.Platform, description="LiteX SoC on ECP5 Evaluation Board.")
     parser.add_target_argument("--sys-clk-freq", default=60e6, type=float, help="System clock frequency.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         toolchain    = args.toolchain,
         sys_clk_freq = args.sys_clk_freq,
+        l2_ways      = args.l2_ways,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -13,6 +13,8 @@ from litex.gen import LiteXModule
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import linsn_rv901t
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import add_etherbone_burst
 
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
@@ -51,6 +53,7 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6,
         with_ethernet   = False,
         with_etherbone  = False,
+        etherbone_burst = False,
         eth_phy         = 0,
         with_led_chaser = True,
         **kwargs):
@@ -65,10 +68,11 @@ class BaseSoC(SoCCore):
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
             self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.sdrphy,
                 module        = M12L64322A(sys_clk_freq, "1:1"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
@@ -80,7 +84,10 @@ class BaseSoC(SoCCore):
             if with_ethernet:
                 self.add_ethernet(phy=self.ethphy, with_timing_constraints=False)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, with_timing_constraints=False)
+                if etherbone_burst:
+                    add_etherbone_burst(self, phy=self.ethphy, with_timing_constraints=False)
+                else:
+                    self.add_etherbone(phy=self.ethphy, with_timing_constraints=False)
             # Timing Constraints.
             platform.add_period_constraint(platform.lookup_request("eth_clocks", eth_phy).rx, 1e9/125e6)
             platform.add_false_path_constraints(self.crg.cd_sys.clk, platform.lookup_request("eth_clocks", eth_phy).rx)
@@ -98,16 +105,20 @@ def main():
     parser = LiteXArgumentParser(platform=linsn_rv901t.Platform, description="LiteX SoC on Linsn RV901T.")
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-phy", default=0, type=int,  help="Ethernet PHY (0 or 1).")
+    ethopts.add_argument("--with-ethernet",         action="store_true", help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",        action="store_true", help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-burst", action="store_true", help="Use Etherbone with 255-word records and back-to-back Wishbone accesses (faster block accesses).")
+    parser.add_target_argument("--eth-phy",         default=0, type=int, help="Ethernet PHY (0 or 1).")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_phy        = int(args.eth_phy),
+        sys_clk_freq    = args.sys_clk_freq,
+        with_ethernet   = args.with_ethernet,
+        with_etherbone  = args.with_etherbone,
+        etherbone_burst = args.etherbone_burst,
+        eth_phy         = int(args.eth_phy),
+        l2_ways         = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -17,6 +17,7 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import machdyne_schoko
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.build.io import DDROutput
 
@@ -128,10 +129,11 @@ class BaseSoC(SoCCore):
                 sdrphy_cls = GENSDRPHY
 
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.sdrphy,
                 module        = W9825G6KH6(sys_clk_freq, sdram_rate),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # USB Host ---------------------------------------------------------------------------------
@@ -184,6 +186,7 @@ def main():
     parser.add_target_argument("--with-sdcard",     action="store_true",       help="Enable SDCard support.")
     parser.add_target_argument("--with-spi-sdcard", action="store_true",       help="Enable SPI-mode SDCard support.")
     parser.add_target_argument("--with-usb-host",   action="store_true",       help="Enable USB host support.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -191,6 +194,7 @@ def main():
         revision     = args.revision,
         device       = args.device,
         sys_clk_freq = args.sys_clk_freq,
+        l2_ways      = args.l2_ways,
         **parser.soc_argdict)
 
     if args.with_sdcard:
@@ -12,6 +12,7 @@ from migen import *
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import mnt_rkx7
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -95,11 +96,12 @@ class BaseSoC(SoCCore):
                 memtype      = "DDR3",
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = IS43TR16512B(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192), # TBD: is L2 really necessary?
+                l2_cache_size = kwargs.get("l2_size"), # TBD: is L2 really necessary?
+                l2_cache_ways = kwargs.get("l2_ways", 1),
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -208,6 +210,7 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", default=True, help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",               help="Enable Etherbone support.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -216,6 +219,7 @@ def main():
         with_etherbone = args.with_etherbone,
         with_spi_flash = args.with_spi_flash,
         with_usb_host  = args.with_usb_host,
+        l2_ways        = args.l2_ways,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
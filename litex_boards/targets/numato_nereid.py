@@ -27,6 +27,9 @@ from litedram.phy import s7ddrphy
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -53,7 +56,7 @@ class CRG(LiteXModule):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=100e6, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=100e6, with_pcie=False, pcie_dmas=1, pcie_msi_type="msi", pcie_irq_count=1, pcie_irq_timeout=0, **kwargs):
         platform = numato_nereid.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -69,11 +72,12 @@ class BaseSoC(SoCCore):
                 nphases          = 4,
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT8KTF51264(sys_clk_freq, "1:4", speedgrade="800"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # PCIe -------------------------------------------------------------------------------------
@@ -81,21 +85,34 @@ class BaseSoC(SoCCore):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=numato_nereid.Platform, description="LiteX SoC on Nereid.")
-    parser.add_target_argument("--sys-clk-freq", default=100e6,  type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",        help="Enable PCIe support.")
-    parser.add_target_argument("--driver",       action="store_true",        help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",     default=100e6,  type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",        action="store_true",        help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",        default=1,      type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",              help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,      type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,      type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",        help="Generate PCIe driver.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
-         sys_clk_freq = args.sys_clk_freq,
-         with_pcie    = args.with_pcie,
+         sys_clk_freq     = args.sys_clk_freq,
+         with_pcie        = args.with_pcie,
+         pcie_dmas        = args.pcie_dmas,
+         pcie_msi_type    = args.pcie_msi_type,
+         pcie_irq_count   = args.pcie_irq_count,
+         pcie_irq_timeout = args.pcie_irq_timeout,
+         l2_ways          = args.l2_ways,
          **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
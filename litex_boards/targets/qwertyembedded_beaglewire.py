@@ -14,6 +14,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import qwertyembedded_beaglewire
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.build.io import DDROutput
 
@@ -81,10 +82,11 @@ class BaseSoC(SoCCore):
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
             self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy                     = self.sdrphy,
                 module                  = MT48LC32M8(sys_clk_freq, "1:1"),
-                l2_cache_size           = kwargs.get("l2_size", 1024)
+                l2_cache_size           = kwargs.get("l2_size", 1024),
+                l2_cache_ways           = kwargs.get("l2_ways", 1)
             )
 
         # SPI Flash --------------------------------------------------------------------------------
@@ -112,11 +114,13 @@ def main():
     parser = LiteXArgumentParser(platform=qwertyembedded_beaglewire.Platform, description="LiteX SoC on Beaglewire.")
     parser.add_target_argument("--bios-flash-offset", default="0x60000",        help="BIOS offset in SPI Flash.")
     parser.add_target_argument("--sys-clk-freq",      default=50e6, type=float, help="System clock frequency.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
          bios_flash_offset = int(args.bios_flash_offset, 0),
          sys_clk_freq      = args.sys_clk_freq,
+         l2_ways           = args.l2_ways,
          **parser.soc_argdict
     )
     builder = Builder(soc,  **parser.builder_argdict)
@@ -14,6 +14,7 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import rcs_arctic_tern_bmc_card
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -118,10 +119,11 @@ class BaseSoC(SoCCore):
             sys_clk_freq=sys_clk_freq)
         self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
         self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
-        self.add_sdram("sdram",
+        add_sdram(self, "sdram",
             phy           = self.ddrphy,
             module        = MT41J256M16(sys_clk_freq, "1:2"), # Not MT41J256M16, but the AS4C256M16D3C in use has similar specifications
-            l2_cache_size = kwargs.get("l2_size", 8192),
+            l2_cache_size = kwargs.get("l2_size"),
+            l2_cache_ways = kwargs.get("l2_ways", 1),
         )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
@@ -161,6 +163,7 @@ def main():
     ethopts.add_argument("--with-ethernet",  action="store_true",    help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",    help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",   default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -169,6 +172,7 @@ def main():
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
+        l2_ways        = args.l2_ways,
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
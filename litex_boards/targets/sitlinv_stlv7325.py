@@ -31,6 +31,11 @@ from liteeth.phy import LiteEthPHY
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.ethernet import S7GTX10GBASERPHY
+from litex_boards.cores.sata import add_sata, add_sata_raid0, sata_args, check_sata_args, sata_raid0_args, sata_phy_data_width, sata_sfp_pads
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -61,15 +66,24 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        local_ip        = "192.168.1.50",
-        remote_ip       = "",
-        eth_dynamic_ip  = False,
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_sata       = False,
-        with_jtagbone   = True,
+        with_ethernet    = False,
+        with_etherbone   = False,
+        eth_phy          = "gmii",
+        local_ip         = "192.168.1.50",
+        remote_ip        = "",
+        eth_dynamic_ip   = False,
+        with_led_chaser  = True,
+        with_pcie        = False,
+        pcie_dmas        = 1,
+        pcie_msi_type    = "msi",
+        pcie_irq_count   = 1,
+        pcie_irq_timeout = 0,
+        with_sata        = False,
+        sata_gen         = "gen2",
+        sata_data_width  = None,
+        sata_raid0       = False,
+        sata_stripe      = 16,
+        with_jtagbone    = True,
         **kwargs):
         platform = sitlinv_stlv7325.Platform()
 
@@ -86,10 +100,11 @@ class BaseSoC(SoCCore):
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq,
             )
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT8JTF12864(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1),
             )
 
         # Jtagbone ---------------------------------------------------------------------------------
@@ -98,14 +113,28 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
-            self.ethphy = LiteEthPHY(
-                clock_pads = self.platform.request("eth_clocks", 0),
-                pads       = self.platform.request("eth", 0),
-                clk_freq   = self.clk_freq)
+            if eth_phy == "10gbase-r":
+                # RefClk, Generate 156.25MHz from PLL (clk100).
+                self.cd_eth_refclk = ClockDomain()
+                self.eth_pll = eth_pll = S7PLL(speedgrade=-2)
+                clk100 = platform.request("clk100")
+                eth_pll.register_clkin(clk100, 100e6)
+                eth_pll.create_clkout(self.cd_eth_refclk, 156.25e6, margin=0)
+                platform.add_period_constraint(clk100, 1e9/100e6)
+                platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-52]")
+
+                self.ethphy = S7GTX10GBASERPHY(ClockSignal("eth_refclk"),
+                    data_pads    = self.platform.request("sfp_a"),
+                    sys_clk_freq = self.clk_freq)
+            else:
+                self.ethphy = LiteEthPHY(
+                    clock_pads = self.platform.request("eth_clocks", 0),
+                    pads       = self.platform.request("eth", 0),
+                    clk_freq   = self.clk_freq)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=self.ethphy.dw)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy)
+                self.add_etherbone(phy=self.ethphy, data_width=self.ethphy.dw)
 
         if local_ip:
             local_ip = local_ip.split(".")
@@ -126,7 +155,10 @@ class BaseSoC(SoCCore):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
         # TODO verify / test
         # SATA -------------------------------------------------------------------------------------
@@ -140,16 +172,25 @@ class BaseSoC(SoCCore):
             sata_refclk = ClockSignal("sata_refclk")
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-52]")
 
-            # PHY
-            self.sata_phy = LiteSATAPHY(platform.device,
-                refclk     = sata_refclk,
-                pads       = platform.request("sata", 0),
-                gen        = "gen2",
-                clk_freq   = sys_clk_freq,
-                data_width = 16)
-
-            # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            # PHY/Core.
+            if not sata_raid0:
+                self.sata_phy = LiteSATAPHY(platform.device,
+                    refclk     = sata_refclk,
+                    pads       = platform.request("sata", 0),
+                    gen        = sata_gen,
+                    clk_freq   = sys_clk_freq,
+                    data_width = sata_phy_data_width(sata_gen, sata_data_width))
+                add_sata(self, phy=self.sata_phy, mode="read+write")
+            # PHYs/Cores (RAID-0: One per SFP cage, with SFP to SATA adapters).
+            else:
+                sata_phys = [LiteSATAPHY(platform.device,
+                    refclk     = sata_refclk,
+                    pads       = sata_sfp_pads(platform.request(f"sfp_{cage}")),
+                    gen        = sata_gen,
+                    clk_freq   = sys_clk_freq,
+                    data_width = sata_phy_data_width(sata_gen, sata_data_width),
+                    with_csr   = False) for cage in ["a", "b"]]
+                add_sata_raid0(self, phys=sata_phys, stripe_sectors=sata_stripe, mode="read+write")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -167,32 +208,55 @@ def main():
     parser = LiteXArgumentParser(platform=sitlinv_stlv7325.Platform, description="LiteX SoC on AliExpress STLV7325.")
     parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",         action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",        action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--remote-ip",       default="192.168.1.100",help="Remote IP address of TFTP server.")
-    parser.add_target_argument("--local-ip",        default="192.168.1.50", help="Local IP address.")
-    parser.add_target_argument("--eth-dynamic-ip",  action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
-    parser.add_target_argument("--with-pcie",       action="store_true",    help="Enable PCIe support.")
-    parser.add_target_argument("--driver",          action="store_true",    help="Generate PCIe driver.")
-    parser.add_target_argument("--with-sata",       action="store_true",    help="Enable SATA support.")
-    parser.add_target_argument("--with-jtagbone",   action="store_true",    help="Enable Jtagbone support.")
+    ethopts.add_argument("--with-ethernet",          action="store_true",    help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",         action="store_true",    help="Enable Etherbone support.")
+    parser.add_target_argument("--eth-phy",          default="gmii",         help="Ethernet PHY (gmii: Onboard PHY, 10gbase-r: SFP A).", choices=["gmii", "10gbase-r"])
+    parser.add_target_argument("--remote-ip",        default="192.168.1.100",help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--local-ip",         default="192.168.1.50", help="Local IP address.")
+    parser.add_target_argument("--eth-dynamic-ip",   action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--with-pcie",        action="store_true",    help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",        default=1, type=int,    help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",          help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1, type=int,    help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0, type=float,  help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",    help="Generate PCIe driver.")
+    parser.add_target_argument("--with-sata",        action="store_true",    help="Enable SATA support.")
+    sata_args(parser)
+    sata_raid0_args(parser)
+    parser.add_target_argument("--with-jtagbone",    action="store_true",    help="Enable Jtagbone support.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
+    l2_cache_args(parser)
     args = parser.parse_args()
+    if args.sata_raid0 and not args.with_sata:
+        parser.error("--sata-raid0 requires --with-sata.")
+    if (args.with_ethernet or args.with_etherbone) and (args.eth_phy == "10gbase-r") and args.sata_raid0:
+        parser.error("--eth-phy=10gbase-r and --sata-raid0 both use SFP A.")
+    check_sata_args(parser, args)
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        local_ip       = args.local_ip,
-        remote_ip      = args.remote_ip,
-        eth_dynamic_ip = args.eth_dynamic_ip,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
-        with_jtagbone  = args.with_jtagbone,
+        sys_clk_freq     = args.sys_clk_freq,
+        with_ethernet    = args.with_ethernet,
+        with_etherbone   = args.with_etherbone,
+        eth_phy          = args.eth_phy,
+        local_ip         = args.local_ip,
+        remote_ip        = args.remote_ip,
+        eth_dynamic_ip   = args.eth_dynamic_ip,
+        with_pcie        = args.with_pcie,
+        pcie_dmas        = args.pcie_dmas,
+        pcie_msi_type    = args.pcie_msi_type,
+        pcie_irq_count   = args.pcie_irq_count,
+        pcie_irq_timeout = args.pcie_irq_timeout,
+        with_sata        = args.with_sata,
+        sata_gen         = "gen" + args.sata_gen,
+        sata_data_width  = args.sata_data_width,
+        sata_raid0       = args.sata_raid0,
+        sata_stripe      = args.sata_stripe,
+        with_jtagbone    = args.with_jtagbone,
+        l2_ways          = args.l2_ways,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -24,15 +24,14 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.interconnect.axi import *
-from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
 from litex.soc.cores.led import LedChaser
 
 from litepcie.phy.usppciephy import USPHBMPCIEPHY
-from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
-from litepcie.frontend.dma import LitePCIeDMA
-from litepcie.frontend.wishbone import LitePCIeWishboneBridge
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.hbm import USPHBM2, usp_hbm2_ip_config, add_hbm2_slaves, check_hbm2_ports
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -59,9 +58,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_hbm        = False,
+        with_led_chaser   = True,
+        with_pcie         = False,
+        pcie_lanes        = 4,
+        pcie_dmas         = 1,
+        pcie_msi_type     = "msi",
+        pcie_irq_count    = 1,
+        pcie_irq_timeout  = 0,
+        with_hbm          = False,
+        with_hbm_axi_full = False,
+        hbm_ports         = 4,
+        hbm_interleave    = 0,
         **kwargs):
         platform = sqrl_fk33.Platform()
         if with_hbm:
@@ -81,55 +88,26 @@ class BaseSoC(SoCCore):
         # HBM --------------------------------------------------------------------------------------
         if with_hbm:
             # Add HBM Core.
-            self.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform))
-
-            # Get HBM .xci.
-            os.system("wget https://github.com/litex-hub/litex-boards/files/8178874/hbm_0.xci.txt")
-            os.makedirs("ip/hbm", exist_ok=True)
-            os.system("mv hbm_0.xci.txt ip/hbm/hbm_0.xci")
-
-            # Connect four of the HBM's AXI interfaces to the main bus of the SoC.
-            for i in range(4):
-                axi_hbm      = hbm.axi[i]
-                axi_lite_hbm = AXILiteInterface(data_width=256, address_width=33)
-                self.submodules += AXILite2AXI(axi_lite_hbm, axi_hbm)
-                self.bus.add_slave(f"hbm{i}", axi_lite_hbm, SoCRegion(origin=0x4000_0000 + 0x1000_0000*i, size=0x1000_0000)) # 256MB.
-            # Link HBM2 channel 0 as main RAM
-            self.bus.add_region("main_ram", SoCRegion(origin=0x4000_0000, size=0x1000_0000, linker=True)) # 256MB.
+            self.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform,
+                ip_config = usp_hbm2_ip_config(axi_clk_freq=sys_clk_freq)))
+
+            # Connect HBM's AXI interfaces to the main bus of the SoC and link them as main RAM.
+            # Remaining HBM2 AXI interfaces (hbm.axi[hbm_ports:]) are left free for DMA masters.
+            add_hbm2_slaves(self, hbm.axi,
+                nports     = hbm_ports,
+                interleave = hbm_interleave,
+                axi_full   = with_hbm_axi_full)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            assert self.csr_data_width == 32
-            # PHY
-            self.pcie_phy = USPHBMPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            self.pcie_phy = USPHBMPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                speed      = "gen3",
+                data_width = {4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
-
-            # Endpoint
-            self.pcie_endpoint = LitePCIeEndpoint(self.pcie_phy, max_pending_requests=8)
-
-            # Wishbone bridge
-            self.pcie_bridge = LitePCIeWishboneBridge(self.pcie_endpoint,
-                base_address = self.mem_map["csr"])
-            self.bus.add_master(master=self.pcie_bridge.wishbone)
-
-            # DMA0
-            self.pcie_dma0 = LitePCIeDMA(self.pcie_phy, self.pcie_endpoint,
-                with_buffering = True, buffering_depth=1024,
-                with_loopback  = True)
-
-            self.add_constant("DMA_CHANNELS", 1)
-
-            # MSI
-            self.pcie_msi = LitePCIeMSI()
-            self.comb += self.pcie_msi.source.connect(self.pcie_phy.msi)
-            self.interrupts = {
-                "PCIE_DMA0_WRITER":    self.pcie_dma0.writer.irq,
-                "PCIE_DMA0_READER":    self.pcie_dma0.reader.irq,
-            }
-            for i, (k, v) in enumerate(sorted(self.interrupts.items())):
-                self.comb += self.pcie_msi.irqs[i].eq(v)
-                self.add_constant(k + "_INTERRUPT", i)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -142,16 +120,35 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=sqrl_fk33.Platform, description="LiteX SoC on FK33.")
-    parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--with-hbm",     action="store_true",       help="Use HBM2.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",     default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",       default=4,     type=int,   help="PCIe lanes (4, 8 or 16).", choices=[4, 8, 16])
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",             help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--with-hbm",         action="store_true",       help="Use HBM2.")
+    parser.add_target_argument("--hbm-axi-full",     action="store_true",       help="Connect HBM2 as full AXI (burst-capable, requires --bus-standard=axi).")
+    parser.add_target_argument("--hbm-ports",        default=4,     type=int,   help="Number of HBM2 ports/pseudo-channels connected (4 max without --hbm-interleave).", choices=[1, 2, 4, 8, 16, 32])
+    parser.add_target_argument("--hbm-interleave",   default=0,     type=int,   help="Interleave HBM2 ports every N bytes in a single region (>= 4096, 0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
+    if args.hbm_axi_full and (args.bus_standard != "axi"):
+        parser.error("--hbm-axi-full requires --bus-standard=axi (bursts are lost through a Wishbone/AXI-Lite main bus).")
+    check_hbm2_ports(parser, args.hbm_ports, args.hbm_interleave)
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
-        with_hbm     = args.with_hbm,
+        sys_clk_freq      = args.sys_clk_freq,
+        with_pcie         = args.with_pcie,
+        pcie_lanes        = args.pcie_lanes,
+        pcie_dmas         = args.pcie_dmas,
+        pcie_msi_type     = args.pcie_msi_type,
+        pcie_irq_count    = args.pcie_irq_count,
+        pcie_irq_timeout  = args.pcie_irq_timeout,
+        with_hbm          = args.with_hbm,
+        with_hbm_axi_full = args.hbm_axi_full,
+        hbm_ports         = args.hbm_ports,
+        hbm_interleave    = args.hbm_interleave,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
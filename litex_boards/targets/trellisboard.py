@@ -12,13 +12,15 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import trellisboard
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.video import add_video_framebuffer, video_timings_args, video_framebuffer_args
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOTristate
-from litex.soc.cores.video import VideoDVIPHY
+from litex.soc.cores.video import VideoDVIPHY, video_timings
 from litex.soc.cores.bitbang import I2CMaster
 
 from litedram.modules import MT41J256M16
@@ -29,7 +31,7 @@ from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, with_video_pll=False, pix_clk=31.5e6):
         self.rst    = Signal()
         self.cd_por = ClockDomain()
         self.cd_sys = ClockDomain()
@@ -53,9 +55,17 @@ class _CRG(LiteXModule):
         pll.register_clkin(clk12, 12e6)
         pll.create_clkout(self.cd_sys, sys_clk_freq)
 
+        # Video PLL.
+        if with_video_pll:
+            self.cd_dvi = ClockDomain()
+            self.video_pll = video_pll = ECP5PLL()
+            self.comb += video_pll.reset.eq(~por_done | rst | self.rst)
+            video_pll.register_clkin(clk12, 12e6)
+            video_pll.create_clkout(self.cd_dvi, pix_clk)
+
 
 class _CRGSDRAM(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, with_video_pll=False, pix_clk=31.5e6):
         self.rst        = Signal()
         self.cd_init    = ClockDomain()
         self.cd_por     = ClockDomain()
@@ -105,6 +115,14 @@ class _CRGSDRAM(LiteXModule):
             AsyncResetSynchronizer(self.cd_sys, ~pll.locked | self.reset),
         ]
 
+        # Video PLL.
+        if with_video_pll:
+            self.cd_dvi = ClockDomain()
+            self.video_pll = video_pll = ECP5PLL()
+            self.comb += video_pll.reset.eq(~por_done | rst | self.rst)
+            video_pll.register_clkin(clk12, 12e6)
+            video_pll.create_clkout(self.cd_dvi, pix_clk)
+
         self.comb += platform.request("dram_vtt_en").eq(1)
 
 # BaseSoC ------------------------------------------------------------------------------------------
@@ -114,6 +132,8 @@ class BaseSoC(SoCCore):
         with_ethernet          = False,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_timing           = "640x480@75Hz",
+        video_buffers          = 1,
         with_led_chaser        = True,
         with_pmod_gpio         = False,
         **kwargs):
@@ -121,7 +141,11 @@ class BaseSoC(SoCCore):
 
         # CRG --------------------------------------------------------------------------------------
         crg_cls = _CRGSDRAM if kwargs.get("integrated_main_ram_size", 0) == 0 else _CRG
-        self.crg = crg_cls(platform, sys_clk_freq)
+        with_video_pll = (with_video_terminal or with_video_framebuffer)
+        self.crg = crg_cls(platform, sys_clk_freq,
+            with_video_pll = with_video_pll,
+            pix_clk        = video_timings[video_timing]["pix_clk"]
+        )
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on Trellis Board", **kwargs)
@@ -133,10 +157,11 @@ class BaseSoC(SoCCore):
                 sys_clk_freq=sys_clk_freq)
             self.comb += self.crg.stop.eq(self.ddrphy.init.stop)
             self.comb += self.crg.reset.eq(self.ddrphy.init.reset)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT41J256M16(sys_clk_freq, "1:2"),
-                l2_cache_size = kwargs.get("l2_size", 8192),
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1),
             )
 
         # Ethernet ---------------------------------------------------------------------------------
@@ -150,7 +175,7 @@ class BaseSoC(SoCCore):
         if with_video_terminal or with_video_framebuffer:
             # PHY + TP410 I2C initialization.
             hdmi_pads = platform.request("hdmi")
-            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="init")
+            self.videophy = VideoDVIPHY(hdmi_pads, clock_domain="dvi")
             self.videoi2c = I2CMaster(hdmi_pads)
             self.videoi2c.add_init(addr=0x38, init=[
                 (0x08, 0x35) # CTL_1_MODE: Normal operation, 24-bit, HSYNC/VSYNC.
@@ -158,9 +183,9 @@ class BaseSoC(SoCCore):
 
             # Video Terminal/Framebuffer.
             if with_video_terminal:
-                self.add_video_terminal(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                self.add_video_terminal(phy=self.videophy, timings=video_timing, clock_domain="dvi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="640x480@75Hz", clock_domain="init")
+                add_video_framebuffer(self, phy=self.videophy, timings=video_timing, clock_domain="dvi", nbuffers=video_buffers)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -183,10 +208,13 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    video_timings_args(parser, default="640x480@75Hz", max_pix_clk=148.5e6) # TFP410: Up to 165MHz Pixel Clk.
+    video_framebuffer_args(parser)
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard",       action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",           action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-pmod-gpio", action="store_true", help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    l2_cache_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -195,7 +223,10 @@ def main():
         with_ethernet          = args.with_ethernet,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_timing           = args.video_timings,
+        video_buffers          = args.video_framebuffer_buffers,
         with_pmod_gpio         = args.with_pmod_gpio,
+        l2_ways                = args.l2_ways,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
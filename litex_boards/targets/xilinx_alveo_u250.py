@@ -20,14 +20,22 @@ from litex_boards.platforms import xilinx_alveo_u250
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.interconnect import wishbone
 
 from litex.soc.cores.led import LedChaser
 from litedram.modules import MTA18ASF2G72PZ
 from litedram.phy import usddrphy
+from litedram.core import LiteDRAMCore
+from litedram.frontend.wishbone import LiteDRAMWishbone2Native
 
 from litepcie.phy.usppciephy import USPPCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.sdram import add_sdram, l2_cache_args, LiteDRAMInterleaver, check_dram_interleave
+from litex_boards.cores.ethernet import USP10GBASERPHY
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -60,7 +68,19 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=125e6, with_led_chaser=True, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=125e6, ddram_channels=[0], ddram_interleave=4096,
+        with_led_chaser  = True,
+        with_pcie        = False,
+        pcie_lanes       = 4,
+        pcie_dmas        = 1,
+        pcie_msi_type    = "msi",
+        pcie_irq_count   = 1,
+        pcie_irq_timeout = 0,
+        with_ethernet    = False,
+        with_etherbone   = False,
+        eth_ip           = "192.168.1.50",
+        eth_phy          = "10gbase-r",
+        **kwargs):
         platform = xilinx_alveo_u250.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -71,27 +91,91 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
+            sdram_module = MTA18ASF2G72PZ(sys_clk_freq, "1:4")
+            self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", ddram_channels[0]),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 500e6,
                 is_rdimm         = True)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
-                module        = MTA18ASF2G72PZ(sys_clk_freq, "1:4"),
+                module        = sdram_module,
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
+            # Additional DDR4 channels: Own LiteDRAM core per channel, each one exposed in a separate 256MB
+            # region. The BIOS only initializes/calibrates the main_ram channel, the others have to be from
+            # software through their ddrphyN/sdramN CSRs (so not allowed from the command line for now).
+            if len(ddram_channels) > 1:
+                ddram_ports = [self.sdram.crossbar.get_port()]
+                for n, channel in enumerate(ddram_channels[1:]):
+                    ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", channel),
+                        memtype          = "DDR4",
+                        sys_clk_freq     = sys_clk_freq,
+                        iodelay_clk_freq = 500e6,
+                        is_rdimm         = True)
+                    self.add_module(name=f"ddrphy{channel}", module=ddrphy)
+                    sdram = LiteDRAMCore(
+                        phy             = ddrphy,
+                        geom_settings   = sdram_module.geom_settings,
+                        timing_settings = sdram_module.timing_settings,
+                        clk_freq        = sys_clk_freq)
+                    self.add_module(name=f"sdram{channel}", module=sdram)
+                    port    = sdram.crossbar.get_port()
+                    wb      = wishbone.Interface(data_width=self.bus.data_width)
+                    wb_port = wishbone.Interface(data_width=port.data_width)
+                    origin  = 0x8000_0000 + 0x1000_0000*n
+                    self.submodules += wishbone.Converter(wb, wb_port)
+                    self.submodules += LiteDRAMWishbone2Native(wishbone=wb_port, port=port, base_address=origin)
+                    self.bus.add_slave(f"ddram{channel}", wb, SoCRegion(origin=origin, size=0x1000_0000, cached=False)) # 256MB.
+                    ddram_ports.append(sdram.crossbar.get_port())
+
+                # Interleaved region over all the DDR4 channels, located above main_ram (first 1GB of the first
+                # channel) and the 256MB regions (first 256MB of the others) in the channels to not alias them.
+                if ddram_interleave:
+                    self.ddram_interleaver = LiteDRAMInterleaver(ddram_ports,
+                        size        = 0x2000_0000,
+                        granularity = ddram_interleave,
+                        data_width  = self.bus.data_width,
+                        offset      = 0x4000_0000)
+                    self.bus.add_slave("ddram", self.ddram_interleaver.bus, SoCRegion(origin=0xc000_0000, size=0x2000_0000, cached=False)) # 512MB.
+
         # Firmware RAM (To ease initial LiteDRAM calibration support) ------------------------------
         self.add_ram("firmware_ram", 0x20000000, 0x8000)
 
+        # Ethernet / Etherbone ---------------------------------------------------------------------
+        if with_ethernet or with_etherbone:
+            assert eth_phy == "10gbase-r"
+            qsfp = platform.request("qsfp28", 0)
+            self.comb += [
+                qsfp.resetl.eq(1),
+                qsfp.lpmode.eq(0),
+                qsfp.modskll.eq(0),
+                qsfp.refclk_reset.eq(0),
+                qsfp.fs0.eq(0), # 161.1328125MHz RefClk.
+                qsfp.fs1.eq(1),
+            ]
+            self.ethphy = USP10GBASERPHY(qsfp,
+                refclk_freq  = 161.1328125e6,
+                sys_clk_freq = sys_clk_freq)
+            platform.add_period_constraint(qsfp.clk_p, 1e9/161.1328125e6)
+            if with_ethernet:
+                self.add_ethernet(phy=self.ethphy, data_width=64)
+            if with_etherbone:
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=64)
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                speed      = "gen3",
+                data_width = {4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -104,14 +188,47 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_alveo_u250.Platform, description="LiteX SoC on Alveo U250.")
-    parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",     default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--ddram-channels",   default="0",               help="DDRAM channel(s) (ex: 0 or 0,1,2,4 or all), first one is main RAM (only one for now, see BaseSoC).")
+    parser.add_target_argument("--ddram-interleave", default=4096,  type=int,   help="Interleaving granularity of the DDRAM channels region (0 to disable).")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",       default=4,     type=int,   help="PCIe lanes (4 or 16).", choices=[4, 16])
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",             help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
+    ethopts = parser.target_group.add_mutually_exclusive_group()
+    ethopts.add_argument("--with-ethernet",          action="store_true",       help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",         action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--eth-ip",           default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-phy",          default="10gbase-r",       help="Ethernet PHY (on QSFP28 0, lane 0).", choices=["10gbase-r"])
+    l2_cache_args(parser)
     args = parser.parse_args()
 
+    if args.ddram_channels == "all":
+        args.ddram_channels = "0,1,2,4" # ddram 3 is defined as ddram 4 on the platform.
+
+    ddram_channels = [int(c, 0) for c in args.ddram_channels.split(",")]
+    if len(ddram_channels) > 1:
+        parser.error("--ddram-channels: Only one DDR4 channel is supported for now, the BIOS does not initialize/calibrate the additional LiteDRAM cores.")
+    check_dram_interleave(parser, len(ddram_channels), args.ddram_interleave)
+
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq     = args.sys_clk_freq,
+        ddram_channels   = ddram_channels,
+        ddram_interleave = args.ddram_interleave,
+        with_pcie        = args.with_pcie,
+        pcie_lanes       = args.pcie_lanes,
+        pcie_dmas        = args.pcie_dmas,
+        pcie_msi_type    = args.pcie_msi_type,
+        pcie_irq_count   = args.pcie_irq_count,
+        pcie_irq_timeout = args.pcie_irq_timeout,
+        with_ethernet    = args.with_ethernet,
+        with_etherbone   = args.with_etherbone,
+        eth_ip           = args.eth_ip,
+        eth_phy          = args.eth_phy,
+        l2_ways          = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
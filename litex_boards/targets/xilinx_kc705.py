@@ -29,6 +29,11 @@ from liteeth.phy import LiteEthPHY
 from litepcie.phy.s7pciephy import S7PCIEPHY
 from litepcie.software import generate_litepcie_software
 
+from litex_boards.cores.pcie import add_pcie
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.sata import add_sata, sata_args, check_sata_args, sata_phy_data_width
+from litex_boards.cores.ethernet import S7GTX10GBASERPHY
+
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -54,11 +59,18 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_led_chaser = True,
-        with_spi_flash  = False,
-        with_pcie       = False,
-        with_sata       = False,
+        with_ethernet    = False,
+        eth_phy          = "gmii",
+        with_led_chaser  = True,
+        with_spi_flash   = False,
+        with_pcie        = False,
+        pcie_dmas        = 1,
+        pcie_msi_type    = "msi",
+        pcie_irq_count   = 1,
+        pcie_irq_timeout = 0,
+        with_sata        = False,
+        sata_gen         = "gen2",
+        sata_data_width  = None,
         **kwargs):
         platform = xilinx_kc705.Platform()
 
@@ -74,19 +86,37 @@ class BaseSoC(SoCCore):
                 memtype      = "DDR3",
                 nphases      = 4,
                 sys_clk_freq = sys_clk_freq)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = MT8JTF12864(sys_clk_freq, "1:4"),
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
-            self.ethphy = LiteEthPHY(
-                clock_pads = self.platform.request("eth_clocks"),
-                pads       = self.platform.request("eth"),
-                clk_freq   = self.clk_freq)
-            self.add_ethernet(phy=self.ethphy)
+            if eth_phy == "10gbase-r":
+                # RefClk, 156.25MHz from User Clock (SI570, Power-up default) through the fabric.
+                clk156 = platform.request("clk156")
+                clk156_ibuf = Signal()
+                self.cd_eth_refclk = ClockDomain()
+                self.specials += [
+                    Instance("IBUFDS", i_I=clk156.p, i_IB=clk156.n, o_O=clk156_ibuf),
+                    Instance("BUFG", i_I=clk156_ibuf, o_O=self.cd_eth_refclk.clk),
+                ]
+                platform.add_period_constraint(clk156.p, 1e9/156.25e6)
+                platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-52]")
+
+                self.ethphy = S7GTX10GBASERPHY(ClockSignal("eth_refclk"),
+                    data_pads    = self.platform.request("sfp", 0),
+                    sys_clk_freq = self.clk_freq)
+                self.comb += self.platform.request("sfp_tx_disable_n", 0).eq(1)
+            else:
+                self.ethphy = LiteEthPHY(
+                    clock_pads = self.platform.request("eth_clocks"),
+                    pads       = self.platform.request("eth"),
+                    clk_freq   = self.clk_freq)
+            self.add_ethernet(phy=self.ethphy, data_width=self.ethphy.dw)
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -99,7 +129,10 @@ class BaseSoC(SoCCore):
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            add_pcie(self, phy=self.pcie_phy, ndmas=pcie_dmas,
+                msi_type    = pcie_msi_type,
+                irq_count   = pcie_irq_count,
+                irq_timeout = pcie_irq_timeout)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -128,12 +161,12 @@ class BaseSoC(SoCCore):
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = sata_refclk,
                 pads       = platform.request("sfp2sata"),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
-                data_width = 16)
+                data_width = sata_phy_data_width(sata_gen, sata_data_width))
 
             # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            add_sata(self, phy=self.sata_phy, mode="read+write")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -146,20 +179,38 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_kc705.Platform, description="LiteX SoC on KC705.")
-    parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
-    parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash (MMAPed).")
-    parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",         action="store_true",       help="Generate PCIe driver.")
-    parser.add_target_argument("--with-sata",      action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--sys-clk-freq",     default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-ethernet",    action="store_true",       help="Enable Ethernet support.")
+    parser.add_target_argument("--eth-phy",          default="gmii",            help="Ethernet PHY (gmii: Onboard PHY, 10gbase-r: SFP).", choices=["gmii", "10gbase-r"])
+    parser.add_target_argument("--with-spi-flash",   action="store_true",       help="Enable SPI Flash (MMAPed).")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",        default=1,     type=int,   help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi-type",    default="msi",             help="PCIe MSI type (msi-x: One vector per DMA channel/direction).", choices=["msi", "msi-x"])
+    parser.add_target_argument("--pcie-irq-count",   default=1,     type=int,   help="PCIe DMA IRQs coalescing: Raise IRQ every N events (1 to disable).")
+    parser.add_target_argument("--pcie-irq-timeout", default=0,     type=float, help="PCIe DMA IRQs coalescing: Raise pending IRQ after N us (0 to disable).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--with-sata",        action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    sata_args(parser)
+    l2_cache_args(parser)
     args = parser.parse_args()
+    check_sata_args(parser, args)
+    if args.with_ethernet and (args.eth_phy == "10gbase-r") and args.with_sata:
+        parser.error("--eth-phy=10gbase-r and --with-sata both use the SFP cage.")
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_spi_flash = args.with_spi_flash,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq     = args.sys_clk_freq,
+        with_ethernet    = args.with_ethernet,
+        eth_phy          = args.eth_phy,
+        with_spi_flash   = args.with_spi_flash,
+        with_pcie        = args.with_pcie,
+        pcie_dmas        = args.pcie_dmas,
+        pcie_msi_type    = args.pcie_msi_type,
+        pcie_irq_count   = args.pcie_irq_count,
+        pcie_irq_timeout = args.pcie_irq_timeout,
+        with_sata        = args.with_sata,
+        sata_gen         = "gen" + args.sata_gen,
+        sata_data_width  = args.sata_data_width,
+        l2_ways          = args.l2_ways,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -14,6 +14,10 @@ from migen.genlib.resetsync import AsyncResetSynchronizer
 from litex.gen import LiteXModule
 
 from litex_boards.platforms import xilinx_kcu105
+from litex_boards.cores.pcie import add_pcie_dram_dma
+from litex_boards.cores.sdram import add_sdram, l2_cache_args
+from litex_boards.cores.sata import add_sata, sata_args, check_sata_args, sata_phy_data_width
+from litex_boards.cores.ethernet import USGTH10GBASERPHY, add_udp_streamer
 
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
@@ -63,12 +67,19 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_sata       = False,
+        with_ethernet       = False,
+        with_etherbone      = False,
+        eth_ip              = "192.168.1.50",
+        eth_phy             = "1000basex",
+        with_udp_streamer   = False,
+        udp_streamer_dst_ip = "192.168.1.100",
+        with_led_chaser     = True,
+        with_pcie           = False,
+        pcie_dmas           = 1,
+        with_pcie_dram_dma  = False,
+        with_sata           = False,
+        sata_gen            = "gen2",
+        sata_data_width     = None,
         **kwargs):
         platform = xilinx_kcu105.Platform()
 
@@ -84,31 +95,48 @@ class BaseSoC(SoCCore):
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
                 iodelay_clk_freq = 200e6)
-            self.add_sdram("sdram",
+            add_sdram(self, "sdram",
                 phy           = self.ddrphy,
                 module        = EDY4016A(sys_clk_freq, "1:4"),
                 size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
+                l2_cache_size = kwargs.get("l2_size"),
+                l2_cache_ways = kwargs.get("l2_ways", 1)
             )
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
-            self.ethphy = KU_1000BASEX(self.crg.cd_eth.clk,
-                data_pads    = self.platform.request("sfp", 0),
-                sys_clk_freq = self.clk_freq)
+        if with_ethernet or with_etherbone or with_udp_streamer:
+            if eth_phy == "10gbase-r":
+                # 156.25MHz RefClk from SI570 (Power-up default).
+                si570_refclk = platform.request("si570_refclk")
+                self.ethphy = USGTH10GBASERPHY(si570_refclk,
+                    data_pads    = self.platform.request("sfp", 0),
+                    sys_clk_freq = self.clk_freq)
+                platform.add_period_constraint(si570_refclk.p, 1e9/156.25e6)
+            else:
+                self.ethphy = KU_1000BASEX(self.crg.cd_eth.clk,
+                    data_pads    = self.platform.request("sfp", 0),
+                    sys_clk_freq = self.clk_freq)
+                self.platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-1753]")
             self.comb += self.platform.request("sfp_tx_disable_n", 0).eq(1)
-            self.platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-1753]")
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                self.add_ethernet(phy=self.ethphy, data_width=self.ethphy.dw)
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=self.ethphy.dw)
+
+        # UDP Streamer -----------------------------------------------------------------------------
+        if with_udp_streamer:
+            add_udp_streamer(self, phy=self.ethphy, ip_address=eth_ip, dst_ip=udp_streamer_dst_ip)
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
             self.pcie_phy = USPCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
+
+            # PCIe <-> DRAM DMAs (Native LiteDRAM ports, not going through the main bus).
+            if with_pcie_dram_dma:
+                add_pcie_dram_dma(self, ndmas=pcie_dmas)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -137,12 +165,12 @@ class BaseSoC(SoCCore):
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = sata_refclk,
                 pads       = platform.request("sfp2sata"),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
-                data_width = 16)
+                data_width = sata_phy_data_width(sata_gen, sata_data_width))
 
             # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            add_sata(self, phy=self.sata_phy, mode="read+write")
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -155,23 +183,44 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_kcu105.Platform, description="LiteX SoC on KCU105.")
-    parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--sys-clk-freq",       default=125e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
-    ethopts.add_argument("--with-ethernet",   action="store_true",    help="Enable Ethernet support.")
-    ethopts.add_argument("--with-etherbone",  action="store_true",    help="Enable Etherbone support.")
-    parser.add_target_argument("--eth-ip",    default="192.168.1.50", help="Ethernet/Etherbone IP address.")
-    parser.add_target_argument("--with-pcie", action="store_true",    help="Enable PCIe support.")
-    parser.add_target_argument("--driver",    action="store_true",    help="Generate PCIe driver.")
-    parser.add_target_argument("--with-sata", action="store_true",    help="Enable SATA support (over SFP2SATA).")
+    ethopts.add_argument("--with-ethernet",             action="store_true",     help="Enable Ethernet support.")
+    ethopts.add_argument("--with-etherbone",            action="store_true",     help="Enable Etherbone support.")
+    parser.add_target_argument("--eth-ip",              default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--eth-phy",             default="1000basex",     help="Ethernet PHY (on SFP0).", choices=["1000basex", "10gbase-r"])
+    parser.add_target_argument("--with-udp-streamer",   action="store_true",     help="Enable UDP Streamer (DRAM <-> UDP, alone or with Etherbone).")
+    parser.add_target_argument("--udp-streamer-dst-ip", default="192.168.1.100", help="UDP Streamer destination IP address (also configurable through CSR).")
+    parser.add_target_argument("--with-pcie",           action="store_true",     help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",           default=1,     type=int, help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--with-pcie-dram-dma",  action="store_true",     help="Connect PCIe DMAs directly to DRAM (through native LiteDRAM ports).")
+    parser.add_target_argument("--driver",              action="store_true",     help="Generate PCIe driver.")
+    parser.add_target_argument("--with-sata",           action="store_true",     help="Enable SATA support (over SFP2SATA).")
+    sata_args(parser)
+    l2_cache_args(parser)
     args = parser.parse_args()
+    check_sata_args(parser, args)
+
+    if args.with_ethernet and args.with_udp_streamer:
+        parser.error("--with-udp-streamer can't be used with --with-ethernet (PHY can't be shared with the CPU's Ethernet MAC), use it alone or with --with-etherbone.")
+    if (args.with_ethernet or args.with_etherbone or args.with_udp_streamer) and args.with_sata:
+        parser.error("Ethernet (--eth-phy) and --with-sata both use SFP0.")
 
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq        = args.sys_clk_freq,
+        with_ethernet       = args.with_ethernet,
+        with_etherbone      = args.with_etherbone,
+        eth_ip              = args.eth_ip,
+        eth_phy             = args.eth_phy,
+        with_udp_streamer   = args.with_udp_streamer,
+        udp_streamer_dst_ip = args.udp_streamer_dst_ip,
+        with_pcie           = args.with_pcie,
+        pcie_dmas           = args.pcie_dmas,
+        with_pcie_dram_dma  = args.with_pcie_dram_dma,
+        with_sata           = args.with_sata,
+        sata_gen            = "gen" + args.sata_gen,
+        sata_data_width     = args.sata_data_width,
+        l2_ways             = args.l2_ways,
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
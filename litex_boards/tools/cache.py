@@ -0,0 +1,183 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Content-addressed elaboration cache.
+#
+# Wraps the main() flow of the targets: once the arguments have been resolved by the target's
+# LiteXArgumentParser, a key is computed from the sources of the target/platform modules, the
+# resolved arguments and the versions of Migen/LiteX/cores. On a hit, the gateware/ and
+# software/include trees generated by a previous run are restored and the SoC is not elaborated;
+# on a miss, main() runs normally and its generated trees are stored for the next runs.
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import contextlib
+import importlib.util
+
+# Helpers ------------------------------------------------------------------------------------------
+
+# Packages whose version/revision is part of the key.
+cache_packages = [
+    "migen",
+    "litex",
+    "litedram",
+    "liteeth",
+    "litepcie",
+    "litesata",
+    "litesdcard",
+    "litespi",
+    "liteiclink",
+    "litescope",
+]
+
+def _git_revision(path):
+    # Revision of the git repository containing path (for packages installed in develop mode).
+    while True:
+        git_dir = os.path.join(path, ".git")
+        if os.path.isdir(git_dir):
+            head = open(os.path.join(git_dir, "HEAD")).read().strip()
+            if head.startswith("ref: "):
+                ref = os.path.join(git_dir, head[5:])
+                if not os.path.exists(ref):
+                    return None
+                head = open(ref).read().strip()
+            return head
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+def package_version(name):
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    version = None
+    try:
+        from importlib.metadata import version as _version
+        version = _version(name)
+    except Exception:
+        pass
+    if spec.origin is not None:
+        revision = _git_revision(os.path.dirname(spec.origin))
+        if revision is not None:
+            version = f"{version}+{revision}"
+    return version
+
+def _module_filename(name):
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None or not os.path.isfile(spec.origin):
+        return None
+    return spec.origin
+
+def _is_cacheable(args):
+    # Only pure elaborations (no gateware compilation, nothing loaded/flashed and nothing written
+    # outside of the gateware/software trees) are cached.
+    if not getattr(args, "build", False):
+        return False
+    if not (getattr(args, "no_compile", False) or getattr(args, "no_compile_gateware", False)):
+        return False
+    if getattr(args, "output_dir", None) is None:
+        return False
+    for action in ["load", "flash", "driver", "doc",
+        "soc_csv", "soc_json", "soc_svd", "memory_x",
+        "csr_csv", "csr_json", "csr_svd"]:
+        if getattr(args, action, None):
+            return False
+    return True
+
+# Cache Entry --------------------------------------------------------------------------------------
+
+class CacheHit(Exception):
+    pass
+
+class CacheEntry:
+    def __init__(self, cache_dir, module, args):
+        self.args         = args
+        self.output_dir   = args.output_dir
+        self.gateware_dir = getattr(args, "gateware_dir", None) or os.path.join(self.output_dir, "gateware")
+        self.include_dir  = getattr(args, "include_dir",  None) or os.path.join(self.output_dir, "software", "include")
+
+        # Compute key.
+        self.sources = {}
+        modules = [module] + [m for m in sys.modules if m.startswith("litex_boards.platforms.")]
+        if isinstance(getattr(args, "platform", None), str):
+            modules.append(args.platform) # Platform passed as argument (simple target).
+        for m in sorted(set(modules)):
+            filename = _module_filename(m)
+            if filename is not None:
+                self.sources[m] = hashlib.sha256(open(filename, "rb").read()).hexdigest()
+        self.versions  = {p: package_version(p) for p in cache_packages}
+        self.arguments = {k: v for k, v in vars(args).items()} # Includes output paths, since they end up in generated files.
+        content = json.dumps({
+            "sources"   : self.sources,
+            "versions"  : self.versions,
+            "arguments" : self.arguments,
+        }, sort_keys=True, default=str)
+        self.key  = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        self.path = os.path.join(cache_dir, self.key[:2], self.key)
+
+    def restore(self):
+        if not os.path.exists(os.path.join(self.path, "entry.json")):
+            return False
+        for name, target in [("gateware", self.gateware_dir), ("include", self.include_dir)]:
+            shutil.rmtree(target, ignore_errors=True)
+            shutil.copytree(os.path.join(self.path, name), target, symlinks=True)
+        return True
+
+    def store(self):
+        if not (os.path.isdir(self.gateware_dir) and os.path.isdir(self.include_dir)):
+            return
+        tmp_path = self.path + f".tmp{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        for name, source in [("gateware", self.gateware_dir), ("include", self.include_dir)]:
+            shutil.copytree(source, os.path.join(tmp_path, name), symlinks=True)
+        with open(os.path.join(tmp_path, "entry.json"), "w") as f:
+            json.dump({
+                "sources"   : self.sources,
+                "versions"  : self.versions,
+                "arguments" : self.arguments,
+            }, f, indent=4, sort_keys=True, default=str)
+        # Atomic publish (concurrent runs of the same configuration may race here).
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            os.rename(tmp_path, self.path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+# Elaboration Cache --------------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def elaboration_cache(cache_dir, module):
+    """Cache the elaboration(s) of the target module run within the context."""
+    from litex.build.parser import LiteXArgumentParser
+
+    entries    = []
+    parse_args = LiteXArgumentParser.parse_args
+    def cached_parse_args(parser, *args, **kwargs):
+        _args = parse_args(parser, *args, **kwargs)
+        if _is_cacheable(_args) and not entries:
+            entry = CacheEntry(cache_dir, module, _args)
+            if entry.restore():
+                raise CacheHit(entry)
+            entries.append(entry)
+        return _args
+
+    LiteXArgumentParser.parse_args = cached_parse_args
+    try:
+        yield
+    except CacheHit as e:
+        print(f"Elaboration cache hit ({e.args[0].key}), restored {e.args[0].output_dir}.")
+    else:
+        for entry in entries:
+            entry.store()
+            print(f"Elaboration cache miss ({entry.key}), stored {entry.output_dir}.")
+    finally:
+        LiteXArgumentParser.parse_args = parse_args
@@ -0,0 +1,19 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Helpers shared by the tools.
+
+import sys
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def max_rss():
+    """Peak resident set size of the current process (in bytes), None when not available."""
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss*1024 # Bytes on MacOS, KBytes on Linux.
+    except ImportError:
+        return None
@@ -0,0 +1,143 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Incremental toolchain rebuild.
+#
+# Wraps the toolchains' build: once the design has been elaborated (Verilog, constraints, project
+# and build script generated in the gateware directory), the generated files and the sources/IPs
+# of the platform are hashed and compared to the manifest of the last successful toolchain run. When
+# nothing changed and the bitstream is still there, the toolchain is not re-run and the existing
+# bitstream is reused; otherwise the changes are reported and the toolchain is run as usual.
+#
+# Netlist comments (generation date) are not hashed and the SoC identifier only gets the build date
+# (not time), so that successive elaborations of an unchanged design produce the same manifest.
+
+import os
+import re
+import json
+import time
+import hashlib
+import contextlib
+
+# Helpers ------------------------------------------------------------------------------------------
+
+# Comments of the netlists, not hashed: LiteX's banner/trailer contain the generation date and the
+# module hierarchy is not emitted in a deterministic order, so they change on each elaboration.
+_comments_re = re.compile(rb"^[ \t]*//[^\n]*$|/\*.*?\*/", re.MULTILINE | re.DOTALL)
+
+def _file_hash(filename):
+    h = hashlib.sha256()
+    with open(filename, "rb") as f:
+        if filename.endswith((".v", ".sv")):
+            h.update(_comments_re.sub(b"", f.read()))
+        else:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+def _manifest_filename(build_name):
+    return f"{build_name}_incremental.json"
+
+def get_manifest(platform, build_dir, build_name, since, previous_files=[]):
+    """Hash the files generated in build_dir since the elaboration started + platform sources/IPs."""
+    files = set()
+    # Files of the previous manifest (Generated files are not re-written when their content is
+    # unchanged, so their modification time can be older than the elaboration).
+    for filename in previous_files:
+        if not os.path.isabs(filename):
+            files.add(os.path.abspath(os.path.join(build_dir, filename)))
+    # Files generated by the elaboration (Verilog, constraints, project, scripts, memory inits...).
+    for root, dirs, filenames in os.walk(build_dir):
+        for filename in filenames:
+            filename = os.path.join(root, filename)
+            if os.path.getmtime(filename) >= since:
+                files.add(os.path.abspath(filename))
+    # Sources/IPs of the platform (CPU cores, IP configurations, etc...).
+    for source in getattr(platform, "sources", []):
+        files.add(os.path.abspath(source[0]))
+    for ip in getattr(platform, "ips", {}):
+        files.add(os.path.abspath(ip))
+    files.discard(os.path.abspath(os.path.join(build_dir, _manifest_filename(build_name))))
+
+    manifest = {}
+    for filename in sorted(files):
+        if os.path.isfile(filename):
+            key = os.path.relpath(filename, build_dir) if filename.startswith(os.path.abspath(build_dir)) else filename
+            manifest[key] = _file_hash(filename)
+    return manifest
+
+def diff_manifests(old, new):
+    added   = sorted(set(new) - set(old))
+    removed = sorted(set(old) - set(new))
+    changed = sorted(f for f in set(new) & set(old) if new[f] != old[f])
+    return added, removed, changed
+
+# Incremental Build --------------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def incremental_build():
+    """Skip toolchain runs whose inputs are unchanged since the last successful run."""
+    from litex.build.generic_toolchain import GenericToolchain
+    from litex.soc.integration import soc as litex_soc
+
+    build = GenericToolchain.build
+    def incremental_toolchain_build(self, platform, fragment, *args, **kwargs):
+        since      = time.time() - 1 # Margin for coarse filesystem timestamps.
+        run_script = self.run_script
+
+        def incremental_run_script(script):
+            # Called from the build directory, once everything has been generated.
+            build_dir  = os.getcwd()
+            build_name = self._build_name
+            bitstream  = os.path.join(build_dir, build_name + platform.get_bitstream_extension())
+            manifest_filename = os.path.join(build_dir, _manifest_filename(build_name))
+
+            previous = None
+            if os.path.exists(manifest_filename):
+                with open(manifest_filename) as f:
+                    previous = json.load(f)
+            manifest = get_manifest(platform, build_dir, build_name, since, previous_files=previous or [])
+
+            # Reuse bitstream when nothing changed.
+            if previous == manifest and os.path.exists(bitstream):
+                print(f"Incremental build: {len(manifest)} input(s) unchanged, reusing {bitstream}.")
+                return
+
+            # Report changes and rebuild.
+            if previous is None:
+                print("Incremental build: no previous build, running toolchain.")
+            elif not os.path.exists(bitstream):
+                print(f"Incremental build: {bitstream} not found, running toolchain.")
+            else:
+                added, removed, changed = diff_manifests(previous, manifest)
+                print("Incremental build: inputs changed, running toolchain.")
+                for status, files in [("added", added), ("removed", removed), ("changed", changed)]:
+                    for f in files:
+                        print(f" - {status:<8}: {f}")
+            if os.path.exists(manifest_filename):
+                os.remove(manifest_filename) # Invalidate until the toolchain run succeeds.
+            r = run_script(script)
+            with open(manifest_filename, "w") as f:
+                json.dump(manifest, f, indent=4, sort_keys=True)
+            return r
+
+        self.run_script = incremental_run_script
+        try:
+            return build(self, platform, fragment, *args, **kwargs)
+        finally:
+            del self.run_script
+
+    # Build date only in the SoC identifier.
+    build_time = litex_soc.build_time
+    def incremental_build_time(with_time=True):
+        return build_time(with_time=False)
+
+    GenericToolchain.build = incremental_toolchain_build
+    litex_soc.build_time   = incremental_build_time
+    try:
+        yield
+    finally:
+        GenericToolchain.build = build
+        litex_soc.build_time   = build_time
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Content-addressed local IP cache.
+#
+# Vendor IPs used by the targets (ex: Vivado HBM IP) are described by their generation script (IP
+# name/vendor/version and configuration) instead of being downloaded as .xci files: the sha256 of
+# the script is the key of the IP in the cache. On a hit, the cached .xci is copied to the build and
+# used as is; on a miss, the IP is generated by the toolchain from the script and its .xci stored to
+# the cache for the next builds. Elaboration never accesses the network.
+#
+# Cache directory: $LITEX_BOARDS_IP_CACHE (default: ~/.cache/litex-boards/ip).
+#
+# Use:
+# python3 -m litex_boards.tools.ip_cache list
+# python3 -m litex_boards.tools.ip_cache add <key> hbm_0.xci.txt --name=hbm_0.xci (Import an existing .xci).
+
+import os
+import shutil
+import hashlib
+import argparse
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def ip_cache_dir():
+    return os.environ.get("LITEX_BOARDS_IP_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "litex-boards", "ip"))
+
+def vivado_ip_tcl(name, ip, config, vendor="xilinx.com", library="ip", version=None):
+    """Return the Tcl script creating Vivado IP ip as name with config (dict of CONFIG.* values)."""
+    create_ip = f"create_ip -vendor {vendor} -library {library} -name {ip} -module_name {name}"
+    if version is not None:
+        create_ip += f" -version {version}"
+    tcl = [create_ip]
+    tcl.append(f"set obj [get_ips {name}]")
+    tcl.append("set_property -dict [list \\")
+    for k, v in config.items():
+        tcl.append(f"CONFIG.{k} {{{v}}} \\")
+    tcl.append("] $obj")
+    return tcl
+
+# IP Cache -----------------------------------------------------------------------------------------
+
+class IPCache:
+    def __init__(self, path=None):
+        self.path = os.path.abspath(path or ip_cache_dir())
+
+    @staticmethod
+    def key(script):
+        return hashlib.sha256("\n".join(script).encode("utf-8")).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def get(self, key, filename):
+        filename = os.path.join(self.entry_path(key), filename)
+        return filename if os.path.isfile(filename) else None
+
+    def add(self, key, filename, name=None):
+        path     = self.entry_path(key)
+        name     = name or os.path.basename(filename)
+        tmp_name = os.path.join(path, name + f".tmp{os.getpid()}")
+        os.makedirs(path, exist_ok=True)
+        shutil.copyfile(filename, tmp_name)
+        os.replace(tmp_name, os.path.join(path, name)) # Atomic publish.
+
+    def entries(self):
+        if not os.path.isdir(self.path):
+            return
+        for prefix in sorted(os.listdir(self.path)):
+            for key in sorted(os.listdir(os.path.join(self.path, prefix))):
+                files = [f for f in os.listdir(os.path.join(self.path, prefix, key)) if ".tmp" not in f]
+                yield key, sorted(files)
+
+# Add Vivado IP ------------------------------------------------------------------------------------
+
+def add_vivado_ip(platform, name, ip, config, cache_dir=None, **kwargs):
+    """Add Vivado IP ip as name with config to the platform, through the IP cache."""
+    cache  = IPCache(cache_dir)
+    script = vivado_ip_tcl(name, ip, config, **kwargs)
+    key    = cache.key([platform.device] + script) # IPs are generated for a specific device.
+    xci    = cache.get(key, name + ".xci")
+
+    # Hit: Use cached .xci (copied to the build since Vivado generates the IP outputs next to it).
+    if xci is not None:
+        ip_dir = os.path.join(platform.output_dir or os.getcwd(), "ip", name)
+        os.makedirs(ip_dir, exist_ok=True)
+        shutil.copyfile(xci, os.path.join(ip_dir, name + ".xci"))
+        platform.add_ip(os.path.join(ip_dir, name + ".xci"))
+        print(f"IP cache hit for {name} ({key}).")
+
+    # Miss: Generate IP from its script at build time and store its .xci to the cache.
+    else:
+        path = cache.entry_path(key)
+        tcl  = list(script)
+        tcl.append("generate_target all $obj")
+        tcl.append("synth_ip $obj")
+        tcl.append(f"file mkdir {{{path}}}")
+        tcl.append(f"file copy -force [get_property IP_FILE $obj] {{{path}/{name}.xci.tmp}}")
+        tcl.append(f"file rename -force {{{path}/{name}.xci.tmp}} {{{path}/{name}.xci}}")
+        # Pre-synthesis commands are formatted (with build_name) by the toolchain: escape braces.
+        platform.toolchain.pre_synthesis_commands += [l.replace("{", "{{").replace("}", "}}") for l in tcl]
+        print(f"IP cache miss for {name} ({key}), IP will be generated by Vivado and stored to {path}.")
+    return key
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards content-addressed local IP cache.")
+    parser.add_argument("--cache-dir", default=None, help="IP cache directory (default: $LITEX_BOARDS_IP_CACHE or ~/.cache/litex-boards/ip).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List cached IPs.")
+    add_parser = subparsers.add_parser("add", help="Import an existing IP file for a key (as reported on a cache miss).")
+    add_parser.add_argument("key",      help="IP key.")
+    add_parser.add_argument("filename", help="IP file (ex: hbm_0.xci).")
+    add_parser.add_argument("--name",   default=None, help="IP file name in the cache (default: filename's basename).")
+    args = parser.parse_args()
+
+    cache = IPCache(args.cache_dir)
+    if args.command == "list":
+        for key, files in cache.entries():
+            print(f"{key} {' '.join(files)}")
+    if args.command == "add":
+        cache.add(args.key, args.filename, args.name)
+        print(f"Added {args.filename} to {cache.entry_path(args.key)}.")
+
+if __name__ == "__main__":
+    main()
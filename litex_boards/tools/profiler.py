@@ -0,0 +1,194 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Elaboration profiler.
+#
+# Records wall time and peak memory of:
+# - the construction of each Migen/LiteX module (CRG, PHYs, cores, BaseSoC itself...).
+# - each add_* call of the SoC (add_sdram, add_pcie, add_ethernet, etc...).
+# - the Builder steps, SoC finalization and Verilog emission.
+#
+# Records are nested as called and written next to the build as JSON (<name>.json) and as collapsed
+# stacks (<name>.folded, self-time in us) that can be directly used with flamegraph.pl/speedscope.
+
+import os
+import json
+import time
+import inspect
+import functools
+import contextlib
+import tracemalloc
+
+from litex_boards.tools.common import max_rss
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _subclasses(cls):
+    classes = set()
+    for c in cls.__subclasses__():
+        classes.add(c)
+        classes.update(_subclasses(c))
+    return classes
+
+# Record -------------------------------------------------------------------------------------------
+
+class Record:
+    def __init__(self, name):
+        self.name     = name
+        self.calls    = 0
+        self.duration = 0.0
+        self.memory   = 0
+        self.children = {}
+
+    def child(self, name):
+        if name not in self.children:
+            self.children[name] = Record(name)
+        return self.children[name]
+
+    def to_dict(self):
+        return {
+            "name"     : self.name,
+            "calls"    : self.calls,
+            "duration" : self.duration,
+            "memory"   : self.memory,
+            "children" : [c.to_dict() for c in self.children.values()],
+        }
+
+    def folded(self, path=[]):
+        path  = path + [self.name.replace(";", ",").replace(" ", "_")]
+        value = self.duration - sum(c.duration for c in self.children.values())
+        lines = [f"{';'.join(path)} {max(int(value*1e6), 0)}"]
+        for c in self.children.values():
+            lines += c.folded(path)
+        return lines
+
+# Profiler -----------------------------------------------------------------------------------------
+
+class Profiler:
+    def __init__(self, name="profile", with_memory=True):
+        self.root        = Record(name)
+        self.with_memory = with_memory
+        self._stack      = []
+        self._patches    = []
+
+    @contextlib.contextmanager
+    def record(self, name):
+        parent = self._stack[-1][0] if self._stack else self.root
+        record = parent.child(name)
+        if self.with_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Propagate peak seen so far to the parent before resetting it for this record.
+            if self._stack:
+                self._stack[-1][2] = max(self._stack[-1][2], peak)
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        else:
+            current = 0
+        entry = [record, current, current]
+        self._stack.append(entry)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.calls    += 1
+            record.duration += time.perf_counter() - start
+            self._stack.pop()
+            if self.with_memory:
+                peak = max(entry[2], tracemalloc.get_traced_memory()[1])
+                record.memory = max(record.memory, peak - entry[1])
+                if self._stack:
+                    self._stack[-1][2] = max(self._stack[-1][2], peak)
+
+    def wrap(self, owner, attr, namer):
+        func = owner.__dict__[attr]
+        profiler = self
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profiler.record(namer(*args, **kwargs)):
+                return func(*args, **kwargs)
+        wrapper.__signature__ = inspect.signature(func) # For getfullargspec (ex soc_core_argdict).
+        setattr(owner, attr, wrapper)
+        self._patches.append((owner, attr, func))
+
+    def install(self):
+        from migen.fhdl.module import Module
+        from migen.genlib.record import Record
+        from litex.build.generic_platform import GenericPlatform
+        from litex.soc.interconnect.csr import _CSRBase
+        from litex.soc.interconnect.csr_eventmanager import _EventSource
+        from litex.soc.integration.soc import SoC
+        from litex.soc.integration.builder import Builder
+
+        # Modules construction (Except CSRs/Events/Records, named by Migen's tracer from the frame of
+        # their caller, that a wrapper would hide).
+        for cls in _subclasses(Module):
+            if issubclass(cls, (_CSRBase, _EventSource, Record)):
+                continue
+            if "__init__" in cls.__dict__:
+                self.wrap(cls, "__init__", lambda self, *args, _name=cls.__name__, **kwargs: _name)
+
+        # Modules finalization.
+        self.wrap(Module, "finalize", lambda self, *args, **kwargs: f"{type(self).__name__}.finalize")
+
+        # SoC add_* methods.
+        for cls in [SoC] + sorted(_subclasses(SoC), key=lambda c: c.__name__):
+            for attr in list(cls.__dict__):
+                if attr.startswith("add_") and attr not in ["add_constant", "add_config"] and callable(cls.__dict__[attr]):
+                    def namer(self, *args, _attr=attr, **kwargs):
+                        name = args[0] if (len(args) and isinstance(args[0], str)) else kwargs.get("name", None)
+                        return f"{_attr}({name})" if isinstance(name, str) else _attr
+                    self.wrap(cls, attr, namer)
+
+        # Builder / Verilog emission.
+        for attr in ["build", "_generate_includes", "_generate_rom_software", "_initialize_rom_software"]:
+            if attr in Builder.__dict__:
+                self.wrap(Builder, attr, lambda self, *args, _attr=attr, **kwargs: f"Builder.{_attr.lstrip('_')}")
+        self.wrap(GenericPlatform, "get_verilog", lambda *args, **kwargs: "Verilog emission")
+
+    def uninstall(self):
+        for owner, attr, func in reversed(self._patches):
+            setattr(owner, attr, func)
+        self._patches = []
+
+    def write(self, output_dir, name="profile"):
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, name + ".json"), "w") as f:
+            json.dump({
+                "max_rss" : max_rss(),
+                "records" : self.root.to_dict(),
+            }, f, indent=4)
+        with open(os.path.join(output_dir, name + ".folded"), "w") as f:
+            f.write("\n".join(self.root.folded()) + "\n")
+
+    def print_summary(self, depth=3):
+        def _print(record, level):
+            if level > depth:
+                return
+            print(f"{'  '*level}{record.name:<{60 - 2*level}} {record.duration:8.3f}s {record.memory/1e6:10.1f}MB ({record.calls} call(s))")
+            for c in sorted(record.children.values(), key=lambda c: c.duration, reverse=True):
+                _print(c, level + 1)
+        _print(self.root, 0)
+
+# Elaboration Profiling ----------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def elaboration_profiler(output_dir, name="profile", with_memory=True):
+    """Profile the elaboration(s) run within the context and write results to output_dir."""
+    profiler = Profiler(name=name, with_memory=with_memory)
+    profiler.install()
+    if with_memory:
+        tracemalloc.start()
+    try:
+        with profiler.record("main"):
+            yield profiler
+    finally:
+        if with_memory:
+            tracemalloc.stop()
+        profiler.uninstall()
+        profiler.root.duration = sum(c.duration for c in profiler.root.children.values())
+        profiler.root.memory   = max([c.memory for c in profiler.root.children.values()] + [0])
+        profiler.root.calls    = 1
+        profiler.write(output_dir, name)
+        profiler.print_summary()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# In-process runner for LiteX-Boards targets.
+#
+# Instead of spawning one "python3 -m litex_boards.targets.<name>" interpreter per target (and paying
+# the Migen/LiteX/LiteDRAM/LiteEth/LitePCIe import cost each time), the heavy imports are done once
+# in the parent process and each target's main() is then run in a worker forked from it, in its own
+# output directory and with its own log.
+#
+# Use:
+# python3 -m litex_boards.tools.runner digilent_arty icebreaker --jobs=2 -- --build --no-compile
+#
+# With --cache-dir, elaborations are looked up in/stored to a content-addressed cache (see cache.py).
+# With --incremental, toolchain runs with unchanged inputs are skipped (see incremental.py), ex:
+# python3 -m litex_boards.tools.runner xilinx_kcu105 --incremental -- --with-pcie --build
+# With --profile, elaboration is profiled and results written next to the build (see profiler.py).
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import importlib
+import traceback
+import contextlib
+import multiprocessing
+
+from collections import namedtuple
+
+from litex_boards.tools.common import max_rss
+
+# Imports ------------------------------------------------------------------------------------------
+
+# Modules imported in the parent process before forking the workers.
+warm_modules = [
+    "migen",
+    "litex.gen",
+    "litex.build.parser",
+    "litex.soc.cores.clock",
+    "litex.soc.integration.soc_core",
+    "litex.soc.integration.builder",
+    "litedram.modules",
+    "litedram.phy",
+    "liteeth.phy",
+    "litepcie.phy",
+    "litepcie.software",
+]
+
+def warm_imports(modules=[]):
+    for module in warm_modules + list(modules):
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass # Errors are reported by the run of the target itself.
+
+# Run ----------------------------------------------------------------------------------------------
+
+def run_target(module, args=[], cache_dir=None, incremental=False, profile_dir=None):
+    """Run main() of the target module with args as command line, in the current process."""
+    _module = importlib.import_module(module)
+    argv = sys.argv
+    sys.argv = [_module.__file__] + list(args)
+    try:
+        with contextlib.ExitStack() as stack:
+            if cache_dir is not None:
+                from litex_boards.tools.cache import elaboration_cache
+                stack.enter_context(elaboration_cache(cache_dir, module))
+            if incremental:
+                from litex_boards.tools.incremental import incremental_build
+                stack.enter_context(incremental_build())
+            if profile_dir is not None:
+                from litex_boards.tools.profiler import elaboration_profiler
+                stack.enter_context(elaboration_profiler(profile_dir, name=module.split(".")[-1]))
+            _module.main()
+    finally:
+        sys.argv = argv
+
+class Job:
+    def __init__(self, name, module, args=[], output_dir=None, cache_dir=None, incremental=False, profile=False):
+        self.name         = name
+        self.module       = module
+        self.args         = list(args)
+        self.output_dir   = output_dir if output_dir is not None else os.path.join("build", name)
+        self.log_filename = self.output_dir + ".log"
+        self.cache_dir    = cache_dir
+        self.incremental  = incremental
+        self.profile      = profile
+
+JobResult = namedtuple("JobResult", "name returncode duration max_rss log_filename")
+
+def _run_job(job):
+    if not job.incremental:
+        shutil.rmtree(job.output_dir, ignore_errors=True)
+    os.makedirs(os.path.dirname(os.path.abspath(job.log_filename)), exist_ok=True)
+    start = time.time()
+    with open(job.log_filename, "w") as log:
+        # Redirect stdout/stderr (and the ones of the sub-processes) to the log. Workers are only
+        # used for a single job, so there is no need to restore them.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        sys.stdout = os.fdopen(1, "w", buffering=1, closefd=False) # Also when replaced (ex pytest's capture).
+        sys.stderr = os.fdopen(2, "w", buffering=1, closefd=False)
+        args = job.args + [f"--output-dir={job.output_dir}"]
+        print(f"$ python3 -m {job.module} {' '.join(args)}", flush=True)
+        try:
+            run_target(job.module, args,
+                cache_dir   = job.cache_dir,
+                incremental = job.incremental,
+                profile_dir = os.path.join(job.output_dir, "profile") if job.profile else None)
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return JobResult(job.name, returncode, time.time() - start, max_rss(), job.log_filename)
+
+def run_jobs(jobs, processes=None):
+    """Run jobs in parallel, each one in a worker forked from the (warm) current process."""
+    warm_imports([job.module for job in jobs])
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        context = multiprocessing.get_context()
+    # One worker per job: each target is elaborated in a fresh fork, without state from others.
+    with context.Pool(processes=processes, maxtasksperchild=1) as pool:
+        return pool.map(_run_job, jobs, chunksize=1)
+
+def print_summary(title, results):
+    print(f"\n{title} summary:")
+    print("-"*80)
+    for r in results:
+        status = "OK" if r.returncode == 0 else "FAILED"
+        rss    = "" if r.max_rss is None else f"{r.max_rss/1e6:8.1f}MB"
+        print(f"{r.name:<40} {status:<8} {r.duration:8.1f}s {rss:>10}  {r.log_filename}")
+    print("-"*80)
+    errors = sum(r.returncode != 0 for r in results)
+    print(f"{len(results)} run(s), {errors} failed.")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    # Arguments after "--" are passed to the targets.
+    argv        = sys.argv[1:]
+    target_argv = []
+    if "--" in argv:
+        argv, target_argv = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+
+    parser = argparse.ArgumentParser(description="LiteX-Boards in-process target runner.")
+    parser.add_argument("targets",       nargs="+",                        help="Target(s) to run (ex: digilent_arty).")
+    parser.add_argument("--jobs",        default=os.cpu_count(), type=int, help="Number of parallel jobs.")
+    parser.add_argument("--output-dir",  default="build",                  help="Base output directory (one sub-directory per target).")
+    parser.add_argument("--cache-dir",   default=None,                     help="Elaboration cache directory (ex: ~/.cache/litex_boards).")
+    parser.add_argument("--incremental", action="store_true",             help="Reuse previous bitstream when toolchain inputs are unchanged.")
+    parser.add_argument("--profile",     action="store_true",             help="Profile elaboration (time/memory per module, add_* call and build step).")
+    args = parser.parse_args(argv)
+
+    jobs = []
+    for name in args.targets:
+        jobs.append(Job(name,
+            module      = f"litex_boards.targets.{name}",
+            args        = target_argv,
+            output_dir  = os.path.join(args.output_dir, name),
+            cache_dir   = None if args.cache_dir is None else os.path.expanduser(args.cache_dir),
+            incremental = args.incremental,
+            profile     = args.profile))
+    results = run_jobs(jobs, processes=args.jobs)
+    print_summary("Targets", results)
+    sys.exit(int(any(r.returncode != 0 for r in results)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import json
+import time
+import socket
+import unittest
+import statistics
+
+from litex_boards.tools.runner import Job, run_jobs, print_summary
+
+# Benchmarks history file (JSON, one entry per run), kept in the user's cache directory (as the IP
+# cache) to persist across checkouts/build directories (CI caches this directory). Results are checked
+# against the median of the last runs on the same machine, or against an explicit baseline file (same
+# format, ex: history of a reference run) when LITEX_BOARDS_BENCH_BASELINE is set.
+history_filename  = os.environ.get("LITEX_BOARDS_BENCH_HISTORY",
+    os.path.join(os.path.expanduser("~"), ".cache", "litex-boards", "benchmarks", "history.json"))
+baseline_filename = os.environ.get("LITEX_BOARDS_BENCH_BASELINE", None)
+machine           = os.environ.get("LITEX_BOARDS_BENCH_MACHINE", f"{socket.gethostname()}/{os.cpu_count()}")
+threshold         = float(os.environ.get("LITEX_BOARDS_BENCH_THRESHOLD", "0.25"))
+history_depth     = 5
+
+# Heavy benchmarks (UltraScale+ PCIe/HBM targets, largest elaborations of the matrix) are opt-in
+# (LITEX_BOARDS_BENCH_HEAVY=1).
+with_heavy = (os.environ.get("LITEX_BOARDS_BENCH_HEAVY", "0") == "1")
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def verilog_size(gateware_dir):
+    size = 0
+    for root, dirs, files in os.walk(gateware_dir):
+        for f in files:
+            if f.endswith((".v", ".sv")):
+                size += os.path.getsize(os.path.join(root, f))
+    return size
+
+def load_history(filename):
+    if not os.path.exists(filename):
+        return []
+    with open(filename) as f:
+        return json.load(f)
+
+def save_history(filename, history):
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    with open(filename, "w") as f:
+        json.dump(history, f, indent=4)
+
+# Test Benchmarks ----------------------------------------------------------------------------------
+
+class TestBenchmarks(unittest.TestCase):
+    benchmarks = {
+        # Name                    Target                  Arguments.
+        "icebreaker"            : ("icebreaker",           []),
+        "lambdaconcept_ecpix5"  : ("lambdaconcept_ecpix5", []),
+        "colorlight_5a_75x"     : ("colorlight_5a_75x",    []),
+        "digilent_arty"         : ("digilent_arty",        []),
+    }
+    heavy_benchmarks = {
+        "sqrl_xcu1525_pcie"     : ("sqrl_xcu1525",         ["--with-pcie"]),
+        "xilinx_alveo_u280_hbm" : ("xilinx_alveo_u280",    ["--with-hbm"]),
+    }
+    common_args = ["--build", "--no-compile"]
+
+    # Elaborate benchmark matrix, record results to history and check for regressions.
+    def test_benchmarks(self):
+        benchmarks = dict(self.benchmarks)
+        if with_heavy:
+            benchmarks.update(self.heavy_benchmarks)
+        history = load_history(history_filename)
+
+        # References: Explicit baseline (any machine) or previous runs on this machine.
+        if baseline_filename is not None:
+            self.assertTrue(os.path.exists(baseline_filename), f"Benchmarks baseline {baseline_filename} not found.")
+            references = load_history(baseline_filename)
+        else:
+            references = [e for e in history if e["machine"] == machine]
+
+        # Run benchmarks (one at a time, to not disturb measurements).
+        results = {}
+        for name, (target, args) in benchmarks.items():
+            job = Job(name,
+                module     = f"litex_boards.targets.{target}",
+                args       = args + self.common_args,
+                output_dir = os.path.join("build", "benchmarks", name))
+            results[name] = run_jobs([job], processes=1)[0]
+        print_summary("Benchmarks", list(results.values()))
+
+        # Collect measurements.
+        entry = {"time": time.time(), "machine": machine, "results": {}}
+        for name, r in results.items():
+            if r.returncode == 0:
+                entry["results"][name] = {
+                    "args"         : benchmarks[name][1] + self.common_args,
+                    "duration"     : r.duration,
+                    "max_rss"      : r.max_rss,
+                    "verilog_size" : verilog_size(os.path.join("build", "benchmarks", name, "gateware")),
+                }
+
+        # Check results against history.
+        for name, r in results.items():
+            with self.subTest(benchmark=name):
+                self.assertEqual(r.returncode, 0, f"{name} failed, see {r.log_filename}.")
+                current = entry["results"][name]
+                refs    = [e["results"][name] for e in references
+                    if name in e["results"] and
+                       e["results"][name]["args"] == current["args"]][-history_depth:]
+                if baseline_filename is not None:
+                    self.assertTrue(len(refs), f"{name}: No reference in {baseline_filename}.")
+                for metric in ["duration", "max_rss"]:
+                    values = [ref[metric] for ref in refs if ref[metric] is not None]
+                    if current[metric] is None or len(values) == 0:
+                        continue
+                    reference = statistics.median(values)
+                    self.assertLessEqual(current[metric], reference*(1 + threshold),
+                        f"{name}: {metric} regressed from {reference:.1f} to {current[metric]:.1f} (threshold {threshold*100:.0f}%).")
+
+        # Update history.
+        history.append(entry)
+        save_history(history_filename, history)
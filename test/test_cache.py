@@ -0,0 +1,56 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex_boards.tools.runner import Job, run_jobs
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def read_tree(path):
+    tree = {}
+    for root, dirs, files in os.walk(path):
+        for f in files:
+            filename = os.path.join(root, f)
+            with open(filename, "rb") as _f:
+                tree[os.path.relpath(filename, path)] = _f.read()
+    return tree
+
+# Test Elaboration Cache ---------------------------------------------------------------------------
+
+class TestCache(unittest.TestCase):
+    def run_cached(self, tmp_dir, args=[]):
+        job = Job("icebreaker",
+            module     = "litex_boards.targets.icebreaker",
+            args       = ["--build", "--no-compile"] + args,
+            output_dir = os.path.join(tmp_dir, "build", "icebreaker"),
+            cache_dir  = os.path.join(tmp_dir, "cache"))
+        result = run_jobs([job], processes=1)[0]
+        self.assertEqual(result.returncode, 0)
+        with open(result.log_filename) as f:
+            log = f.read()
+        return job.output_dir, log
+
+    def test_cache_miss_hit(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Miss: Target elaborated and outputs stored.
+            output_dir, log = self.run_cached(tmp_dir)
+            self.assertIn("Elaboration cache miss", log)
+            gateware = read_tree(os.path.join(output_dir, "gateware"))
+            include  = read_tree(os.path.join(output_dir, "software", "include"))
+            self.assertIn("icebreaker.v", gateware)
+
+            # Hit: Same key, outputs restored identical (without elaborating the SoC).
+            output_dir, log = self.run_cached(tmp_dir)
+            self.assertIn("Elaboration cache hit", log)
+            self.assertNotIn("INFO:SoC", log)
+            self.assertEqual(read_tree(os.path.join(output_dir, "gateware")), gateware)
+            self.assertEqual(read_tree(os.path.join(output_dir, "software", "include")), include)
+
+            # Different arguments: Different key, miss.
+            output_dir, log = self.run_cached(tmp_dir, ["--sys-clk-freq=16e6"])
+            self.assertIn("Elaboration cache miss", log)
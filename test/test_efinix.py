@@ -0,0 +1,81 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.soc.interconnect.axi import *
+
+from litex_boards.targets.efinix_trion_t120_bga576_dev_kit import _DRAMAXIAdapter
+
+# Trion DDR Target Model ---------------------------------------------------------------------------
+
+trion_ddr_target_layout = [
+    ("atype",  1), ("aaddr", 32), ("aid",    8), ("alen",   8), ("asize",  3),
+    ("aburst", 2), ("alock",  2), ("avalid", 1), ("aready", 1),
+    ("rid",    8), ("rdata", 256), ("rlast", 1), ("rresp",  2), ("rvalid", 1), ("rready", 1),
+    ("wid",    8), ("wstrb",  32), ("wdata", 256), ("wlast", 1), ("wvalid", 1), ("wready", 1),
+    ("bid",    8), ("bvalid", 1), ("bready", 1),
+]
+
+class TrionDDRTargetModel:
+    """Address channel of a Trion DDR target: accepts a request every `period` cycles."""
+    def __init__(self, io, period=3):
+        self.io       = io
+        self.period   = period
+        self.requests = []
+        self.errors   = 0
+
+    @passive
+    def generator(self):
+        io      = self.io
+        cycle   = 0
+        pending = None
+        while True:
+            yield io.aready.eq((cycle % self.period) == 0)
+            yield
+            if (yield io.avalid):
+                request = ((yield io.atype), (yield io.aaddr), (yield io.alen))
+                # Request must be held until accepted.
+                if pending is not None and request != pending:
+                    self.errors += 1
+                if (yield io.aready):
+                    self.requests.append(request)
+                    pending = None
+                else:
+                    pending = request
+            cycle += 1
+
+# Test Efinix --------------------------------------------------------------------------------------
+
+class TestEfinix(unittest.TestCase):
+    def test_trion_dram_axi_adapter(self):
+        # Concurrent AXI read/write bursts sharing the Trion DDR target address channel.
+        axi_port = AXIInterface(data_width=256, address_width=28, id_width=8)
+        io       = Record(trion_ddr_target_layout)
+        dut      = _DRAMAXIAdapter(axi_port, io)
+        model    = TrionDDRTargetModel(io)
+        n        = 8
+
+        def channel(a, addresses):
+            for address in addresses:
+                yield a.valid.eq(1)
+                yield a.addr.eq(address)
+                yield a.len.eq(15)
+                yield
+                while not (yield a.ready):
+                    yield
+                yield a.valid.eq(0)
+
+        reads  = [0x1000*i          for i in range(n)]
+        writes = [0x1000*i + 0x0800 for i in range(n)]
+        run_simulation(dut, [
+            channel(axi_port.ar, reads),
+            channel(axi_port.aw, writes),
+            model.generator(),
+        ])
+        self.assertEqual(model.errors, 0)
+        self.assertEqual(sorted(model.requests), sorted([(0, a, 15) for a in reads] + [(1, a, 15) for a in writes]))
@@ -0,0 +1,486 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import random
+import unittest
+
+from migen import *
+
+from litex_boards.cores.ethernet import *
+
+# XGMII Stream -------------------------------------------------------------------------------------
+
+def xgmii_words(seed=0, frames=8):
+    """XGMII (data, ctl) words: Frames starting on lane 0/4 and terminating on all lanes, with Idles."""
+    prng  = random.Random(seed)
+    words = []
+    def word(chars, ctl):
+        words.append((sum(c << 8*i for i, c in enumerate(chars)), ctl))
+    for n in range(frames):
+        for i in range(4):
+            word([XGMII_IDLE]*8, 0xff)
+        if n%2:
+            word([XGMII_IDLE]*4 + [XGMII_START] + [0x55]*3, 0x1f)
+        else:
+            word([XGMII_START] + [0x55]*6 + [0xd5], 0x01)
+        for i in range(prng.randrange(1, 8)):
+            word([prng.randrange(256) for i in range(8)], 0x00)
+        last = n%8
+        word([prng.randrange(256) for i in range(last)] + [XGMII_TERM] + [XGMII_IDLE]*(7 - last), (0xff << last) & 0xff)
+    return words
+
+# Test Ethernet ------------------------------------------------------------------------------------
+
+class TestEthernet(unittest.TestCase):
+    def test_baser_scrambler_descrambler(self):
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.scrambler   = BaseRScrambler()
+                self.submodules.descrambler = BaseRDescrambler()
+                self.comb += self.descrambler.i.eq(self.scrambler.o)
+
+        dut   = DUT()
+        prng  = random.Random(42)
+        datas = [prng.randrange(2**64) for i in range(64)]
+        outs  = []
+
+        def generator():
+            for data in datas + [0, 0]:
+                yield dut.scrambler.i.eq(data)
+                yield
+                outs.append((yield dut.descrambler.o))
+                # Scrambled data must differ from data.
+                if data != 0:
+                    self.assertNotEqual((yield dut.scrambler.o), data)
+
+        run_simulation(dut, generator())
+        self.assertEqual(outs[2:], datas)
+
+    def test_baser_pcs_loopback(self):
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.tx = BaseRPCSTX()
+                self.submodules.rx = BaseRPCSRX()
+
+        dut      = DUT()
+        words    = xgmii_words()
+        received = []
+        slips    = []
+
+        def tx_generator():
+            for i in range(8):
+                for data, ctl in words:
+                    yield dut.tx.xgmii_data.eq(data)
+                    yield dut.tx.xgmii_ctl.eq(ctl)
+                    yield
+
+        @passive
+        def channel_generator(offset=62):
+            # Serial channel: RX initially receiving blocks offset by 62 bits, 1-bit shift on slips.
+            bits, nbits = 0, 0
+            while True:
+                header = (yield dut.tx.header)
+                data   = (yield dut.tx.data)
+                bits  |= (header | (data << 2)) << nbits
+                nbits += 66
+                if (yield dut.rx.slip):
+                    slips.append(offset)
+                    offset = (offset + 1)%66
+                if nbits >= 2*66:
+                    block  = (bits >> offset) & (2**66 - 1)
+                    bits >>= 66
+                    nbits -= 66
+                    yield dut.rx.header.eq(block & 0b11)
+                    yield dut.rx.data.eq(block >> 2)
+                yield
+
+        @passive
+        def rx_generator():
+            while True:
+                if (yield dut.rx.block_lock):
+                    received.append(((yield dut.rx.xgmii_data), (yield dut.rx.xgmii_ctl)))
+                yield
+
+        run_simulation(dut, [tx_generator(), channel_generator(), rx_generator()])
+
+        # Block lock acquired through slips, then XGMII words received as transmitted.
+        self.assertNotEqual(len(slips), 0)
+        received = received[4:] # Lock -> XGMII latency.
+        self.assertGreater(len(received), 2*len(words))
+        sent = words*8
+        for k in range(len(words)):
+            if sent[k:k + len(received)] == received:
+                break
+        else:
+            self.fail("XGMII words not received as transmitted.")
+
+    def test_baser_pcs_encoding(self):
+        dut = BaseRPCSTX()
+
+        def generator():
+            # Idles / Data / Start on lane 0 / Data / Terminate on lane 3.
+            words = [
+                ([XGMII_IDLE]*8,                                0xff, BASER_SYNC_CTRL),
+                ([0x01]*8,                                      0x00, BASER_SYNC_DATA),
+                ([XGMII_START] + [0x55]*6 + [0xd5],             0x01, BASER_SYNC_CTRL),
+                ([0x02]*8,                                      0x00, BASER_SYNC_DATA),
+                ([0x03]*3 + [XGMII_TERM] + [XGMII_IDLE]*4,      0xf8, BASER_SYNC_CTRL),
+            ]
+            for chars, ctl, header in words:
+                yield dut.xgmii_data.eq(int.from_bytes(bytes(chars), "little"))
+                yield dut.xgmii_ctl.eq(ctl)
+                yield
+                yield
+                self.assertEqual((yield dut.header), header)
+
+        run_simulation(dut, generator())
+
+    def test_baser_gearbox_loopback(self, offset=23):
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.tx = BaseRTXGearbox()
+                self.submodules.rx = BaseRRXGearbox()
+
+        dut      = DUT()
+        prng     = random.Random(42)
+        blocks   = [prng.randrange(2**66) for i in range(1024)]
+        received = []
+
+        def tx_generator():
+            # Blocks consumed on 20 cycles out of 33.
+            for block in blocks:
+                yield dut.tx.sink.valid.eq(1)
+                yield dut.tx.sink.data.eq(block)
+                yield
+                while not (yield dut.tx.sink.ready):
+                    yield
+
+        @passive
+        def channel_generator():
+            # Serial channel: Receiving offset bits before the transmitted ones.
+            bits, nbits = prng.randrange(2**offset), offset
+            while True:
+                bits  |= (yield dut.tx.data) << nbits
+                nbits += 40
+                yield dut.rx.data.eq(bits & (2**40 - 1))
+                bits  >>= 40
+                nbits  -= 40
+                yield
+
+        @passive
+        def rx_generator():
+            # Slip until receiving transmitted blocks, then receive blocks.
+            while True:
+                if (yield dut.rx.source.valid):
+                    if (yield dut.rx.source.data) in blocks:
+                        break
+                    yield dut.rx.slip.eq(1)
+                    yield
+                    yield dut.rx.slip.eq(0)
+                    for i in range(4):
+                        yield
+                yield
+            while True:
+                if (yield dut.rx.source.valid):
+                    received.append((yield dut.rx.source.data))
+                yield
+
+        run_simulation(dut, [tx_generator(), channel_generator(), rx_generator()])
+
+        # Blocks received aligned, as transmitted.
+        self.assertGreater(len(received), len(blocks)//2)
+        self.assertIn(received[0], blocks)
+        k = blocks.index(received[0])
+        self.assertEqual(blocks[k:k + len(received)], received)
+
+    def test_baser_serdes_datapath(self, offset=54):
+        # PCS in eth (156.25MHz), gearboxes in serdes (257.8125MHz): Periods ratio of 66/40.
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.pcs_tx     = ClockDomainsRenamer("eth")(BaseRPCSTX())
+                self.submodules.tx_cdc     = BaseRBlockCDC("eth", "serdes")
+                self.submodules.tx_gearbox = ClockDomainsRenamer("serdes")(BaseRTXGearbox())
+                self.submodules.rx_gearbox = ClockDomainsRenamer("serdes")(BaseRRXGearbox())
+                self.submodules.rx_cdc     = BaseRBlockCDC("serdes", "eth")
+                self.submodules.pcs_rx     = ClockDomainsRenamer("eth")(BaseRPCSRX())
+                self.submodules.rx_slip    = PulseSynchronizer("eth", "serdes")
+                self.comb += [
+                    self.tx_cdc.sink.valid.eq(1),
+                    self.tx_cdc.sink.data.eq(Cat(self.pcs_tx.header, self.pcs_tx.data)),
+                    self.tx_cdc.source.connect(self.tx_gearbox.sink),
+                    self.rx_gearbox.source.connect(self.rx_cdc.sink),
+                    self.rx_cdc.source.ready.eq(1),
+                    self.pcs_rx.header.eq(Mux(self.rx_cdc.source.valid, self.rx_cdc.source.data[:2], 0b00)),
+                    self.pcs_rx.data.eq(self.rx_cdc.source.data[2:]),
+                    self.rx_slip.i.eq(self.pcs_rx.slip),
+                    self.rx_gearbox.slip.eq(self.rx_slip.o),
+                ]
+
+        dut      = DUT()
+        words    = xgmii_words()
+        received = []
+
+        def generator():
+            # Send XGMII words continuously, receive them once block lock is acquired.
+            n = 0
+            while len(received) < 2*len(words):
+                data, ctl = words[n%len(words)]
+                yield dut.pcs_tx.xgmii_data.eq(data)
+                yield dut.pcs_tx.xgmii_ctl.eq(ctl)
+                yield
+                n += 1
+                self.assertLess(n, 64*len(words))
+                if (yield dut.pcs_rx.block_lock):
+                    received.append(((yield dut.pcs_rx.xgmii_data), (yield dut.pcs_rx.xgmii_ctl)))
+
+        @passive
+        def channel_generator():
+            # Serial channel: Receiving offset bits before the transmitted ones (2 slips to lock).
+            bits, nbits = 0, offset
+            while True:
+                bits  |= (yield dut.tx_gearbox.data) << nbits
+                nbits += 40
+                yield dut.rx_gearbox.data.eq(bits & (2**40 - 1))
+                bits  >>= 40
+                nbits  -= 40
+                yield
+
+        run_simulation(dut, {"eth": generator(), "serdes": channel_generator()},
+            clocks={"eth": 66, "serdes": 40})
+
+        # XGMII words received as transmitted (no block lost/repeated by the CDCs/gearboxes).
+        received = received[4:] # Lock -> XGMII latency.
+        sent     = words*64
+        for k in range(len(words)):
+            if sent[k:k + len(received)] == received:
+                break
+        else:
+            self.fail("XGMII words not received as transmitted.")
+
+    def test_udp_streamer_throughput(self):
+        # Streamer sending to a host through a LiteEth UDP/IP core and PHY model (1 byte/cycle, no
+        # preamble/FCS), the host only answering the ARP request of the core.
+        from liteeth.phy.model import LiteEthPHYModel
+        from liteeth.core import LiteEthUDPIPCore
+
+        packet_words = 16
+
+        class DUT(Module):
+            def __init__(self):
+                self.pads = Record([("source_valid", 1), ("source_data", 8), ("sink_valid", 1), ("sink_data", 8)])
+                self.submodules.phy      = LiteEthPHYModel(self.pads)
+                self.submodules.core     = LiteEthUDPIPCore(self.phy, 0x10e2d5000000, "192.168.1.50", 100e6, with_icmp=False)
+                self.submodules.streamer = UDPStreamer(5678, dst_ip="192.168.1.100", dst_port=6000, packet_words=packet_words)
+                port = self.core.udp.crossbar.get_port(5678, dw=32)
+                self.comb += [
+                    self.streamer.udp_tx.connect(port.sink),
+                    port.source.connect(self.streamer.udp_rx),
+                ]
+
+        dut    = DUT()
+        frames = [] # (End cycle, Data).
+
+        @passive
+        def source_generator():
+            # Continuous data source.
+            data = 0
+            yield dut.streamer.sink.valid.eq(1)
+            while True:
+                yield dut.streamer.sink.data.eq(data)
+                yield
+                if (yield dut.streamer.sink.ready):
+                    data += 1
+
+        def phy_tx_generator():
+            # ARP request + 2 UDP packets.
+            frame = []
+            cycle = 0
+            while len(frames) < 3:
+                yield
+                cycle += 1
+                if (yield dut.pads.source_valid):
+                    frame.append((yield dut.pads.source_data))
+                elif frame:
+                    frames.append((cycle, bytes(frame)))
+                    frame = []
+
+        @passive
+        def phy_rx_generator():
+            # ARP reply from the host (10:e2:d5:00:00:01, 192.168.1.100).
+            reply = bytes.fromhex("10e2d5000000" "10e2d5000001" "0806" "0001" "0800" "06" "04" "0002"
+                                  "10e2d5000001" "c0a80164" "10e2d5000000" "c0a80132")
+            while not frames:
+                yield
+            for byte in reply.ljust(60, bytes(1)):
+                yield dut.pads.sink_valid.eq(1)
+                yield dut.pads.sink_data.eq(byte)
+                yield
+            yield dut.pads.sink_valid.eq(0)
+
+        run_simulation(dut, [source_generator(), phy_tx_generator(), phy_rx_generator()],
+            clocks={"sys": 10, "eth_rx": 10, "eth_tx": 10})
+
+        # ARP request for the destination IP.
+        self.assertEqual(frames[0][1][12:14], bytes.fromhex("0806"))
+        self.assertEqual(frames[0][1][38:42], bytes.fromhex("c0a80164"))
+
+        # UDP packets to the host with the source data, in packets of packet_words.
+        for n, (cycle, frame) in enumerate(frames[1:]):
+            self.assertEqual(frame[0:6],   bytes.fromhex("10e2d5000001"))
+            self.assertEqual(frame[12:14], bytes.fromhex("0800"))
+            self.assertEqual(frame[30:34], bytes.fromhex("c0a80164"))
+            self.assertEqual(frame[34:38], (5678).to_bytes(2, "big") + (6000).to_bytes(2, "big"))
+            self.assertEqual(frame[42:], b"".join(i.to_bytes(4, "little") for i in range(n*packet_words, (n + 1)*packet_words)))
+
+        # Packets sent back-to-back, close to line rate: 42 bytes of headers and 12 of inter-frame gap.
+        line_rate_cycles = 42 + 4*packet_words + 12
+        self.assertGreater(line_rate_cycles/(frames[2][0] - frames[1][0]), 0.95)
+
+    def test_udp_streamer_packet_words_clamp(self):
+        # Packet size above the TX FIFO depth: Clamped (packets never fully buffered otherwise).
+        dut  = UDPStreamer(5678, packet_words=8)
+        sent = []
+
+        def generator():
+            yield dut._packet_words.storage.eq(1000)
+            yield dut.sink.valid.eq(1)
+            yield dut.udp_tx.ready.eq(1)
+            for i in range(128):
+                yield
+                if (yield dut.udp_tx.valid):
+                    sent.append(((yield dut.udp_tx.length), (yield dut.udp_tx.last)))
+            self.assertGreater((yield dut._tx_packets.status), 0)
+
+        run_simulation(dut, generator())
+        self.assertEqual(sent[:16], [(4*16, 0)]*15 + [(4*16, 1)])
+
+    def test_udp_streamer_rx(self):
+        dut      = UDPStreamer(5678)
+        received = []
+
+        def generator():
+            for n in range(4):
+                for i in range(16):
+                    yield dut.udp_rx.valid.eq(1)
+                    yield dut.udp_rx.last.eq(i == 15)
+                    yield dut.udp_rx.data.eq(16*n + i)
+                    yield
+                    while not (yield dut.udp_rx.ready):
+                        yield
+            yield dut.udp_rx.valid.eq(0)
+            yield
+            self.assertEqual((yield dut._rx_packets.status), 4)
+
+        @passive
+        def sink_generator():
+            yield dut.source.ready.eq(1)
+            while True:
+                if (yield dut.source.valid):
+                    received.append((yield dut.source.data))
+                yield
+
+        run_simulation(dut, [generator(), sink_generator()])
+        self.assertEqual(received, list(range(64)))
+
+    def etherbone_block_read(self, master, length=255):
+        from litex.soc.interconnect import wishbone
+        from liteeth.frontend.etherbone import LiteEthEtherboneRecord
+        from litex.tools.remote.etherbone import EtherboneRecord, EtherboneReads
+
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.record = LiteEthEtherboneRecord(buffer_depth=255)
+                self.submodules.master = master
+                self.submodules.sram   = wishbone.SRAM(1024, init=[0x01000000*i + i for i in range(256)])
+                self.comb += [
+                    self.record.receiver.source.connect(master.sink),
+                    master.source.connect(self.record.sender.sink),
+                    master.bus.connect(self.sram.bus),
+                ]
+
+        # Record reading length words from the SRAM.
+        record = EtherboneRecord()
+        record.reads = EtherboneReads(addrs=[4*i for i in range(length)])
+        record.reads.base_ret_addr = 0x1234
+        record.encode()
+        words = [int.from_bytes(record.bytes[i:i + 4], "little") for i in range(0, len(record.bytes), 4)]
+
+        dut      = DUT()
+        response = bytearray()
+        cycles   = []
+
+        def generator():
+            for i, word in enumerate(words):
+                yield dut.record.sink.valid.eq(1)
+                yield dut.record.sink.last.eq(i == len(words) - 1)
+                yield dut.record.sink.data.eq(word)
+                yield
+                while not (yield dut.record.sink.ready):
+                    yield
+            yield dut.record.sink.valid.eq(0)
+            while len(response) < 4*(2 + length):
+                yield
+
+        @passive
+        def cycles_generator():
+            # Cycles from first Wishbone access to last Wishbone ack.
+            cycle = 0
+            while True:
+                if (yield dut.master.bus.stb) and not cycles:
+                    cycles.append(cycle)
+                if (yield dut.master.bus.ack) and (yield dut.master.sink.last):
+                    cycles.append(cycle)
+                cycle += 1
+                yield
+
+        @passive
+        def response_generator():
+            yield dut.record.source.ready.eq(1)
+            while True:
+                if (yield dut.record.source.valid):
+                    response.extend(((yield dut.record.source.data)).to_bytes(4, "little"))
+                yield
+
+        run_simulation(dut, [generator(), cycles_generator(), response_generator()])
+
+        # Reads returned as writes to base_ret_addr.
+        record = EtherboneRecord(init=response)
+        record.decode()
+        self.assertEqual(record.wcount, length)
+        self.assertEqual(record.writes.base_addr, 0x1234)
+        self.assertEqual(record.writes.get_datas(), [0x01000000*i + i for i in range(length)])
+        return cycles[1] - cycles[0]
+
+    def test_etherbone_burst_block_read(self):
+        from liteeth.frontend.etherbone import LiteEthEtherboneWishboneMaster
+        cycles       = self.etherbone_block_read(LiteEthEtherboneWishboneMaster(), length=16)/16
+        burst_cycles = self.etherbone_block_read(EtherboneBurstWishboneMaster(),   length=255)/255
+        self.assertLess(burst_cycles, cycles)
+
+    def test_etherbone_burst_with_ethmac(self):
+        from litex.build.generic_platform import Pins, Subsignal
+        from litex.build.sim import SimPlatform
+        from litex.soc.integration.soc_core import SoCCore
+        from liteeth.phy.model import LiteEthPHYModel
+        def soc(with_ethernet=False, with_ethmac=False):
+            platform = SimPlatform("SIM", [("sys_clk", 0, Pins(1)), ("eth", 0,
+                Subsignal("source_valid", Pins(1)), Subsignal("source_data", Pins(8)),
+                Subsignal("sink_valid",   Pins(1)), Subsignal("sink_data",   Pins(8)))])
+            soc = SoCCore(platform, 100e6, cpu_type=None, integrated_sram_size=0, with_uart=False)
+            soc.ethphy = LiteEthPHYModel(platform.request("eth"))
+            if with_ethernet:
+                soc.add_ethernet(phy=soc.ethphy, with_timing_constraints=False)
+            add_etherbone_burst(soc, phy=soc.ethphy, with_ethmac=with_ethmac, with_timing_constraints=False)
+            return soc
+
+        # Etherbone Burst sharing the PHY with the Ethernet MAC (as LiteX's add_etherbone).
+        dut = soc(with_ethmac=True)
+        self.assertIs(dut.ethmac, dut.ethcore_etherbone.mac)
+        self.assertIn("ethmac_rx", dut.bus.slaves)
+        self.assertIn("ethmac_tx", dut.bus.slaves)
+
+        # Ethernet MAC added separately: PHY can't be shared.
+        with self.assertRaises(ValueError):
+            soc(with_ethernet=True)
@@ -0,0 +1,219 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+import argparse
+
+from migen import *
+
+from litex.gen.fhdl.verilog import convert
+
+from litex.build.generic_platform import Pins
+from litex.build.sim import SimPlatform
+
+from litex.soc.interconnect.axi import *
+from litex.soc.integration.soc_core import SoCCore
+
+from litex_boards.cores.hbm import HBM2Interleaver, add_hbm2_slaves, check_hbm2_ports
+
+# HBM2 Port Model ----------------------------------------------------------------------------------
+
+class HBMPortModel:
+    """Read-only model of an HBM2 pseudo-channel AXI port: fixed latency, one beat per cycle."""
+    def __init__(self, axi, latency=32):
+        self.axi     = axi
+        self.latency = latency
+        self.beats   = 0
+
+    @passive
+    def generator(self):
+        axi     = self.axi
+        cycle   = 0
+        pending = []
+        burst   = None
+        yield axi.ar.ready.eq(1)
+        while True:
+            # Accept read commands.
+            if (yield axi.ar.valid) and (yield axi.ar.ready):
+                pending.append([cycle + self.latency, (yield axi.ar.id), (yield axi.ar.len) + 1])
+            # Count accepted beats.
+            if (yield axi.r.valid) and (yield axi.r.ready):
+                self.beats += 1
+                burst[1]   -= 1
+                if burst[1] == 0:
+                    burst = None
+            # Return read data once latency has elapsed.
+            if burst is None and len(pending) and pending[0][0] <= cycle:
+                burst = pending.pop(0)[1:]
+            yield axi.r.valid.eq(burst is not None)
+            if burst is not None:
+                yield axi.r.id.eq(burst[0])
+                yield axi.r.last.eq(burst[1] == 1)
+                yield axi.r.data.eq(self.beats)
+            yield
+            cycle += 1
+
+class HBMAddressModel:
+    """HBM2 AXI port model recording read addresses, single beat responses."""
+    def __init__(self, axi):
+        self.axi       = axi
+        self.addresses = []
+
+    @passive
+    def generator(self):
+        axi = self.axi
+        yield axi.ar.ready.eq(1)
+        while True:
+            yield
+            if (yield axi.ar.valid):
+                self.addresses.append((yield axi.ar.addr))
+                yield axi.ar.ready.eq(0)
+                yield axi.r.valid.eq(1)
+                yield axi.r.last.eq(1)
+                yield axi.r.id.eq((yield axi.ar.id))
+                yield
+                while not (yield axi.r.ready):
+                    yield
+                yield axi.r.valid.eq(0)
+                yield axi.ar.ready.eq(1)
+
+class HBMSoC(SoCCore):
+    """SoC with HBM2 port models attached through add_hbm2_slaves and an AXI DMA master on the bus."""
+    def __init__(self, bus_standard="axi", axi_full=False, nports=1):
+        platform = SimPlatform("SIM", [("sys_clk", 0, Pins(1))])
+        SoCCore.__init__(self, platform, 250e6,
+            cpu_type             = None,
+            bus_standard         = bus_standard,
+            integrated_sram_size = 0,
+            with_uart            = False)
+        self.cd_sys = ClockDomain()
+        self.hbm_axi = [AXIInterface(data_width=256, address_width=33, id_width=6) for n in range(nports)]
+        add_hbm2_slaves(self, self.hbm_axi, nports=nports, axi_full=axi_full)
+        self.dma = AXIInterface(data_width=32, address_width=32, id_width=1)
+        self.bus.add_master("dma", self.dma)
+
+# Test HBM -----------------------------------------------------------------------------------------
+
+class TestHBM(unittest.TestCase):
+    data_width    = 256
+    address_width = 33
+
+    def hbm_read_bandwidth(self, axi_full, words, burst):
+        # Reads of 32-bit words from a DMA master on the AXI main bus, through add_hbm2_slaves.
+        soc    = HBMSoC(axi_full=axi_full)
+        hbm    = HBMPortModel(soc.hbm_axi[0], latency=16)
+        cycles = [0]
+        lens   = []
+
+        def master():
+            dma   = soc.dma
+            beats = 0
+            yield dma.ar.burst.eq(0b01) # INCR.
+            yield dma.ar.size.eq(log2_int(32//8))
+            yield dma.ar.len.eq(burst - 1)
+            yield dma.r.ready.eq(1)
+            while (beats < words) and (cycles[0] < 4096):
+                # Read command.
+                yield dma.ar.valid.eq(1)
+                yield dma.ar.addr.eq(0x4000_0000 + beats*4)
+                yield
+                cycles[0] += 1
+                while not (yield dma.ar.ready):
+                    yield
+                    cycles[0] += 1
+                yield dma.ar.valid.eq(0)
+                # Read data.
+                while cycles[0] < 4096:
+                    if (yield dma.r.valid):
+                        beats += 1
+                        if (yield dma.r.last):
+                            break
+                    yield
+                    cycles[0] += 1
+                yield
+                cycles[0] += 1
+            self.assertEqual(beats, words)
+
+        @passive
+        def monitor():
+            axi = soc.hbm_axi[0]
+            while True:
+                if (yield axi.ar.valid) and (yield axi.ar.ready):
+                    lens.append((yield axi.ar.len))
+                yield
+
+        run_simulation(soc, [master(), monitor(), hbm.generator()])
+        return words*4/cycles[0], lens
+
+    def test_hbm_read_bandwidth(self):
+        # AXI-Lite (default HBM2 attachment): Single-beat accesses.
+        axi_lite_bandwidth, lens = self.hbm_read_bandwidth(axi_full=False, words=16, burst=1)
+        self.assertEqual(lens, [0]*16)
+
+        # Full AXI (--hbm-axi-full): Burst reaches the HBM2 port (64 32-bit words: 8 256-bit beats).
+        axi_bandwidth, lens = self.hbm_read_bandwidth(axi_full=True, words=64, burst=64)
+        self.assertEqual(lens, [8 - 1])
+        self.assertGreater(axi_bandwidth, 8*axi_lite_bandwidth)
+
+    def test_hbm_axi_full_requires_axi_bus(self):
+        with self.assertRaises(ValueError):
+            HBMSoC(bus_standard="wishbone", axi_full=True)
+
+    def test_check_hbm2_ports(self):
+        parser = argparse.ArgumentParser()
+        check_hbm2_ports(parser, nports=4,  interleave=0)
+        check_hbm2_ports(parser, nports=32, interleave=4096)
+        with self.assertRaises(SystemExit):
+            check_hbm2_ports(parser, nports=8,  interleave=0)
+        with self.assertRaises(SystemExit):
+            check_hbm2_ports(parser, nports=16, interleave=2048)
+        with self.assertRaises(ValueError):
+            HBMSoC(nports=8)
+
+    def hbm_interleaver_dut(self, nports, granularity=4096):
+        ports = [AXIInterface(data_width=self.data_width, address_width=self.address_width, id_width=6) for n in range(nports)]
+        size  = min(nports*0x1000_0000, 0x4000_0000)
+        dut   = HBM2Interleaver(ports, size=size, granularity=granularity)
+        return dut, ports
+
+    def test_hbm_interleaver_verilog(self):
+        for nports in [1, 2, 4, 8, 16, 32]:
+            dut, ports = self.hbm_interleaver_dut(nports)
+            dut.cd_sys = ClockDomain()
+            ios = {dut.cd_sys.clk, dut.cd_sys.rst}
+            for axi in [dut.axi] + ports:
+                for channel in ["aw", "w", "b", "ar", "r"]:
+                    ios |= set(getattr(axi, channel).flatten())
+            convert(dut, ios=ios)
+
+    def test_hbm_interleaver_read(self):
+        nports     = 4
+        dut, ports = self.hbm_interleaver_dut(nports)
+        hbms       = [HBMAddressModel(port) for port in ports]
+        addresses  = [0x0000_0000, 0x0000_1040, 0x0000_2000, 0x0000_3fe0, 0x0000_4000, 0x0123_5000]
+
+        def master():
+            axi = dut.axi
+            yield axi.r.ready.eq(1)
+            for address in addresses:
+                yield axi.ar.valid.eq(1)
+                yield axi.ar.addr.eq(address)
+                yield
+                while not (yield axi.ar.ready):
+                    yield
+                yield axi.ar.valid.eq(0)
+                while not ((yield axi.r.valid) and (yield axi.r.last)):
+                    yield
+                yield
+
+        run_simulation(dut, [master()] + [hbm.generator() for hbm in hbms])
+
+        # Every 4KB goes to the next port, at the port's pseudo-channel address (port*256MB) + offset.
+        expected = [[] for n in range(nports)]
+        for address in addresses:
+            port   = (address//4096)%nports
+            offset = (address//(4096*nports))*4096 + address%4096
+            expected[port].append(port*0x1000_0000 + offset)
+        self.assertEqual([hbm.addresses for hbm in hbms], expected)
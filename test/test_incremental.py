@@ -0,0 +1,56 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import time
+import tempfile
+import unittest
+
+from litex.build.yosys_nextpnr_toolchain import YosysNextPNRToolchain
+
+from litex_boards.tools.runner import Job, run_jobs
+
+# Test Incremental Build ---------------------------------------------------------------------------
+
+class TestIncremental(unittest.TestCase):
+    def run_incremental(self, tmp_dir, args=[]):
+        job = Job("icebreaker",
+            module      = "litex_boards.targets.icebreaker",
+            args        = ["--build", "--no-compile-software"] + args,
+            output_dir  = os.path.join(tmp_dir, "build", "icebreaker"),
+            incremental = True)
+        result = run_jobs([job], processes=1)[0]
+        with open(result.log_filename) as f:
+            log = f.read()
+        self.assertEqual(result.returncode, 0, log)
+        return log
+
+    def test_incremental_reuse(self):
+        # Toolchain replaced by the generation of the bitstream (Run in the build directory).
+        run_script = YosysNextPNRToolchain.run_script
+        def toolchain_run_script(self, script):
+            with open(self._build_name + self.platform.get_bitstream_extension(), "w") as f:
+                f.write("bitstream")
+            print("Toolchain run.")
+        YosysNextPNRToolchain.run_script = toolchain_run_script
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                # First build: No previous build, toolchain run.
+                log = self.run_incremental(tmp_dir)
+                self.assertIn("no previous build, running toolchain", log)
+                self.assertIn("Toolchain run.", log)
+
+                # Second build (netlist generated at a different time): Inputs unchanged, reused.
+                time.sleep(1)
+                log = self.run_incremental(tmp_dir)
+                self.assertIn("unchanged, reusing", log)
+                self.assertNotIn("Toolchain run.", log)
+
+                # Design change: Toolchain run.
+                log = self.run_incremental(tmp_dir, ["--sys-clk-freq=16e6"])
+                self.assertIn("inputs changed, running toolchain", log)
+                self.assertIn("Toolchain run.", log)
+        finally:
+            YosysNextPNRToolchain.run_script = run_script
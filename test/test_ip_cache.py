@@ -0,0 +1,47 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex_boards.platforms import sqrl_fk33
+from litex_boards.tools.ip_cache import IPCache, add_vivado_ip
+from litex_boards.cores.hbm import usp_hbm2_ip_config
+
+# Test IP Cache ------------------------------------------------------------------------------------
+
+class TestIPCache(unittest.TestCase):
+    def test_ip_cache_miss_hit(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_dir = os.path.join(tmp_dir, "cache")
+            config    = usp_hbm2_ip_config(axi_clk_freq=250e6)
+
+            # Miss: IP generated from its configuration by Vivado, no .xci used.
+            platform = sqrl_fk33.Platform()
+            platform.output_dir = os.path.join(tmp_dir, "build0")
+            key = add_vivado_ip(platform, name="hbm_0", ip="hbm", config=config, cache_dir=cache_dir)
+            commands = "\n".join(platform.toolchain.pre_synthesis_commands)
+            self.assertIn("create_ip -vendor xilinx.com -library ip -name hbm -module_name hbm_0", commands)
+            self.assertIn(IPCache(cache_dir).entry_path(key), commands)
+            self.assertEqual(len(platform.ips), 0)
+
+            # Same configuration: Same key; different configuration: different key.
+            platform = sqrl_fk33.Platform()
+            self.assertEqual(key, add_vivado_ip(platform, name="hbm_0", ip="hbm", config=config, cache_dir=cache_dir))
+            other_config = usp_hbm2_ip_config(axi_clk_freq=450e6)
+            self.assertNotEqual(key, add_vivado_ip(platform, name="hbm_0", ip="hbm", config=other_config, cache_dir=cache_dir))
+
+            # Hit: Cached .xci copied to the build and used.
+            xci = os.path.join(tmp_dir, "hbm_0.xci.txt")
+            with open(xci, "w") as f:
+                f.write("<xci/>")
+            IPCache(cache_dir).add(key, xci, name="hbm_0.xci")
+            platform = sqrl_fk33.Platform()
+            platform.output_dir = os.path.join(tmp_dir, "build1")
+            add_vivado_ip(platform, name="hbm_0", ip="hbm", config=config, cache_dir=cache_dir)
+            self.assertEqual(len(platform.toolchain.pre_synthesis_commands), 0)
+            self.assertEqual(list(platform.ips), [os.path.join(tmp_dir, "build1", "ip", "hbm_0", "hbm_0.xci")])
+            self.assertEqual(open(list(platform.ips)[0]).read(), "<xci/>")
@@ -0,0 +1,107 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import random
+import unittest
+
+from migen import *
+
+from litex.soc.interconnect import wishbone
+
+from litex_boards.cores.sdram import L2Cache, l2_cache_default_size
+
+# DRAM Model ---------------------------------------------------------------------------------------
+
+class DRAMModel:
+    """Wishbone memory model with fixed access latency."""
+    def __init__(self, bus, latency=8):
+        self.bus      = bus
+        self.latency  = latency
+        self.mem      = {}
+        self.accesses = 0
+
+    @passive
+    def generator(self):
+        bus = self.bus
+        while True:
+            yield bus.ack.eq(0)
+            yield
+            if (yield bus.cyc) and (yield bus.stb):
+                for i in range(self.latency):
+                    yield
+                adr = (yield bus.adr)
+                if (yield bus.we):
+                    self.mem[adr] = (yield bus.dat_w)
+                else:
+                    yield bus.dat_r.eq(self.mem.get(adr, 0))
+                self.accesses += 1
+                yield bus.ack.eq(1)
+                yield
+
+# Test L2 ------------------------------------------------------------------------------------------
+
+class TestL2(unittest.TestCase):
+    def l2_cache_dut(self, ways, cachesize=64):
+        master = wishbone.Interface(data_width=32,  address_width=32, addressing="word")
+        slave  = wishbone.Interface(data_width=128, address_width=32, addressing="word")
+        dut    = L2Cache(cachesize=cachesize, master=master, slave=slave, ways=ways, reverse=False)
+        dram   = DRAMModel(slave)
+        return dut, dram
+
+    def l2_cache_random_test(self, ways):
+        dut, dram = self.l2_cache_dut(ways)
+        errors    = []
+
+        def master():
+            prng = random.Random(42)
+            ref  = {}
+            for i in range(512):
+                adr = prng.randrange(256)
+                if prng.randrange(2):
+                    dat = prng.randrange(2**32)
+                    ref[adr] = dat
+                    yield from dut.master.write(adr, dat)
+                else:
+                    dat = (yield from dut.master.read(adr))
+                    if dat != ref.get(adr, 0):
+                        errors.append((adr, dat, ref.get(adr, 0)))
+
+        run_simulation(dut, [master(), dram.generator()])
+        self.assertEqual(errors, [])
+
+    def test_l2_cache_direct_mapped(self):
+        self.l2_cache_random_test(ways=1)
+
+    def test_l2_cache_2_ways(self):
+        self.l2_cache_random_test(ways=2)
+
+    def test_l2_cache_4_ways(self):
+        self.l2_cache_random_test(ways=4)
+
+    def l2_cache_aliasing_accesses(self, ways):
+        # Alternate reads on 2 lines mapped to the same set of a direct-mapped cache.
+        dut, dram = self.l2_cache_dut(ways)
+
+        def master():
+            for i in range(32):
+                yield from dut.master.read(0x000)
+                yield from dut.master.read(0x100)
+
+        run_simulation(dut, [master(), dram.generator()])
+        return dram.accesses
+
+    def test_l2_cache_aliasing(self):
+        direct_mapped_accesses = self.l2_cache_aliasing_accesses(ways=1)
+        two_ways_accesses      = self.l2_cache_aliasing_accesses(ways=2)
+        self.assertEqual(two_ways_accesses, 2)
+        self.assertGreater(direct_mapped_accesses, 16*two_ways_accesses)
+
+    def test_l2_cache_default_size(self):
+        self.assertEqual(l2_cache_default_size("xcu250-figd2104-2L-e"), 1024*1024)
+        self.assertEqual(l2_cache_default_size("xcku5p-ffvb676-2-e"),    256*1024)
+        self.assertEqual(l2_cache_default_size("xcku040-ffva1156-2-e"),  128*1024)
+        self.assertEqual(l2_cache_default_size("xc7k325t-ffg900-2"),      64*1024)
+        self.assertEqual(l2_cache_default_size("xc7a35ticsg324-1L"),         8192)
+        self.assertEqual(l2_cache_default_size("LFE5U-85F-8BG381C"),         8192)
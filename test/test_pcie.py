@@ -0,0 +1,48 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex_boards.cores.pcie import LitePCIeIRQCoalescer
+
+# Test PCIe ----------------------------------------------------------------------------------------
+
+class TestPCIe(unittest.TestCase):
+    def irq_coalescer_test(self, count, timeout, events, cycles=256):
+        dut = LitePCIeIRQCoalescer(n=2, default_count=count, default_timeout=timeout)
+        irqs = []
+
+        def generator():
+            for cycle in range(cycles):
+                yield dut.irqs_in.eq(0b01 if cycle in events else 0b00)
+                yield
+                if (yield dut.irqs_out[0]):
+                    irqs.append(cycle)
+                self.assertEqual((yield dut.irqs_out[1]), 0)
+
+        run_simulation(dut, generator())
+        return irqs
+
+    def test_irq_coalescer_passthrough(self):
+        events = [10, 11, 20, 100]
+        irqs   = self.irq_coalescer_test(count=1, timeout=0, events=events)
+        self.assertEqual(irqs, [e + 1 for e in events])
+
+    def test_irq_coalescer_count(self):
+        events = list(range(10, 42, 2)) # 16 events.
+        irqs   = self.irq_coalescer_test(count=4, timeout=0, events=events)
+        self.assertEqual(irqs, [e + 1 for e in events[3::4]])
+
+    def test_irq_coalescer_timeout(self):
+        # 2 events (below count threshold): IRQ raised on timeout, relative to the first event.
+        irqs = self.irq_coalescer_test(count=4, timeout=32, events=[10, 20])
+        self.assertEqual(irqs, [10 + 32 + 1])
+
+    def test_irq_coalescer_count_and_timeout(self):
+        # 4 events in a burst (count threshold) then a single event (timeout).
+        irqs = self.irq_coalescer_test(count=4, timeout=32, events=[10, 11, 12, 13, 100])
+        self.assertEqual(irqs, [13 + 1, 100 + 32 + 1])
@@ -0,0 +1,73 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import json
+import tempfile
+import unittest
+
+from litex_boards.tools.profiler import Profiler
+from litex_boards.tools.runner import Job, run_jobs
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def netlist(filename):
+    # Verilog without comments (generation date, module hierarchy).
+    with open(filename, "rb") as f:
+        return re.sub(rb"^[ \t]*//[^\n]*$|/\*.*?\*/", b"", f.read(), flags=re.MULTILINE | re.DOTALL)
+
+def record_names(record):
+    names = {record["name"]}
+    for child in record["children"]:
+        names |= record_names(child)
+    return names
+
+# Test Profiler ------------------------------------------------------------------------------------
+
+class TestProfiler(unittest.TestCase):
+    def test_profiler_records(self):
+        profiler = Profiler(name="test", with_memory=False)
+        for i in range(2):
+            with profiler.record("parent"):
+                with profiler.record("child"):
+                    pass
+        parent = profiler.root.children["parent"]
+        child  = parent.children["child"]
+        self.assertEqual(parent.calls, 2)
+        self.assertEqual(child.calls,  2)
+        self.assertGreaterEqual(parent.duration, child.duration)
+        folded = profiler.root.folded()
+        self.assertEqual([line.split(" ")[0] for line in folded], ["test", "test;parent", "test;parent;child"])
+
+    def test_elaboration_profiler(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            jobs = [Job("icebreaker" + suffix,
+                module     = "litex_boards.targets.icebreaker",
+                args       = ["--build", "--no-compile"],
+                output_dir = os.path.join(tmp_dir, "icebreaker" + suffix),
+                profile    = profile) for suffix, profile in [("", True), ("_ref", False)]]
+            for result in run_jobs(jobs, processes=1):
+                self.assertEqual(result.returncode, 0)
+
+            # Profiling does not change the design.
+            self.assertEqual(
+                netlist(os.path.join(tmp_dir, "icebreaker",     "gateware", "icebreaker.v")),
+                netlist(os.path.join(tmp_dir, "icebreaker_ref", "gateware", "icebreaker.v")))
+
+            # Modules construction, add_* calls and build steps recorded, with memory.
+            profile_dir = os.path.join(tmp_dir, "icebreaker", "profile")
+            with open(os.path.join(profile_dir, "icebreaker.json")) as f:
+                profile = json.load(f)
+            names = record_names(profile["records"])
+            for name in ["main", "BaseSoC", "add_uart(uart)", "Verilog emission"]:
+                self.assertIn(name, names)
+            self.assertGreater(profile["records"]["duration"], 0)
+            self.assertGreater(profile["records"]["memory"], 0)
+
+            # Collapsed stacks (flamegraph).
+            with open(os.path.join(profile_dir, "icebreaker.folded")) as f:
+                lines = f.read().splitlines()
+            self.assertTrue(all(line.split(" ")[0].split(";")[:2] in [["icebreaker"], ["icebreaker", "main"]] for line in lines))
@@ -0,0 +1,226 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+import unittest
+
+from litex_boards.cores.sata import sata_phy_data_width, sata_max_linerate, sata_linerates, sata_stripe_sectors, check_sata_args
+
+# Test SATA ----------------------------------------------------------------------------------------
+
+class TestSATA(unittest.TestCase):
+    @staticmethod
+    def disk_model(port, disk):
+        # SATA device model: 1 word/cycle, status after write data/read data.
+        from migen import passive
+        @passive
+        def generator():
+            while True:
+                yield port.sink.ready.eq(0)
+                if (yield port.sink.valid):
+                    sector = (yield port.sink.sector)
+                    count  = (yield port.sink.count)
+                    write  = (yield port.sink.write)
+                    if write:
+                        for i in range(128*count):
+                            yield port.sink.ready.eq(1)
+                            yield
+                            while not (yield port.sink.valid):
+                                yield
+                            disk[128*sector + i] = (yield port.sink.data)
+                            assert (yield port.sink.last) == (i == 128*count - 1)
+                        yield port.sink.ready.eq(0)
+                    else:
+                        yield port.sink.ready.eq(1)
+                        yield
+                        yield port.sink.ready.eq(0)
+                        for i in range(128*count):
+                            yield port.source.valid.eq(1)
+                            yield port.source.read.eq(1)
+                            yield port.source.end.eq(0)
+                            yield port.source.last.eq(i%128 == 127)
+                            yield port.source.data.eq(disk[128*sector + i])
+                            yield
+                            while not (yield port.source.ready):
+                                yield
+                    # Status.
+                    yield port.source.valid.eq(1)
+                    yield port.source.end.eq(1)
+                    yield port.source.last.eq(1)
+                    yield port.source.failed.eq(0)
+                    yield
+                    while not (yield port.source.ready):
+                        yield
+                    yield port.source.valid.eq(0)
+                    yield port.source.end.eq(0)
+                yield
+        return generator()
+
+    def test_sata_phy_data_width(self):
+        self.assertEqual(sata_phy_data_width("gen1"), 16)
+        self.assertEqual(sata_phy_data_width("gen2"), 16)
+        self.assertEqual(sata_phy_data_width("gen2", 32), 32)
+        self.assertEqual(sata_phy_data_width("gen3"), 32)
+        with self.assertRaises(ValueError):
+            sata_phy_data_width("gen3", 16)
+
+    def test_sata_max_linerate(self):
+        # Gen3 on Kintex7/UltraScale(+) and Artix7 -2/-3, not on Artix7 -1.
+        for device in ["xc7k325t-ffg900-2", "xcku040-ffva1156-2-e", "xcvu9p-fsgd2104-2l-e", "xc7a200t-fbg484-3", "xc7a100t-fgg676-3"]:
+            self.assertGreaterEqual(sata_max_linerate(device), sata_linerates["gen3"])
+        self.assertLess(sata_max_linerate("xc7a200t-sbg484-1"), sata_linerates["gen3"])
+        self.assertGreaterEqual(sata_max_linerate("xc7a200t-sbg484-1"), sata_linerates["gen2"])
+
+    def test_sata_stripe_sectors(self):
+        for stripe_sectors in [1, 2, 16, 256]:
+            self.assertEqual(sata_stripe_sectors(str(stripe_sectors)), stripe_sectors)
+        for value in ["0", "-16", "3", "24"]:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                sata_stripe_sectors(value)
+
+    def test_check_sata_args(self):
+        parser = argparse.ArgumentParser()
+        def args(gen, data_width=None, sys_clk_freq=125e6, with_sata=True):
+            return argparse.Namespace(with_sata=with_sata, sata_gen=gen, sata_data_width=data_width, sys_clk_freq=sys_clk_freq)
+        check_sata_args(parser, args("2"))
+        check_sata_args(parser, args("3", sys_clk_freq=150e6))
+        check_sata_args(parser, args("3", with_sata=False)) # SATA disabled.
+        with self.assertRaises(SystemExit):
+            check_sata_args(parser, args("3", data_width=32)) # KC705/KCU105 default sys clock.
+        with self.assertRaises(SystemExit):
+            check_sata_args(parser, args("3", data_width=16, sys_clk_freq=150e6))
+
+    def test_sata_dram_streamer(self):
+        from migen import run_simulation, passive
+        from litedram.common import LiteDRAMNativePort
+        from litesata.frontend.arbitration import LiteSATAUserPort
+        from litex_boards.cores.sata import LiteSATADRAMStreamer
+
+        port            = LiteSATAUserPort(32)
+        dram_read_port  = LiteDRAMNativePort("read",  address_width=16, data_width=32)
+        dram_write_port = LiteDRAMNativePort("write", address_width=16, data_width=32)
+        dut  = LiteSATADRAMStreamer(port, dram_read_port, dram_write_port, fifo_depth=16)
+        dram = {i: (0x01010101*i) & 0xffffffff for i in range(256)}
+        disk = {}
+
+        def push(sector, base, nsectors, write):
+            yield dut._sector.storage.eq(sector)
+            yield dut._base.storage.eq(base)
+            yield dut._nsectors.storage.eq(nsectors)
+            yield dut._write.storage.eq(write)
+            yield dut._push.re.eq(1)
+            yield
+            yield dut._push.re.eq(0)
+            yield
+
+        def generator():
+            # DRAM @ 0x000 -> Sectors 10/11, Sectors 10/11 -> DRAM @ 0x400.
+            yield from push(sector=10, base=0x000, nsectors=2, write=1)
+            yield from push(sector=10, base=0x400, nsectors=2, write=0)
+            for i in range(4096):
+                yield
+                if (yield dut._done.status) == 2:
+                    break
+            self.assertEqual((yield dut._done.status),   2)
+            self.assertEqual((yield dut._errors.status), 0)
+            self.assertEqual((yield dut._busy.status),   0)
+
+        @passive
+        def dram_read_generator():
+            # DRAM read port model: Data returned 4 cycles after command.
+            pending = []
+            yield dram_read_port.cmd.ready.eq(1)
+            while True:
+                if (yield dram_read_port.cmd.valid):
+                    pending.append((4, dram[(yield dram_read_port.cmd.addr)]))
+                pending = [(d - 1, v) for d, v in pending]
+                if pending and pending[0][0] <= 0:
+                    yield dram_read_port.rdata.valid.eq(1)
+                    yield dram_read_port.rdata.data.eq(pending.pop(0)[1])
+                else:
+                    yield dram_read_port.rdata.valid.eq(0)
+                yield
+
+        @passive
+        def dram_write_generator():
+            # DRAM write port model.
+            addrs = []
+            yield dram_write_port.cmd.ready.eq(1)
+            yield dram_write_port.wdata.ready.eq(1)
+            while True:
+                if (yield dram_write_port.cmd.valid):
+                    addrs.append((yield dram_write_port.cmd.addr))
+                if (yield dram_write_port.wdata.valid):
+                    dram[addrs.pop(0)] = (yield dram_write_port.wdata.data)
+                yield
+
+        run_simulation(dut, [generator(), self.disk_model(port, disk), dram_read_generator(), dram_write_generator()])
+
+        # Sectors written byte-reversed (as SATA's Mem2Sector DMA), read back to DRAM as written.
+        def reverse_bytes(v):
+            return int.from_bytes(v.to_bytes(4, "little"), "big")
+        self.assertEqual([disk[128*10 + i] for i in range(256)], [reverse_bytes(dram[i]) for i in range(256)])
+        self.assertEqual([dram[0x100 + i] for i in range(256)], [dram[i] for i in range(256)])
+
+    def test_sata_raid0(self):
+        from migen import run_simulation
+        from litesata.frontend.arbitration import LiteSATAUserPort
+        from litex_boards.cores.sata import LiteSATARAID0
+
+        drives = [LiteSATAUserPort(32) for i in range(2)]
+        disks  = [{} for i in range(2)]
+        dut    = LiteSATARAID0(drives, stripe_sectors=2)
+        data   = [(0x01010101*i + 0x12345678) & 0xffffffff for i in range(128*5)]
+        status = []
+        rdata  = []
+
+        def generator():
+            # Write Sectors 3-7.
+            for i in range(128*5):
+                yield dut.sink.valid.eq(1)
+                yield dut.sink.write.eq(1)
+                yield dut.sink.sector.eq(3)
+                yield dut.sink.count.eq(5)
+                yield dut.sink.last.eq(i == 128*5 - 1)
+                yield dut.sink.data.eq(data[i])
+                yield
+                while not (yield dut.sink.ready):
+                    yield
+            yield dut.sink.valid.eq(0)
+            yield dut.sink.write.eq(0)
+            while len(status) < 1:
+                yield
+
+            # Read Sectors 3-7.
+            yield dut.sink.valid.eq(1)
+            yield dut.sink.read.eq(1)
+            yield dut.sink.last.eq(1)
+            yield
+            while not (yield dut.sink.ready):
+                yield
+            yield dut.sink.valid.eq(0)
+            while len(status) < 2:
+                yield
+
+        def source_generator():
+            yield dut.source.ready.eq(1)
+            while len(status) < 2:
+                if (yield dut.source.valid):
+                    if (yield dut.source.end):
+                        status.append((yield dut.source.failed))
+                    else:
+                        rdata.append((yield dut.source.data))
+                yield
+
+        run_simulation(dut, [generator(), source_generator()] + [self.disk_model(d, disk) for d, disk in zip(drives, disks)])
+
+        # Stripes of 2 sectors: Sector 3 -> Drive 1 Sector 1, 4/5 -> Drive 0 Sectors 2/3, 6/7 -> Drive 1 Sectors 2/3.
+        self.assertEqual(status, [0, 0])
+        self.assertEqual(sorted(disks[0].keys()), list(range(128*2, 128*4)))
+        self.assertEqual(sorted(disks[1].keys()), list(range(128*1, 128*4)))
+        self.assertEqual([disks[1][128*1 + i] for i in range(128)],   data[128*0:128*1])
+        self.assertEqual([disks[0][128*2 + i] for i in range(256)],   data[128*1:128*3])
+        self.assertEqual([disks[1][128*2 + i] for i in range(256)],   data[128*3:128*5])
+        self.assertEqual(rdata, data)
@@ -0,0 +1,78 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+import argparse
+
+from migen import *
+
+from litedram.common import LiteDRAMNativePort
+
+from litex_boards.cores.sdram import LiteDRAMInterleaver, check_dram_interleave
+
+# DRAM Port Model ----------------------------------------------------------------------------------
+
+class DRAMPortModel:
+    """LiteDRAM Native port memory model (one command at a time)."""
+    def __init__(self, port):
+        self.port = port
+        self.mem  = {}
+
+    @passive
+    def generator(self):
+        port = self.port
+        yield port.cmd.ready.eq(1)
+        yield port.wdata.ready.eq(1)
+        while True:
+            yield
+            if (yield port.cmd.valid):
+                address = (yield port.cmd.addr)
+                if (yield port.cmd.we):
+                    while not (yield port.wdata.valid):
+                        yield
+                    self.mem[address] = (yield port.wdata.data)
+                else:
+                    yield port.rdata.valid.eq(1)
+                    yield port.rdata.data.eq(self.mem.get(address, 0))
+                    yield
+                    while not (yield port.rdata.ready):
+                        yield
+                    yield port.rdata.valid.eq(0)
+
+# Test SDRAM ---------------------------------------------------------------------------------------
+
+class TestSDRAM(unittest.TestCase):
+    def test_dram_interleaver(self):
+        ports = [LiteDRAMNativePort(mode="both", address_width=32, data_width=32) for n in range(4)]
+        drams = [DRAMPortModel(port) for port in ports]
+        dut   = LiteDRAMInterleaver(ports, size=0x2000_0000, granularity=4096, data_width=32, offset=0x4000_0000)
+        reads = []
+
+        # Accesses every 4KB (word addresses): Spread over the channels.
+        addresses = [n*1024 + 3 for n in range(8)]
+        def generator():
+            for adr in addresses:
+                yield from dut.bus.write(adr, adr)
+            for adr in addresses:
+                reads.append((yield from dut.bus.read(adr)))
+
+        run_simulation(dut, [generator()] + [dram.generator() for dram in drams])
+        self.assertEqual(reads, addresses)
+
+        # Channel n gets the 4KB blocks n, n + 4..., after offset (1GB).
+        for n, dram in enumerate(drams):
+            self.assertEqual(dram.mem, {
+                0x1000_0000 + 3:        n*1024 + 3,
+                0x1000_0000 + 1024 + 3: (n + 4)*1024 + 3,
+            })
+
+    def test_check_dram_interleave(self):
+        parser = argparse.ArgumentParser()
+        check_dram_interleave(parser, nchannels=4, granularity=4096)
+        check_dram_interleave(parser, nchannels=3, granularity=0) # Disabled.
+        with self.assertRaises(SystemExit):
+            check_dram_interleave(parser, nchannels=3, granularity=4096)
+        with self.assertRaises(SystemExit):
+            check_dram_interleave(parser, nchannels=2, granularity=3000)
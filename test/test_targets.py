@@ -5,7 +5,6 @@
 # This file is Copyright (c) 2019 Tim 'mithro' Ansell <me@mith.ro>
 # SPDX-License-Identifier: BSD-2-Clause
 
-import subprocess
 import unittest
 import os
 
@@ -13,6 +12,13 @@ from migen import *
 
 from litex.soc.integration.builder import *
 
+from litex_boards.tools.runner import Job, run_jobs, print_summary
+
+# Number of parallel jobs, defaults to the number of CPUs (LITEX_BOARDS_TEST_JOBS=1 to serialize).
+jobs = int(os.environ.get("LITEX_BOARDS_TEST_JOBS", os.cpu_count() or 1))
+
+# Test Targets -------------------------------------------------------------------------------------
+
 class TestTargets(unittest.TestCase):
     excluded_platforms = [
         "qmtech_daughterboard",              # Reason: Not a real platform.
@@ -41,6 +47,14 @@ class TestTargets(unittest.TestCase):
         "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
     ]
 
+    # Elaborate jobs in-process (forked workers) and check results.
+    def check_jobs(self, kind, jobs_list):
+        results = run_jobs(jobs_list, processes=jobs)
+        print_summary(kind.capitalize() + "s", results)
+        for r in results:
+            with self.subTest(**{kind: r.name}):
+                self.assertEqual(r.returncode, 0, f"{r.name} failed, see {r.log_filename}.")
+
     # Build simple design for all platforms.
     def test_platforms(self):
         # Collect platforms.
@@ -52,16 +66,18 @@ class TestTargets(unittest.TestCase):
                     platforms.append(file)
 
         # Test platforms with simple design.
-        for name in platforms:
-            with self.subTest(platform=name):
-                os.system("rm -rf build")
-                cmd = """\
-python3 -m litex_boards.targets.simple litex_boards.platforms.{} \
-    --build            \
-    --no-compile       \
-    --uart-name="stub" \
-""".format(name)
-                subprocess.check_call(cmd, shell=True)
+        jobs_list = []
+        for name in sorted(platforms):
+            jobs_list.append(Job(name,
+                module     = "litex_boards.targets.simple",
+                args       = [
+                    f"litex_boards.platforms.{name}",
+                    "--build",
+                    "--no-compile",
+                    "--uart-name=stub",
+                ],
+                output_dir = os.path.join("build", "platforms", name)))
+        self.check_jobs("platform", jobs_list)
 
     # Build default configuration for all targets.
     def test_targets(self):
@@ -74,14 +90,15 @@ python3 -m litex_boards.targets.simple litex_boards.platforms.{} \
                     targets.append(file)
 
         # Test targets.
-        for name in targets:
-            with self.subTest(target=name):
-                os.system("rm -rf build")
-                cmd = """\
-python3 -m litex_boards.targets.{} \
-    --cpu-type=vexriscv     \
-    --cpu-variant=minimal   \
-    --build                 \
-    --no-compile            \
-""".format(name)
-                subprocess.check_call(cmd, shell=True)
+        jobs_list = []
+        for name in sorted(targets):
+            jobs_list.append(Job(name,
+                module     = f"litex_boards.targets.{name}",
+                args       = [
+                    "--cpu-type=vexriscv",
+                    "--cpu-variant=minimal",
+                    "--build",
+                    "--no-compile",
+                ],
+                output_dir = os.path.join("build", "targets", name)))
+        self.check_jobs("target", jobs_list)
@@ -0,0 +1,145 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litedram.common import LiteDRAMNativePort
+
+from litex_boards.cores.video import video_framebuffer_config, VideoFrameBufferPager, VideoPageFlipFrameBuffer
+
+# DRAM Port Model ----------------------------------------------------------------------------------
+
+class DRAMPortModel:
+    """LiteDRAM Native read port model returning word addresses as data, with fixed read latency and
+    accepting commands at throughput words/cycle."""
+    def __init__(self, port, latency=4, throughput=2/3):
+        self.port       = port
+        self.latency    = latency
+        self.throughput = throughput
+        self.commands   = []
+
+    @passive
+    def generator(self):
+        port    = self.port
+        pending = []
+        cycle   = 0
+        while True:
+            yield port.cmd.ready.eq(int((cycle + 1)*self.throughput) > int(cycle*self.throughput))
+            yield port.rdata.valid.eq(0)
+            if pending and (pending[0][0] <= cycle):
+                yield port.rdata.valid.eq(1)
+                yield port.rdata.data.eq(pending.pop(0)[1])
+            yield
+            if (yield port.cmd.valid) and (yield port.cmd.ready):
+                address = (yield port.cmd.addr)
+                self.commands.append(address)
+                pending.append((cycle + self.latency, address))
+            cycle += 1
+
+# Test Video ---------------------------------------------------------------------------------------
+
+class TestVideo(unittest.TestCase):
+    def test_video_framebuffer_config(self):
+        # 800x600@60Hz (40MHz Pixel Clk): RGB888 (160MB/s) requires 200MB/s of DRAM bandwidth.
+        self.assertEqual(video_framebuffer_config("800x600@60Hz", 200e6), ("rgb888", 64*1024))
+        self.assertEqual(video_framebuffer_config("800x600@60Hz", 100e6), ("rgb565", 64*1024))
+        # FIFO sized to the lines when larger than 64KiB.
+        self.assertEqual(video_framebuffer_config("800x600@60Hz", 200e6, fifo_lines=32), ("rgb888", 128*1024))
+        with self.assertRaises(ValueError):
+            video_framebuffer_config("800x600@60Hz", 50e6)
+
+    def test_video_framebuffer_pager(self):
+        from litedram.frontend.dma import LiteDRAMDMAReader
+
+        length = 16 # Words.
+
+        class DUT(Module):
+            def __init__(self):
+                self.dram_port = LiteDRAMNativePort(mode="read", address_width=16, data_width=32)
+                self.dma_port  = LiteDRAMNativePort(mode="read", address_width=16, data_width=32)
+                self.submodules.dma = LiteDRAMDMAReader(self.dma_port, fifo_depth=8, fifo_buffered=True)
+                self.dma.add_csr(default_base=0x100, default_length=4*length, default_loop=1)
+                self.submodules.pager = VideoFrameBufferPager(self.dma, self.dma_port, self.dram_port, npages=3, fifo_depth=8)
+
+        dut    = DUT()
+        dram   = DRAMPortModel(dut.dram_port)
+        frames = []
+
+        def generator():
+            yield dut.dma._enable.storage.eq(1)
+            while len(frames) < 2:
+                yield
+            self.assertEqual((yield dut.pager._page_current.status), 0)
+            yield dut.pager._page.storage.eq(2)
+            while len(frames) < 4:
+                yield
+            self.assertEqual((yield dut.pager._page_current.status), 2)
+            yield dut.pager._page.storage.eq(3) # Invalid page, ignored.
+            while len(frames) < 6:
+                yield
+
+        @passive
+        def sink_generator():
+            frame = []
+            yield dut.dma.source.ready.eq(1)
+            while True:
+                yield
+                if (yield dut.dma.source.valid):
+                    frame.append((yield dut.dma.source.data))
+                    if (yield dut.dma.source.last):
+                        frames.append(frame)
+                        frame = []
+
+        run_simulation(dut, [generator(), sink_generator(), dram.generator()])
+
+        # Frames are complete and switched to the new page at the end of a frame.
+        page_words = lambda page: list(range(0x100//4 + page*length, 0x100//4 + (page + 1)*length))
+        self.assertEqual(frames[0], page_words(0))
+        self.assertEqual(frames[2], page_words(0)) # Flip requested during frame 2.
+        self.assertEqual(frames[3], page_words(2))
+        self.assertEqual(frames[5], page_words(2))
+
+    def video_framebuffer_underruns(self, throughput, hres=16, vres=4, frames=8):
+        port   = LiteDRAMNativePort(mode="read", address_width=16, data_width=32)
+        dut    = VideoPageFlipFrameBuffer(port, hres=hres, vres=vres, base=0x100, nbuffers=2, fifo_depth=64)
+        dram   = DRAMPortModel(port, throughput=throughput)
+        pixels = []
+
+        def generator():
+            yield dut.dma._enable.storage.eq(1)
+            yield dut.source.ready.eq(1)
+            # Frames of hres x vres pixels with 4 pixels of horizontal and 1 line of vertical blanking.
+            for n in range(frames):
+                for y in range(vres + 1):
+                    for x in range(hres + 4):
+                        yield dut.vtg_sink.valid.eq(1)
+                        yield dut.vtg_sink.de.eq((x < hres) & (y < vres))
+                        yield dut.vtg_sink.last.eq((x == hres + 3) & (y == vres))
+                        yield
+                        if (yield dut.source.valid) & (yield dut.source.de):
+                            pixels.append((yield dut.source.r))
+            yield dut.vtg_sink.valid.eq(0)
+            for i in range(4):
+                yield
+            return (yield dut._underruns.status)
+
+        underruns = []
+        def main_generator():
+            underruns.append((yield from generator()))
+
+        run_simulation(dut, [main_generator(), dram.generator()])
+        return underruns[0], pixels
+
+    def test_video_framebuffer_underruns(self):
+        # DRAM sustaining the pixel rate: No underrun, frames displayed from page 0.
+        underruns, pixels = self.video_framebuffer_underruns(throughput=1)
+        self.assertEqual(underruns, 0)
+        self.assertEqual(pixels[:2*16*4], 2*list(range(0x100//4, 0x100//4 + 16*4)))
+
+        # DRAM too slow: Underruns counted.
+        underruns, pixels = self.video_framebuffer_underruns(throughput=1/2)
+        self.assertGreater(underruns, 0)